@@ -38,6 +38,13 @@ def print_info(msg):
     print(f"{Color.OKCYAN}ℹ {msg}{Color.ENDC}")
 
 
+def make_budget(args):
+    """Execution budget from --step-limit, --timeout and --max-memory"""
+    from interpreter.hamba_budget import Budget
+    return Budget(fuel=args.step_limit, deadline=getattr(args, 'timeout', None),
+                  memory=getattr(args, 'max_memory', None))
+
+
 def cmd_run(args):
     """Run HambaLang source or bytecode"""
     filepath = args.file
@@ -70,7 +77,8 @@ def cmd_run(args):
             print_header("🔒 ObfuscatedVM - Protected Execution")
             bytecode = Bytecode.load(filepath)
             vm = ObfuscatedVM(bytecode, seed=args.seed, step_limit=args.step_limit,
-                            debug=args.debug, paranoia=paranoia, obfuscated=use_obfuscated)
+                            debug=args.debug, paranoia=paranoia, obfuscated=use_obfuscated,
+                            budget=make_budget(args))
             success = vm.run(delay=args.delay, ctf_mode=args.ctf, hell_mode=hell_mode)
             return 0 if success else 1
         else:
@@ -82,7 +90,8 @@ def cmd_run(args):
                 seed=args.seed,
                 ctf_mode=args.ctf,
                 step_limit=args.step_limit,
-                delay=args.delay
+                delay=args.delay,
+                budget=make_budget(args)
             )
             return 0 if success else 1
     
@@ -103,7 +112,8 @@ def cmd_run(args):
                 seed=args.seed,
                 ctf_mode=args.ctf,
                 step_limit=args.step_limit,
-                delay=args.delay
+                delay=args.delay,
+                budget=make_budget(args)
             )
             return 0 if success else 1
         else:
@@ -118,6 +128,10 @@ def cmd_run(args):
                 cmd_parts.append('--ctf')
             if args.delay > 0:
                 cmd_parts.extend(['--delay', str(args.delay)])
+            if getattr(args, 'timeout', None) is not None:
+                cmd_parts.extend(['--timeout', str(args.timeout)])
+            if getattr(args, 'max_memory', None) is not None:
+                cmd_parts.extend(['--max-memory', str(args.max_memory)])
             
             import subprocess
             result = subprocess.run(cmd_parts)
@@ -339,6 +353,8 @@ Examples:
     run_parser.add_argument('--seed', type=int, help='Random seed')
     run_parser.add_argument('--ctf', action='store_true', help='CTF mode')
     run_parser.add_argument('--step-limit', type=int, default=100000, help='Max execution steps')
+    run_parser.add_argument('--timeout', type=float, help='Wall-clock limit (seconds)')
+    run_parser.add_argument('--max-memory', type=int, help='Memory ceiling (bytes)')
     run_parser.add_argument('--delay', type=float, default=0.0, help='Delay between steps (seconds)')
     run_parser.add_argument('--strict', action='store_true', help='Enable strict academic verification')
     run_parser.add_argument('--audit', action='store_true', help='Enable runtime integrity audit')
@@ -367,6 +383,8 @@ Examples:
     ctf_parser.add_argument('--seed', type=int, help='Random seed')
     ctf_parser.add_argument('--vm', action='store_true', help='Use VM')
     ctf_parser.add_argument('--step-limit', type=int, default=100000, help='Max execution steps')
+    ctf_parser.add_argument('--timeout', type=float, help='Wall-clock limit (seconds)')
+    ctf_parser.add_argument('--max-memory', type=int, help='Memory ceiling (bytes)')
     ctf_parser.add_argument('--delay', type=float, default=0.0, help='Delay between steps')
 
     # obfuscate command
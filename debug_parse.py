@@ -1,17 +1,15 @@
 import sys
 sys.path.insert(0, 'interpreter')
 from hamba_v2 import HambaInterpreter
+from hamba_expr import parse_expression
 
-# Test extract function args
+# Inspect how a call expression is parsed and compiled
 interp = HambaInterpreter()
-line = 'tambahArray(arr, "C")'
-start_pos = line.index('(') + 1
-
-print(f"Line: {repr(line)}")
-print(f"Start pos: {start_pos}")
-print(f"Substring from start: {repr(line[start_pos:])}")
-
-args_str = interp._extract_function_args(line, start_pos)
-print(f"Extracted args: {repr(args_str)}")
+expr = 'tambahArray(arr, "C")'
 
+print(f"Expression: {repr(expr)}")
+print(f"Tree: {parse_expression(expr)}")
 
+interp.runtime.set_variable('arr', ["A", "B"])
+print(f"Result: {interp._eval_expression(expr)}")
+print(f"Cache: {interp.expression_cache.stats()}")
@@ -16,28 +16,49 @@ Features:
 import sys
 import time
 import random
-import re
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
+
+if __package__:
+    from .hamba_lexer import Token, tokenize, split_lines, find_name, span
+    from .hamba_output import OutputSink
+    from .hamba_budget import Budget
+    from .hamba_ast import RESERVED_GLOBALS
+else:
+    from hamba_lexer import Token, tokenize, split_lines, find_name, span
+    from hamba_output import OutputSink
+    from hamba_budget import Budget
+    from hamba_ast import RESERVED_GLOBALS
+
+
+# How `lapor` shows each reserved global, by slot
+SLOT_FORMATS = (lambda value: f"Rp {value:,.0f}", str, lambda value: f"{value}%")
+
+# Type an assignment converts each reserved global to, by slot (None: text)
+SLOT_TYPES = (float, None, int)
+
+# Resolved slot of each token in a line (None for anything but a reserved name)
+Slots = Tuple[Optional[int], ...]
 
 
 class HambaRuntime:
-    def __init__(self):
-        # Built-in state
-        self.anggaran = 1_000_000_000
-        self.status_proyek = "Direncanakan"
-        self.progress = 0
+    def __init__(self, sink: Optional[OutputSink] = None):
+        # Built-in state in reserved slots, laid out like the v2 global table;
+        # the interpreter resolves names to these slots once, at load time
+        self.globals: List[Any] = [1_000_000_000, "Direncanakan", 0]
+        self.reserved: Dict[str, int] = {name: i for i, name in enumerate(RESERVED_GLOBALS)}
         
-        # User variables
+        # User variables (globals) and per-call local frames
         self.variables = {}
+        self.frames: List[Dict[str, Any]] = []
         
         # Functions
         self.functions = {}
         
-        # Output
-        self.output = []
+        # Output (buffered; see OutputSink for capture limits and quiet mode)
+        self.sink = sink or OutputSink()
         self.terminated = False
         
         # Database connections
@@ -46,28 +67,67 @@ class HambaRuntime:
         # HTTP session
         self.http_session = None
     
+    @property
+    def anggaran(self):
+        return self.globals[0]
+    
+    @anggaran.setter
+    def anggaran(self, value):
+        self.globals[0] = value
+    
+    @property
+    def status_proyek(self):
+        return self.globals[1]
+    
+    @status_proyek.setter
+    def status_proyek(self, value):
+        self.globals[1] = value
+    
+    @property
+    def progress(self):
+        return self.globals[2]
+    
+    @progress.setter
+    def progress(self, value):
+        self.globals[2] = value
+    
+    @property
+    def output(self) -> List[str]:
+        return list(self.sink.lines)
+    
     def log(self, message):
-        self.output.append(str(message))
-        print(message)
+        self.sink.write(str(message))
+    
+    def flush(self):
+        self.sink.flush()
     
     def get_output(self):
-        return "\n".join(self.output)
+        return self.sink.getvalue()
+    
+    def global_slot(self, name: str) -> Optional[int]:
+        """Reserved slot of a built-in variable, or None"""
+        return self.reserved.get(name)
     
     def set_variable(self, name: str, value: Any):
-        """Set a variable in the runtime"""
-        self.variables[name] = value
+        """Set a variable by name (local while a function runs); for embedding code"""
+        slot = self.reserved.get(name)
+        if slot is not None:
+            self.globals[slot] = value
+        elif self.frames:
+            self.frames[-1][name] = value
+        else:
+            self.variables[name] = value
     
     def get_variable(self, name: str) -> Any:
-        """Get a variable from the runtime"""
-        # Check built-in variables first
-        if name == 'anggaran':
-            return self.anggaran
-        elif name == 'status_proyek':
-            return self.status_proyek
-        elif name == 'progress':
-            return self.progress
-        
-        # Check user variables
+        """Get a variable by name; for embedding code"""
+        # Built-in variables first, by their reserved slot
+        slot = self.reserved.get(name)
+        if slot is not None:
+            return self.globals[slot]
+        
+        # Check the current call frame, then globals
+        if self.frames and name in self.frames[-1]:
+            return self.frames[-1][name]
         if name in self.variables:
             return self.variables[name]
         
@@ -90,22 +150,18 @@ class HambaRuntime:
         if len(args) != len(func['params']):
             raise Exception(f"Function {name} membutuhkan {len(func['params'])} parameter, diberikan {len(args)}")
         
-        # Save current variables
-        saved_vars = self.variables.copy()
-        
-        # Set parameters as local variables
-        for param, arg in zip(func['params'], args):
-            self.variables[param] = arg
+        # Parameters live in a fresh local frame that chains to globals
+        self.frames.append(dict(zip(func['params'], args)))
         
         # Execute function body
         return_value = None
-        for line in func['body']:
-            if line.strip().startswith('kembalikan '):
-                return_value = self._eval_expression(line.strip()[11:])
-                break
-        
-        # Restore variables
-        self.variables = saved_vars
+        try:
+            for line in func['body']:
+                if line.strip().startswith('kembalikan '):
+                    return_value = self._eval_expression(line.strip()[11:])
+                    break
+        finally:
+            self.frames.pop()
         
         return return_value
     
@@ -115,86 +171,91 @@ class HambaRuntime:
 
 
 class HambaInterpreter:
-    def __init__(self, runtime=None):
+    def __init__(self, runtime=None, budget: Optional[Budget] = None):
         self.runtime = runtime or HambaRuntime()
+        # One unit of fuel per executed line
+        self.budget = budget or Budget()
         self.in_rapat_infinite = False
+        self.source = ''
     
     def execute(self, code):
         """Execute HambaLang code"""
-        lines = code.strip().split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            if self.runtime.terminated:
-                break
-            
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('//'):
-                continue
-            
-            try:
-                self._execute_line(line)
-            except Exception as e:
-                error_msg = f"Error Birokrasi pada baris {line_num}: {str(e)}"
-                self.runtime.log(error_msg)
-                raise Exception(error_msg)
+        self.source = code
+        try:
+            lines = [(tokens, self._resolve(tokens)) for tokens in split_lines(tokenize(code))]
+        except Exception as e:
+            error_msg = f"Error Birokrasi: {str(e)}"
+            self.runtime.log(error_msg)
+            self.runtime.flush()
+            raise Exception(error_msg)
+        
+        self.budget.start()
+        try:
+            for tokens, slots in lines:
+                if self.runtime.terminated:
+                    break
+                
+                self.budget.charge()
+                try:
+                    self._execute_line(tokens, slots)
+                except Exception as e:
+                    error_msg = f"Error Birokrasi pada baris {tokens[0].line}: {str(e)}"
+                    self.runtime.log(error_msg)
+                    raise Exception(error_msg)
+        finally:
+            self.budget.stop()
+            self.runtime.flush()
     
-    def _execute_line(self, line):
-        """Execute a single line of HambaLang code"""
-        
-        # lapor (print)
-        if line.startswith('lapor '):
-            content = line[6:].strip()
-            message = self._eval_expression(content)
-            self.runtime.log(message)
-            return
-        
-        # print
-        if line.startswith('print '):
-            content = line[6:].strip()
-            message = self._eval_expression(content)
+    def _resolve(self, tokens: List[Token]) -> Slots:
+        """Map every name token naming a built-in variable to its reserved slot"""
+        global_slot = self.runtime.global_slot
+        return tuple(global_slot(token.text) if token.kind == 'name' else None for token in tokens)
+    
+    def _execute_line(self, tokens: List[Token], slots: Slots):
+        """Execute a single logical line of HambaLang tokens"""
+        first = tokens[0]
+        words = [token.text for token in tokens]
+        
+        # lapor (print) / print
+        if first.text in ('lapor', 'print') and len(tokens) > 1:
+            message = self._eval_expression(span(self.source, tokens[1:]), slots[1] if len(tokens) == 2 else None)
             self.runtime.log(message)
             return
         
-        # Mangkrak(ms)
-        match = re.match(r'Mangkrak\((\d+)\)', line)
-        if match:
-            ms = int(match.group(1))
-            self._mangkrak(ms)
-            return
-        
-        # Korupsi(percent)
-        match = re.match(r'Korupsi\((\d+)\)', line)
-        if match:
-            percent = int(match.group(1))
-            self._korupsi(percent)
-            return
+        # Mangkrak(ms) / Korupsi(percent)
+        if len(tokens) == 4 and words[1] == '(' and words[3] == ')' \
+                and tokens[2].kind == 'number' and words[2].isdigit():
+            if first.text == 'Mangkrak':
+                self._mangkrak(int(words[2]))
+                return
+            if first.text == 'Korupsi':
+                self._korupsi(int(words[2]))
+                return
         
         # RapatInfinite()
-        if line == 'RapatInfinite()':
+        if words == ['RapatInfinite', '(', ')']:
             self._rapat_infinite()
             return
         
         # selesai()
-        if line == 'selesai()':
+        if words == ['selesai', '(', ')']:
             self._selesai()
             return
         
         # jika ... maka ...
-        if line.startswith('jika '):
-            self._execute_conditional(line)
+        if first.text == 'jika' and first.kind == 'name':
+            self._execute_conditional(tokens, slots)
             return
         
         # Variable assignment
-        if '=' in line and not any(op in line for op in ['>', '<', '==']):
-            self._assign_variable(line)
+        if first.kind == 'name' and len(tokens) > 2 and words[1] == '=':
+            self._assign_variable(first.text, slots[0], tokens[2:], slots[2:])
             return
         
-        raise Exception(f"Syntax tidak dikenali: {line}")
+        raise Exception(f"Syntax tidak dikenali: {span(self.source, tokens)}")
     
-    def _eval_expression(self, expr):
-        """Evaluate expression (string or variable)"""
+    def _eval_expression(self, expr, slot: Optional[int] = None):
+        """Evaluate expression (string, or the built-in variable in `slot`)"""
         expr = expr.strip()
         
         # String literal
@@ -203,14 +264,8 @@ class HambaInterpreter:
             return expr[1:-1]
         
         # Variable reference
-        if expr == 'anggaran':
-            return f"Rp {self.runtime.anggaran:,.0f}"
-        
-        if expr == 'status_proyek':
-            return self.runtime.status_proyek
-        
-        if expr == 'progress':
-            return f"{self.runtime.progress}%"
+        if slot is not None:
+            return SLOT_FORMATS[slot](self.runtime.globals[slot])
         
         # Try to evaluate as Python expression
         try:
@@ -222,6 +277,7 @@ class HambaInterpreter:
         """Mangkrak: Delay dengan kemungkinan event random"""
         seconds = ms / 1000
         self.runtime.log(f"⏳ Proyek mangkrak selama {seconds} detik...")
+        self.runtime.flush()
         
         time.sleep(min(seconds, 2))  # Cap at 2 seconds for demo
         
@@ -266,6 +322,7 @@ class HambaInterpreter:
         # Simulate a few iterations then stop to prevent actual infinite loop
         for i in range(5):
             self.runtime.log(f"📋 Rapat sesi ke-{i+1}: Belum ada keputusan...")
+            self.runtime.flush()
             time.sleep(0.5)
         
         self.runtime.log("⏸️ (RapatInfinite dihentikan paksa untuk demo)")
@@ -285,52 +342,46 @@ class HambaInterpreter:
         
         self.runtime.terminated = True
     
-    def _execute_conditional(self, line):
+    def _execute_conditional(self, tokens: List[Token], slots: Slots):
         """Execute jika ... maka ... statement"""
         # Parse: jika <condition> maka <action>
-        match = re.match(r'jika\s+(.+?)\s+maka\s+(.+)', line)
-        if not match:
+        maka = find_name(tokens, 'maka', 1)
+        if maka <= 1 or maka == len(tokens) - 1:
             raise Exception("Format: jika <kondisi> maka <aksi>")
         
-        condition = match.group(1).strip()
-        action = match.group(2).strip()
+        condition = tokens[1:maka]
+        action = tokens[maka + 1:]
         
         # Evaluate condition
-        # Replace 'anggaran' with actual value
-        condition_eval = condition.replace('anggaran', str(self.runtime.anggaran))
+        # Replace built-in variables with their current value
+        values = self.runtime.globals
+        condition_eval = ' '.join(
+            token.text if slot is None else repr(values[slot])
+            for token, slot in zip(condition, slots[1:maka])
+        )
         
         try:
             result = eval(condition_eval)
         except:
-            raise Exception(f"Kondisi tidak valid: {condition}")
+            raise Exception(f"Kondisi tidak valid: {span(self.source, condition)}")
         
         if result:
-            self._execute_line(action)
+            self._execute_line(action, slots[maka + 1:])
     
-    def _assign_variable(self, line):
+    def _assign_variable(self, var_name: str, slot: Optional[int], tokens: List[Token], slots: Slots):
         """Handle variable assignment"""
-        parts = line.split('=', 1)
-        if len(parts) != 2:
-            raise Exception(f"Assignment tidak valid: {line}")
-        
-        var_name = parts[0].strip()
-        value = parts[1].strip()
-        
         # Only support built-in variables
-        if var_name == 'anggaran':
-            try:
-                self.runtime.anggaran = float(eval(value))
-            except:
-                raise Exception(f"Nilai anggaran tidak valid: {value}")
-        elif var_name == 'status_proyek':
-            self.runtime.status_proyek = self._eval_expression(value)
-        elif var_name == 'progress':
-            try:
-                self.runtime.progress = int(eval(value))
-            except:
-                raise Exception(f"Nilai progress tidak valid: {value}")
-        else:
+        if slot is None:
             raise Exception(f"Variable tidak dikenal: {var_name}")
+        value = span(self.source, tokens)
+        convert = SLOT_TYPES[slot]
+        if convert is None:
+            self.runtime.globals[slot] = self._eval_expression(value, slots[0] if len(tokens) == 1 else None)
+            return
+        try:
+            self.runtime.globals[slot] = convert(eval(value))
+        except:
+            raise Exception(f"Nilai {var_name} tidak valid: {value}")
 
 
 def run_file(filepath):
@@ -6,11 +6,25 @@ controlled loops, satirical exceptions, deterministic runtime (CTF mode),
 and execution step limit.
 """
 import sys
-import re
 import math
 import random
-from dataclasses import dataclass
-from typing import Any, List, Dict, Optional, Callable
+from dataclasses import dataclass, field
+from typing import Any, List, Dict, Optional, Callable, Union
+
+if __package__:
+    from . import hamba_lexer as lexer
+    from .hamba_expr import (
+        Expr, Const, Var, ListExpr, DictExpr, IndexExpr, CallExpr, UnaryExpr, BinaryExpr,
+        Template, parse_expression, parse_expression_tokens, fold_constants,
+    )
+    from .hamba_budget import Budget, FuelExhausted
+else:
+    import hamba_lexer as lexer
+    from hamba_expr import (
+        Expr, Const, Var, ListExpr, DictExpr, IndexExpr, CallExpr, UnaryExpr, BinaryExpr,
+        Template, parse_expression, parse_expression_tokens, fold_constants,
+    )
+    from hamba_budget import Budget, FuelExhausted
 
 # =====================
 # AST Node Definitions
@@ -22,6 +36,8 @@ class Node:
 @dataclass
 class Program(Node):
     body: List[Node]
+    # Expression trees parsed from the token stream, keyed by source text
+    expressions: Dict[str, Expr] = field(default_factory=dict)
 
 @dataclass
 class Block(Node):
@@ -85,100 +101,86 @@ class DanaHabisError(HambaError):
 class AuditKPKError(HambaError):
     pass
 
-class StepLimitError(HambaError):
+# Running out of steps is a budget error now; coba/jikaGagal cannot catch it
+StepLimitError = FuelExhausted
+
+class StackOverflowError(HambaError):
     pass
 
 
+# Errors a coba/jikaGagal block catches
+CATCHABLE_ERRORS = (HambaError, ProyekMangkrakError, DanaHabisError, AuditKPKError)
+
+
 # =====================
 # Expression Evaluator
 # =====================
 class ExpressionEvaluator:
     def __init__(self, runtime: 'Runtime'):
         self.runtime = runtime
+        self.trees: Dict[str, Expr] = {}
 
     def eval(self, expr: str) -> Any:
         expr = expr.strip()
-        # String literal
-        if (expr.startswith('"') and expr.endswith('"')) or (expr.startswith("'") and expr.endswith("'")):
-            return expr[1:-1]
-        # Boolean
-        if expr == 'benar':
-            return True
-        if expr == 'salah':
-            return False
-        # Null
-        if expr == 'kosong':
-            return None
-        # Number
-        try:
-            if '.' in expr:
-                return float(expr)
-            if expr.isdigit() or (expr.startswith('-') and expr[1:].isdigit()):
-                return int(expr)
-        except ValueError:
-            pass
-        # Function calls for built-ins inside expressions
-        func_call = re.match(r'^(\w+)\((.*)\)$', expr)
-        if func_call:
-            name = func_call.group(1)
-            args_str = func_call.group(2)
-            args = self._parse_args(args_str)
-            if name == 'teks':
+        tree = self.trees.get(expr)
+        if tree is None:
+            try:
+                tree = parse_expression(expr)
+            except lexer.HambaError as e:
+                raise HambaError(f"Tidak dapat mengevaluasi: {expr}") from e
+            tree = self.trees[expr] = fold_constants(tree, self._eval)
+        return self._eval(tree)
+
+    def load(self, trees: Dict[str, Expr]):
+        """Adopt a program's parsed expressions, folding literal-only subtrees once"""
+        for source, tree in trees.items():
+            self.trees[source] = fold_constants(tree, self._eval)
+
+    def _eval(self, node: Expr) -> Any:
+        if isinstance(node, Const):
+            return node.value
+        if isinstance(node, Template):
+            return node.copy()
+        if isinstance(node, Var):
+            return self.runtime.get(node.name)
+        if isinstance(node, BinaryExpr):
+            op = node.op
+            if op == 'dan':
+                return bool(self._eval(node.left)) and bool(self._eval(node.right))
+            if op == 'atau':
+                return bool(self._eval(node.left)) or bool(self._eval(node.right))
+            l = self._eval(node.left)
+            r = self._eval(node.right)
+            if op in ('<=', '>=', '==', '!=', '<', '>'):
+                return self._cmp(l, r, op)
+            return self._arith(l, r, op)
+        if isinstance(node, UnaryExpr):
+            value = self.runtime.to_number(self._eval(node.operand))
+            return -value if node.op == '-' else value
+        if isinstance(node, CallExpr):
+            # Built-ins inside expressions
+            args = [self._eval(arg) for arg in node.args]
+            if node.name == 'teks':
                 return self.runtime.to_string(args[0]) if args else ''
-            if name == 'angka':
+            if node.name == 'angka':
                 return self.runtime.to_number(args[0]) if args else 0
-            if name == 'panjang':
+            if node.name == 'panjang':
                 return len(args[0]) if args else 0
-        # Arithmetic and logical (simple)
-        for op in ['<=', '>=', '==', '!=', '<', '>']:
-            if op in expr:
-                left, right = expr.split(op, 1)
-                l = self.eval(left)
-                r = self.eval(right)
-                return self._cmp(l, r, op)
-        for op in ['+', '-', '*', '/', '%']:
-            # avoid negative number split
-            if op == '-' and expr.startswith('-'):
-                continue
-            if op in expr:
-                left, right = expr.split(op, 1)
-                return self._arith(self.eval(left), self.eval(right), op)
-        # Variable
-        if re.match(r'^[a-zA-Z_]\w*$', expr):
-            return self.runtime.get(expr)
-        raise HambaError(f"Tidak dapat mengevaluasi: {expr}")
-
-    def _parse_args(self, args_str: str) -> List[Any]:
-        if not args_str.strip():
-            return []
-        parts = []
-        current = ''
-        depth = 0
-        in_str = False
-        quote = ''
-        for ch in args_str:
-            if ch in ['"', "'"] and not in_str:
-                in_str = True
-                quote = ch
-                current += ch
-                continue
-            if in_str and ch == quote:
-                in_str = False
-                current += ch
-                continue
-            if not in_str:
-                if ch in ['(', '[', '{']:
-                    depth += 1
-                elif ch in [')', ']', '}']:
-                    depth -= 1
-                elif ch == ',' and depth == 0:
-                    parts.append(current.strip())
-                    current = ''
-                    continue
-            current += ch
-        if current.strip():
-            parts.append(current.strip())
-        return [self.eval(p) for p in parts]
+            raise HambaError(f"Fungsi '{node.name}' tidak dikenal")
+        if isinstance(node, ListExpr):
+            return [self._eval(item) for item in node.items]
+        if isinstance(node, DictExpr):
+            return {self._eval(k): self._eval(v) for k, v in node.pairs}
+        if isinstance(node, IndexExpr):
+            target = self._eval(node.target)
+            key = self._eval(node.key)
+            if isinstance(target, (list, str)):
+                key = int(self.runtime.to_number(key))
+            try:
+                return target[key]
+            except (IndexError, KeyError, TypeError):
+                raise HambaError(f"Index tidak valid: {self.runtime.to_string(key)}")
+        raise HambaError(f"Ekspresi tidak dikenali: {node}")
 
     def _cmp(self, l, r, op):
         if op == '==':
@@ -217,7 +219,8 @@ class ExpressionEvaluator:
 # Runtime
 # =====================
 class Runtime:
-    def __init__(self, seed: Optional[int] = None, step_limit: int = 2000, ctf_mode: bool = False, delay: float = 0.0, debug: bool = False):
+    def __init__(self, seed: Optional[int] = None, step_limit: int = 2000, ctf_mode: bool = False, delay: float = 0.0, debug: bool = False,
+                 max_depth: int = 1000, budget: Optional[Budget] = None):
         self.scopes: List[Dict[str, Any]] = [
             {
                 'anggaran': 1_000_000_000,
@@ -225,32 +228,50 @@ class Runtime:
                 'tahun': 2011,
             }
         ]
+        # name -> innermost scope defining it, so reads never walk the chain
+        self._visible: Dict[str, Dict[str, Any]] = {name: self.scopes[0] for name in self.scopes[0]}
+        # per pushed scope: the bindings it shadowed, restored on pop
+        self._shadowed: List[Dict[str, Optional[Dict[str, Any]]]] = []
         self.procedures: Dict[str, ProcDef] = {}
         self.evaluator = ExpressionEvaluator(self)
         self.random = random.Random(seed if seed is not None else 1337)
         self.step_limit = step_limit
         self.steps = 0
+        # Each step costs one unit of fuel; an explicit budget replaces step_limit
+        self.budget = budget or Budget(fuel=step_limit)
         self.ctf_mode = ctf_mode
         self._korupsi_total = 0
         self.delay = delay
         self.debug = debug
+        self.max_depth = max_depth
 
     # Scope helpers
     def push_scope(self):
         self.scopes.append({})
+        self._shadowed.append({})
 
     def pop_scope(self):
         if len(self.scopes) > 1:
             self.scopes.pop()
+            for name, previous in self._shadowed.pop().items():
+                if previous is None:
+                    del self._visible[name]
+                else:
+                    self._visible[name] = previous
 
     def set(self, name: str, value: Any):
-        self.scopes[-1][name] = value
+        scope = self.scopes[-1]
+        if name not in scope:
+            if len(self.scopes) > 1:
+                self._shadowed[-1][name] = self._visible.get(name)
+            self._visible[name] = scope
+        scope[name] = value
 
     def get(self, name: str) -> Any:
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return scope[name]
-        raise HambaError(f"Variable '{name}' tidak ditemukan")
+        scope = self._visible.get(name)
+        if scope is None:
+            raise HambaError(f"Variable '{name}' tidak ditemukan")
+        return scope[name]
 
     # Converters
     def to_number(self, v: Any) -> float:
@@ -281,8 +302,7 @@ class Runtime:
         if self.delay > 0:
             import time
             time.sleep(self.delay)
-        if self.steps > self.step_limit:
-            raise StepLimitError("Batas langkah terlampaui")
+        self.budget.charge()
 
     # Progress helper
     def update_progress(self, delta: float = 1.0):
@@ -304,128 +324,192 @@ class Runtime:
 
 
 # =====================
-# Parser (line-based)
+# Parser (token-based)
 # =====================
 class Parser:
-    def __init__(self, lines: List[str]):
-        self.lines = lines
+    def __init__(self, source: Union[str, List[str]]):
+        if not isinstance(source, str):
+            source = ''.join(line if line.endswith('\n') else line + '\n' for line in source)
+        self.source = source
+        try:
+            self.lines = lexer.split_lines(lexer.tokenize(source))
+        except lexer.HambaError as e:
+            raise HambaError(str(e)) from e
         self.pos = 0
-        self.total = len(lines)
+        self.total = len(self.lines)
+        self.expressions: Dict[str, Expr] = {}
 
     def parse(self) -> Program:
         body = []
         while self.pos < self.total:
-            node = self._parse_statement()
-            if node:
-                body.append(node)
-        return Program(line=1, body=body)
-
-    def _parse_statement(self) -> Optional[Node]:
-        if self.pos >= self.total:
-            return None
-        raw = self.lines[self.pos]
-        line_no = self.pos + 1
-        line = raw.strip()
+            body.append(self._parse_statement())
+        return Program(line=1, body=body, expressions=self.expressions)
+
+    def _expr(self, tokens: List[lexer.Token]) -> str:
+        """Source text of an expression slice, pre-parsing its tree when valid"""
+        text = lexer.span(self.source, tokens).strip()
+        if text not in self.expressions:
+            try:
+                self.expressions[text] = parse_expression_tokens(tokens, text)
+            except lexer.HambaError:
+                pass  # reported by the evaluator if the statement ever runs
+        return text
+
+    def _parse_statement(self) -> Node:
+        tokens = self.lines[self.pos]
+        line_no = tokens[0].line
         self.pos += 1
-        
-        # Remove inline comments
-        if '//' in line:
-            line = line.split('//')[0].strip()
-        
-        if not line or line.startswith('//'):
-            return None
+        words = [token.text for token in tokens]
+        keyword = words[0]
+        call = len(words) > 2 and words[1] == '(' and lexer.matching_close(tokens, 1) == len(tokens) - 1
 
         # Scoped block
-        if line == 'mulai':
+        if words == ['mulai']:
             block_body = self._parse_block_until('akhir')
             return Block(line=line_no, body=block_body)
 
         # try-catch
-        if line == 'coba':
+        if words == ['coba']:
             try_body = self._parse_block_until('jikaGagal')
             catch_body = self._parse_block_until('akhirCoba')
             return TryCatch(line=line_no, try_body=try_body, catch_body=catch_body)
 
         # Rapat loop
-        rapat_match = re.match(r'^Rapat\((.+)\)$', line)
-        if rapat_match:
-            count_expr = rapat_match.group(1)
+        if keyword == 'Rapat' and call and len(words) > 3:
+            count_expr = self._expr(tokens[2:-1])
             body = self._parse_block_until('selesaiRapat')
             return RapatLoop(line=line_no, count_expr=count_expr, body=body)
 
         # Procedure definition
-        proc_match = re.match(r'^prosedur\s+(\w+)\s*\(\)$', line)
-        if proc_match:
-            name = proc_match.group(1)
+        if keyword == 'prosedur' and len(words) == 4 and tokens[1].kind == 'name' and words[2:] == ['(', ')']:
+            name = words[1]
             body = self._parse_block_until('akhirProsedur')
             return ProcDef(line=line_no, name=name, body=body)
 
         # Procedure call
-        call_match = re.match(r'^(\w+)\(\)$', line)
-        if call_match:
-            return ProcCall(line=line_no, name=call_match.group(1))
+        if len(words) == 3 and tokens[0].kind == 'name' and words[1:] == ['(', ')']:
+            return ProcCall(line=line_no, name=keyword)
 
         # Set assignment
-        set_match = re.match(r'^set\s+(\w+)\s*=\s*(.+)$', line)
-        if set_match:
-            return SetStmt(line=line_no, name=set_match.group(1), expr=set_match.group(2))
+        if keyword == 'set' and len(words) > 3 and tokens[1].kind == 'name' and words[2] == '=':
+            return SetStmt(line=line_no, name=words[1], expr=self._expr(tokens[3:]))
 
         # Print / lapor
-        lapor_match = re.match(r'^lapor\s+(.+)$', line)
-        if lapor_match:
-            return PrintStmt(line=line_no, expr=lapor_match.group(1))
+        if keyword == 'lapor' and len(words) > 1:
+            return PrintStmt(line=line_no, expr=self._expr(tokens[1:]))
 
         # Korupsi
-        kor_match = re.match(r'^Korupsi\((.+)\)$', line)
-        if kor_match:
-            return KorupsiStmt(line=line_no, percent_expr=kor_match.group(1))
+        if keyword == 'Korupsi' and call and len(words) > 3:
+            return KorupsiStmt(line=line_no, percent_expr=self._expr(tokens[2:-1]))
 
         # Mangkrak
-        mang_match = re.match(r'^Mangkrak\((.+)\)$', line)
-        if mang_match:
-            return MangkrakStmt(line=line_no, info=mang_match.group(1))
-        
+        if keyword == 'Mangkrak' and call and len(words) > 3:
+            return MangkrakStmt(line=line_no, info=self._expr(tokens[2:-1]))
+
         # jika conditional
-        if_match = re.match(r'^jika\s+(.+)$', line)
-        if if_match:
-            condition = if_match.group(1)
+        if keyword == 'jika' and len(words) > 1:
+            condition = self._expr(tokens[1:])
             if_body = self._parse_block_until('akhir')
             return IfStmt(line=line_no, condition=condition, if_body=if_body)
 
-        raise HambaError(f"Syntax tidak dikenali (baris {line_no}): {line}")
+        line = lexer.span(self.source, tokens)
+        raise HambaError(f"Syntax tidak dikenali (baris {line_no}, kolom {tokens[0].col}): {line}")
 
     def _parse_block_until(self, terminator: str) -> List[Node]:
         body = []
         while self.pos < self.total:
-            peek = self.lines[self.pos].strip()
-            if peek == terminator:
+            peek = self.lines[self.pos]
+            if len(peek) == 1 and peek[0].text == terminator:
                 self.pos += 1
                 break
-            stmt = self._parse_statement()
-            if stmt:
-                body.append(stmt)
+            body.append(self._parse_statement())
         return body
 
 
 # =====================
 # Evaluator
 # =====================
+class Activation:
+    """One entry of the evaluator's continuation stack: a statement list and where it is.
+
+    kind is 'seq' (plain statements), 'scope' (pops a scope on exit), 'proc'
+    (a procedure call; pops a scope and counts towards the depth limit),
+    'rapat' (repeats `extra` more times) or 'try' (catch body in `extra`).
+    """
+    __slots__ = ('body', 'index', 'kind', 'extra')
+
+    def __init__(self, body: List[Node], kind: str = 'seq', extra: Any = None):
+        self.body = body
+        self.index = 0
+        self.kind = kind
+        self.extra = extra
+
+
 class Evaluator:
     def __init__(self, runtime: Runtime):
         self.rt = runtime
         self.eval_expr = runtime.evaluator
+        self.stack: List[Activation] = []
+        self.depth = 0
 
     def execute(self, node: Node):
+        """Run a node to completion without recursing on the Python stack"""
+        base = len(self.stack)
+        if not base:
+            self.rt.budget.start()
+        try:
+            self._run_node(node)
+            while len(self.stack) > base:
+                frame = self.stack[-1]
+                if frame.index >= len(frame.body):
+                    if frame.kind == 'rapat' and frame.extra > 0:
+                        self.rt.budget.charge()
+                        frame.extra -= 1
+                        frame.index = 0
+                    else:
+                        self._leave(self.stack.pop())
+                    continue
+                stmt = frame.body[frame.index]
+                frame.index += 1
+                try:
+                    self._run_node(stmt)
+                except CATCHABLE_ERRORS as e:
+                    if not self._unwind_to_catch(base):
+                        raise
+                    print(f"⚠️  Exception: {e}")
+                    catch = self.stack.pop().extra
+                    self.stack.append(Activation(catch))
+        finally:
+            while len(self.stack) > base:
+                self._leave(self.stack.pop())
+            if not base:
+                self.rt.budget.stop()
+
+    def _leave(self, frame: Activation):
+        if frame.kind == 'scope' or frame.kind == 'proc':
+            self.rt.pop_scope()
+            if frame.kind == 'proc':
+                self.depth -= 1
+
+    def _unwind_to_catch(self, base: int) -> bool:
+        """Pop activations down to the innermost try; False if there is none"""
+        for i in range(len(self.stack) - 1, base - 1, -1):
+            if self.stack[i].kind == 'try':
+                while len(self.stack) > i + 1:
+                    self._leave(self.stack.pop())
+                return True
+        return False
+
+    def _run_node(self, node: Node):
+        """Execute a simple statement, or push an activation for a compound one"""
         if self.rt.debug:
             print(f"[TRACE L{node.line}] {node.__class__.__name__}")
         if isinstance(node, Program):
-            for stmt in node.body:
-                self.execute(stmt)
+            self.eval_expr.load(node.expressions)
+            self.stack.append(Activation(node.body))
         elif isinstance(node, Block):
             self.rt.push_scope()
-            for stmt in node.body:
-                self.execute(stmt)
-            self.rt.pop_scope()
+            self.stack.append(Activation(node.body, 'scope'))
         elif isinstance(node, SetStmt):
             self.rt.tick()
             value = self.eval_expr.eval(node.expr)
@@ -447,35 +531,27 @@ class Evaluator:
         elif isinstance(node, RapatLoop):
             self.rt.tick()
             count = int(self.rt.to_number(self.eval_expr.eval(node.count_expr)))
-            for _ in range(count):
-                for stmt in node.body:
-                    self.execute(stmt)
+            if count > 0 and node.body:
+                self.stack.append(Activation(node.body, 'rapat', count - 1))
         elif isinstance(node, ProcDef):
             self.rt.procedures[node.name] = node
         elif isinstance(node, ProcCall):
             if node.name not in self.rt.procedures:
                 raise HambaError(f"Prosedur '{node.name}' tidak ditemukan")
+            if self.depth >= self.rt.max_depth:
+                raise StackOverflowError(f"Stack overflow: kedalaman prosedur melebihi {self.rt.max_depth}")
+            self.depth += 1
             self.rt.push_scope()
-            for stmt in self.rt.procedures[node.name].body:
-                self.execute(stmt)
-            self.rt.pop_scope()
+            self.stack.append(Activation(self.rt.procedures[node.name].body, 'proc'))
         elif isinstance(node, TryCatch):
-            try:
-                for stmt in node.try_body:
-                    self.execute(stmt)
-            except (HambaError, ProyekMangkrakError, DanaHabisError, AuditKPKError) as e:
-                print(f"⚠️  Exception: {e}")
-                for stmt in node.catch_body:
-                    self.execute(stmt)
+            self.stack.append(Activation(node.try_body, 'try', node.catch_body))
         elif isinstance(node, IfStmt):
             self.rt.tick()
             condition = self.eval_expr.eval(node.condition)
             if condition:
-                for stmt in node.if_body:
-                    self.execute(stmt)
+                self.stack.append(Activation(node.if_body))
             elif node.else_body:
-                for stmt in node.else_body:
-                    self.execute(stmt)
+                self.stack.append(Activation(node.else_body))
         else:
             raise HambaError(f"Node tidak dikenali: {node}")
 
@@ -483,12 +559,15 @@ class Evaluator:
 # =====================
 # Runner
 # =====================
-def run_file(filepath: str, seed: Optional[int] = None, step_limit: int = 2000, ctf: bool = False, delay: float = 0.0, debug: bool = False):
+def run_file(filepath: str, seed: Optional[int] = None, step_limit: int = 2000, ctf: bool = False, delay: float = 0.0, debug: bool = False,
+             max_depth: int = 1000, timeout: Optional[float] = None, max_memory: Optional[int] = None):
     with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    parser = Parser(lines)
+        source = f.read()
+    parser = Parser(source)
     program = parser.parse()
-    rt = Runtime(seed=seed, step_limit=step_limit, ctf_mode=ctf, delay=delay, debug=debug)
+    budget = Budget(fuel=step_limit, deadline=timeout, memory=max_memory)
+    rt = Runtime(seed=seed, step_limit=step_limit, ctf_mode=ctf, delay=delay, debug=debug, max_depth=max_depth,
+                 budget=budget)
     evaluator = Evaluator(rt)
     evaluator.execute(program)
 
@@ -512,9 +591,13 @@ def main():
     parser.add_argument('--ctf', action='store_true', help='Enable CTF mode')
     parser.add_argument('--debug', action='store_true', help='Trace execution steps')
     parser.add_argument('--delay', type=float, default=0.0, help='Delay per step (seconds)')
+    parser.add_argument('--max-depth', type=int, default=1000, help='Maximum procedure call depth')
+    parser.add_argument('--timeout', type=float, default=None, help='Wall-clock limit (seconds)')
+    parser.add_argument('--max-memory', type=int, default=None, help='Memory ceiling (bytes)')
     args = parser.parse_args()
 
-    run_file(args.file, seed=args.seed, step_limit=args.step_limit, ctf=args.ctf, delay=args.delay, debug=args.debug)
+    run_file(args.file, seed=args.seed, step_limit=args.step_limit, ctf=args.ctf, delay=args.delay, debug=args.debug,
+             max_depth=args.max_depth, timeout=args.timeout, max_memory=args.max_memory)
 
 
 if __name__ == '__main__':
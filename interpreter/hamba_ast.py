@@ -0,0 +1,806 @@
+"""
+HambaLang v2 - AST & Parser
+Parses the hamba_v2 dialect into a typed AST once at load time, so the
+interpreter walks nodes instead of re-reading source lines on every pass.
+Statements are recognised from the shared lexer's token stream.
+"""
+import itertools
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+if __package__:
+    from .hamba_lexer import (
+        HambaError, Token, tokenize, split_lines, split_top_level,
+        matching_close, find_name, span,
+    )
+    from .hamba_expr import (
+        Expr, Var, ListExpr, DictExpr, IndexExpr, CallExpr, UnaryExpr, BinaryExpr,
+        parse_expression_tokens,
+    )
+else:
+    from hamba_lexer import (
+        HambaError, Token, tokenize, split_lines, split_top_level,
+        matching_close, find_name, span,
+    )
+    from hamba_expr import (
+        Expr, Var, ListExpr, DictExpr, IndexExpr, CallExpr, UnaryExpr, BinaryExpr,
+        parse_expression_tokens,
+    )
+
+
+# =====================
+# AST Node Definitions
+# =====================
+# A resolved variable reference: (0, global slot) or (1, slot in the call frame)
+Ref = Tuple[int, int]
+
+
+@dataclass
+class Node:
+    line: int
+
+
+@dataclass
+class Program(Node):
+    body: List[Node]
+    # Expression trees parsed from the token stream, keyed by source text
+    expressions: Dict[str, Expr] = field(default_factory=dict)
+
+
+@dataclass
+class FunctionDef(Node):
+    name: str
+    params: List[str]
+    body: List[Node]
+    # Filled in by the resolver: frame layout and a unique scope id
+    slots: Dict[str, int] = field(default_factory=dict)
+    scope: int = 0
+    # Declared `@murni`: memoize without running the purity analysis
+    murni: bool = False
+
+
+@dataclass
+class GlobalStmt(Node):
+    names: List[str]
+
+
+@dataclass
+class IfStmt(Node):
+    branches: List[Tuple[str, List[Node]]]
+    else_body: Optional[List[Node]] = None
+
+
+@dataclass
+class WhileStmt(Node):
+    condition: str
+    body: List[Node]
+
+
+@dataclass
+class ForRangeStmt(Node):
+    var: str
+    start: str
+    end: str
+    body: List[Node]
+    ref: Optional[Ref] = None
+
+
+@dataclass
+class ForEachStmt(Node):
+    var: str
+    iterable: str
+    body: List[Node]
+    ref: Optional[Ref] = None
+
+
+@dataclass
+class ReturnStmt(Node):
+    expr: Optional[str] = None
+
+
+@dataclass
+class BreakStmt(Node):
+    pass
+
+
+@dataclass
+class ContinueStmt(Node):
+    pass
+
+
+@dataclass
+class PrintStmt(Node):
+    expr: str
+
+
+@dataclass
+class AssignStmt(Node):
+    name: str
+    expr: str
+    ref: Optional[Ref] = None
+
+
+@dataclass
+class IndexAssignStmt(Node):
+    name: str
+    index: str
+    expr: str
+    ref: Optional[Ref] = None
+
+
+@dataclass
+class ExprStmt(Node):
+    expr: str
+
+
+@dataclass
+class MangkrakStmt(Node):
+    expr: str
+
+
+@dataclass
+class KorupsiStmt(Node):
+    expr: str
+
+
+@dataclass
+class RapatInfiniteStmt(Node):
+    pass
+
+
+@dataclass
+class SelesaiStmt(Node):
+    pass
+
+
+@dataclass
+class FileWriteStmt(Node):
+    path: str
+    content: str
+
+
+@dataclass
+class FileReadStmt(Node):
+    target: Optional[str]
+    path: str
+    ref: Optional[Ref] = None
+
+
+@dataclass
+class DbConnectStmt(Node):
+    name: str
+    db_type: str
+    conn_str: str
+    # SQLite tuning profile name or PRAGMA object
+    profile: Optional[str] = None
+
+
+@dataclass
+class DbQueryStmt(Node):
+    target: Optional[str]
+    db_name: str
+    query: str
+    ref: Optional[Ref] = None
+    # Parameter array/object bound to the query's placeholders
+    params: Optional[str] = None
+
+
+@dataclass
+class DbStreamStmt(Node):
+    target: Optional[str]
+    db_name: str
+    query: str
+    ref: Optional[Ref] = None
+    params: Optional[str] = None
+    # Rows fetched per batch; DEFAULT_FETCH_SIZE when omitted
+    fetch_size: Optional[str] = None
+
+
+@dataclass
+class DbBatchStmt(Node):
+    target: Optional[str]
+    db_name: str
+    query: str
+    rows: str
+    ref: Optional[Ref] = None
+
+
+@dataclass
+class TransactionStmt(Node):
+    db_name: str
+    body: List[Node]
+
+
+@dataclass
+class DbTransactionStmt(Node):
+    name: str
+    action: str  # 'mulai', 'commit' or 'rollback'
+
+
+@dataclass
+class DbCloseStmt(Node):
+    name: str
+
+
+@dataclass
+class HttpGetStmt(Node):
+    target: Optional[str]
+    url: str
+    ref: Optional[Ref] = None
+
+
+@dataclass
+class HttpPostStmt(Node):
+    target: Optional[str]
+    url: str
+    data: str
+    ref: Optional[Ref] = None
+
+
+# =====================
+# Parser
+# =====================
+# Builds a statement node from (line, assignment target or None, argument sources)
+CallBuilder = Callable[[int, Optional[str], List[str]], Node]
+
+# Exact argument count, or (minimum, maximum) for optional trailing arguments
+Arity = Union[int, Tuple[int, int]]
+
+# Statements written in call form: name -> (arity, node builder)
+CALL_STATEMENTS: Dict[str, Tuple[Arity, CallBuilder]] = {
+    'Mangkrak': (1, lambda line, target, args: MangkrakStmt(line=line, expr=args[0])),
+    'Korupsi': (1, lambda line, target, args: KorupsiStmt(line=line, expr=args[0])),
+    'tulisFile': (2, lambda line, target, args: FileWriteStmt(line=line, path=args[0], content=args[1])),
+    'bacaFile': (1, lambda line, target, args: FileReadStmt(line=line, target=target, path=args[0])),
+    'sambungDB': ((3, 4), lambda line, target, args: DbConnectStmt(
+        line=line, name=args[0], db_type=args[1], conn_str=args[2],
+        profile=args[3] if len(args) > 3 else None)),
+    'queryDB': ((2, 3), lambda line, target, args: DbQueryStmt(
+        line=line, target=target, db_name=args[0], query=args[1],
+        params=args[2] if len(args) > 2 else None)),
+    'queryStream': ((2, 4), lambda line, target, args: DbStreamStmt(
+        line=line, target=target, db_name=args[0], query=args[1],
+        params=args[2] if len(args) > 2 else None, fetch_size=args[3] if len(args) > 3 else None)),
+    'queryBatch': (3, lambda line, target, args: DbBatchStmt(
+        line=line, target=target, db_name=args[0], query=args[1], rows=args[2])),
+    'mulaiTransaksi': (1, lambda line, target, args: DbTransactionStmt(line=line, name=args[0], action='mulai')),
+    'commitDB': (1, lambda line, target, args: DbTransactionStmt(line=line, name=args[0], action='commit')),
+    'rollbackDB': (1, lambda line, target, args: DbTransactionStmt(line=line, name=args[0], action='rollback')),
+    'tutupDB': (1, lambda line, target, args: DbCloseStmt(line=line, name=args[0])),
+    'httpGet': (1, lambda line, target, args: HttpGetStmt(line=line, target=target, url=args[0])),
+    'httpPost': (2, lambda line, target, args: HttpPostStmt(
+        line=line, target=target, url=args[0], data=args[1])),
+}
+
+# Call statements that may also be written as `x = nama(...)`
+ASSIGNABLE_CALLS = {'bacaFile', 'queryDB', 'queryStream', 'queryBatch', 'httpGet', 'httpPost'}
+
+
+def register_call_statement(name: str, argc: Arity, builder: CallBuilder, assignable: bool = False):
+    """Parse `name(...)` (and `x = name(...)` if assignable) as a statement node"""
+    CALL_STATEMENTS[name] = (argc, builder)
+    if assignable:
+        ASSIGNABLE_CALLS.add(name)
+    else:
+        ASSIGNABLE_CALLS.discard(name)
+
+BLOCK_OPENERS = ('fungsi', 'jika', 'selama', 'untuk', 'transaksi')
+
+# `@nama` lines that may precede a `fungsi` definition
+FUNCTION_ANNOTATIONS = ('murni',)
+
+
+def _is_op(tokens: List[Token], i: int, text: str) -> bool:
+    return i < len(tokens) and tokens[i].kind == 'op' and tokens[i].text == text
+
+
+def _words(tokens: List[Token]) -> List[str]:
+    return [token.text for token in tokens]
+
+
+def _block_role(tokens: List[Token]) -> Optional[str]:
+    """Classify a logical line as block opener, partner keyword, or neither"""
+    first = tokens[0]
+    if first.kind != 'name':
+        return None
+    if len(tokens) == 1:
+        return first.text if first.text in ('akhir', 'atau') else None
+    if first.text in BLOCK_OPENERS and not _is_op(tokens, 1, '='):
+        return 'open'
+    if first.text == 'ataujika':
+        return 'ataujika'
+    return None
+
+
+def build_block_index(lines: List[List[Token]]) -> Dict[int, List[int]]:
+    """Map each block opener to the indexes of its ataujika/atau/akhir partners.
+
+    Built in a single pass with a stack; the last partner of every opener
+    is its `akhir`, so the parser can jump over any block in O(1).
+    """
+    index: Dict[int, List[int]] = {}
+    stack: List[int] = []
+
+    for i, tokens in enumerate(lines):
+        role = _block_role(tokens)
+        if role is None:
+            continue
+        if role == 'open':
+            stack.append(i)
+            index[i] = []
+            continue
+
+        first = tokens[0]
+        if not stack:
+            raise HambaError(f"'{role}' tanpa blok pembuka", first.line, first.col)
+
+        opener = stack[-1]
+        partners = index[opener]
+        if role != 'akhir':
+            if lines[opener][0].text != 'jika':
+                raise HambaError(f"'{role}' hanya boleh di dalam blok 'jika'", first.line, first.col)
+            if partners and _block_role(lines[partners[-1]]) == 'atau':
+                raise HambaError(f"'{role}' tidak boleh setelah 'atau'", first.line, first.col)
+
+        partners.append(i)
+        if role == 'akhir':
+            stack.pop()
+
+    if stack:
+        first = lines[stack[-1]][0]
+        raise HambaError(f"Blok '{first.text}' tidak memiliki 'akhir'", first.line, first.col)
+
+    return index
+
+
+class Parser:
+    def __init__(self, code: str):
+        self.source = code
+        self.lines = split_lines(tokenize(code))
+        self.blocks = build_block_index(self.lines)
+        self.expressions: Dict[str, Expr] = {}
+
+    def parse(self) -> Program:
+        body = self._parse_range(0, len(self.lines))
+        return Program(line=1, body=body, expressions=self.expressions)
+
+    def _expr(self, tokens: List[Token], anchor: Token) -> str:
+        """Source text of an expression slice; its tree is parsed right away"""
+        if not tokens:
+            raise HambaError("Ekspresi kosong", anchor.line, anchor.col)
+        text = span(self.source, tokens).strip()
+        if text not in self.expressions:
+            self.expressions[text] = parse_expression_tokens(tokens, text)
+        return text
+
+    def _parse_range(self, start: int, end: int) -> List[Node]:
+        """Parse the logical lines in [start, end) into statements"""
+        body = []
+        annotations: List[Token] = []
+        i = start
+        while i < end:
+            tokens = self.lines[i]
+            partners = self.blocks.get(i)
+            if _is_op(tokens, 0, '@'):
+                annotations.append(self._parse_annotation(tokens))
+                i += 1
+                continue
+            if partners is not None:
+                node = self._parse_block_statement(i, partners)
+                i = partners[-1] + 1
+            else:
+                node = self._parse_statement(tokens)
+                i += 1
+            if annotations:
+                self._annotate(node, annotations)
+                annotations = []
+            body.append(node)
+        if annotations:
+            self._annotate(None, annotations)
+        return body
+
+    def _parse_annotation(self, tokens: List[Token]) -> Token:
+        if len(tokens) != 2 or tokens[1].kind != 'name' or tokens[1].text not in FUNCTION_ANNOTATIONS:
+            raise HambaError(f"Anotasi tidak dikenal: {span(self.source, tokens)}",
+                             tokens[0].line, tokens[0].col)
+        return tokens[1]
+
+    def _annotate(self, node: Optional[Node], annotations: List[Token]):
+        """Apply `@nama` lines to the function definition that follows them"""
+        if not isinstance(node, FunctionDef):
+            first = annotations[0]
+            raise HambaError(f"Anotasi @{first.text} harus diikuti definisi fungsi",
+                             first.line, first.col)
+        for annotation in annotations:
+            setattr(node, annotation.text, True)
+
+    def _parse_block_statement(self, start: int, partners: List[int]) -> Node:
+        tokens = self.lines[start]
+        keyword = tokens[0]
+        end = partners[-1]
+
+        if keyword.text == 'fungsi':
+            return self._parse_function(tokens, self._parse_range(start + 1, end))
+        if keyword.text == 'jika':
+            return self._parse_if(start, partners)
+        if keyword.text == 'selama':
+            body = self._parse_range(start + 1, end)
+            return WhileStmt(line=keyword.line, condition=self._expr(tokens[1:], keyword), body=body)
+        if keyword.text == 'transaksi':
+            body = self._parse_range(start + 1, end)
+            return TransactionStmt(line=keyword.line, db_name=self._expr(tokens[1:], keyword), body=body)
+        return self._parse_for(tokens, self._parse_range(start + 1, end))
+
+    def _parse_statement(self, tokens: List[Token]) -> Node:
+        first = tokens[0]
+
+        if first.kind == 'name':
+            keyword = self.STATEMENT_KEYWORDS.get(first.text)
+            if keyword is not None:
+                node = keyword(self, tokens)
+                if node is not None:
+                    return node
+
+            if _is_op(tokens, 1, '='):
+                value = tokens[2:]
+                if (value and value[0].text in ASSIGNABLE_CALLS and _is_op(value, 1, '(')
+                        and matching_close(value, 1) == len(value) - 1):
+                    return self._parse_call_statement(value, first.text)
+                return AssignStmt(line=first.line, name=first.text, expr=self._expr(value, tokens[1]))
+
+            if _is_op(tokens, 1, '('):
+                if matching_close(tokens, 1) == len(tokens) - 1:
+                    return self._parse_call_statement(tokens, None)
+            elif _is_op(tokens, 1, '['):
+                close = matching_close(tokens, 1)
+                if close != -1 and _is_op(tokens, close + 1, '='):
+                    return IndexAssignStmt(
+                        line=first.line,
+                        name=first.text,
+                        index=self._expr(tokens[2:close], tokens[1]),
+                        expr=self._expr(tokens[close + 2:], tokens[close + 1]),
+                    )
+
+        raise HambaError(f"Syntax tidak dikenali: {span(self.source, tokens)}", first.line, first.col)
+
+    # Keyword statements; each returns None when the line does not fit,
+    # so e.g. `global = 1` still parses as an assignment
+    def _parse_return(self, tokens: List[Token]) -> ReturnStmt:
+        if len(tokens) == 1:
+            return ReturnStmt(line=tokens[0].line)
+        return ReturnStmt(line=tokens[0].line, expr=self._expr(tokens[1:], tokens[0]))
+
+    def _parse_global(self, tokens: List[Token]) -> Optional[GlobalStmt]:
+        if len(tokens) == 1 or _is_op(tokens, 1, '='):
+            return None
+        names = []
+        for part in split_top_level(tokens[1:]):
+            if len(part) != 1 or part[0].kind != 'name':
+                raise HambaError("Format global salah. Gunakan: global nama1, nama2",
+                                 tokens[0].line, tokens[0].col)
+            names.append(part[0].text)
+        return GlobalStmt(line=tokens[0].line, names=names)
+
+    def _parse_break(self, tokens: List[Token]) -> Optional[BreakStmt]:
+        return BreakStmt(line=tokens[0].line) if len(tokens) == 1 else None
+
+    def _parse_continue(self, tokens: List[Token]) -> Optional[ContinueStmt]:
+        return ContinueStmt(line=tokens[0].line) if len(tokens) == 1 else None
+
+    def _parse_print(self, tokens: List[Token]) -> Optional[PrintStmt]:
+        if len(tokens) == 1:
+            return None
+        return PrintStmt(line=tokens[0].line, expr=self._expr(tokens[1:], tokens[0]))
+
+    def _parse_rapat_infinite(self, tokens: List[Token]) -> Optional[RapatInfiniteStmt]:
+        return RapatInfiniteStmt(line=tokens[0].line) if _words(tokens) == ['RapatInfinite', '(', ')'] else None
+
+    def _parse_selesai(self, tokens: List[Token]) -> Optional[SelesaiStmt]:
+        if _words(tokens) in (['selesai'], ['selesai', '(', ')']):
+            return SelesaiStmt(line=tokens[0].line)
+        return None
+
+    STATEMENT_KEYWORDS: Dict[str, Callable[['Parser', List[Token]], Optional[Node]]] = {
+        'kembalikan': _parse_return,
+        'global': _parse_global,
+        'hentikan': _parse_break,
+        'lanjut': _parse_continue,
+        'lapor': _parse_print,
+        'print': _parse_print,
+        'RapatInfinite': _parse_rapat_infinite,
+        'selesai': _parse_selesai,
+    }
+
+    def _parse_call_statement(self, tokens: List[Token], target: Optional[str]) -> Node:
+        name_token = tokens[0]
+        name, line_no = name_token.text, name_token.line
+
+        entry = CALL_STATEMENTS.get(name)
+        if entry is None:
+            return ExprStmt(line=line_no, expr=self._expr(tokens, name_token))
+
+        argc, builder = entry
+        low, high = argc if isinstance(argc, tuple) else (argc, argc)
+        arg_tokens = split_top_level(tokens[2:-1])
+        if not low <= len(arg_tokens) <= high:
+            count = low if low == high else f"{low}-{high}"
+            raise HambaError(f"{name}() butuh {count} parameter", line_no, name_token.col)
+        return builder(line_no, target, [self._expr(arg, name_token) for arg in arg_tokens])
+
+    def _parse_function(self, tokens: List[Token], body: List[Node]) -> FunctionDef:
+        keyword = tokens[0]
+        if not (len(tokens) >= 4 and tokens[1].kind == 'name' and _is_op(tokens, 2, '(')
+                and matching_close(tokens, 2) == len(tokens) - 1):
+            raise HambaError("Format fungsi salah. Gunakan: fungsi nama(param1, param2)",
+                             keyword.line, keyword.col)
+
+        params = []
+        for param in split_top_level(tokens[3:-1]):
+            if len(param) != 1 or param[0].kind != 'name':
+                bad = span(self.source, param) if param else ''
+                raise HambaError(f"Nama parameter tidak valid: {bad}", keyword.line, keyword.col)
+            params.append(param[0].text)
+
+        return FunctionDef(line=keyword.line, name=tokens[1].text, params=params, body=body)
+
+    def _parse_if(self, start: int, partners: List[int]) -> IfStmt:
+        tokens = self.lines[start]
+        branches = []
+        else_body = None
+
+        condition = self._expr(tokens[1:], tokens[0])
+        body_start = start + 1
+        for partner in partners:
+            body = self._parse_range(body_start, partner)
+            if condition is None:
+                else_body = body
+            else:
+                branches.append((condition, body))
+
+            partner_tokens = self.lines[partner]
+            if partner_tokens[0].text == 'ataujika':
+                condition = self._expr(partner_tokens[1:], partner_tokens[0])
+            else:
+                condition = None
+            body_start = partner + 1
+
+        return IfStmt(line=tokens[0].line, branches=branches, else_body=else_body)
+
+    def _parse_for(self, tokens: List[Token], body: List[Node]) -> Node:
+        keyword = tokens[0]
+        if len(tokens) > 3 and tokens[1].kind == 'name':
+            var, mode = tokens[1].text, tokens[2]
+            if mode.text == 'dalam':
+                return ForEachStmt(line=keyword.line, var=var,
+                                   iterable=self._expr(tokens[3:], mode), body=body)
+            if mode.text == 'dari':
+                until = find_name(tokens, 'sampai', 3)
+                if until > 3:
+                    return ForRangeStmt(
+                        line=keyword.line,
+                        var=var,
+                        start=self._expr(tokens[3:until], mode),
+                        end=self._expr(tokens[until + 1:], tokens[until]),
+                        body=body,
+                    )
+
+        raise HambaError("Format loop tidak valid", keyword.line, keyword.col)
+
+
+# =====================
+# Resolver
+# =====================
+# Built-in satire variables occupy the first global slots, in this order
+RESERVED_GLOBALS = ('anggaran', 'status_proyek', 'progress')
+
+_scope_ids = itertools.count(1)
+
+
+def _target_name(node: Node) -> Optional[str]:
+    """Name a statement assigns to, if any"""
+    if isinstance(node, (AssignStmt, IndexAssignStmt)):
+        return node.name
+    if isinstance(node, (ForRangeStmt, ForEachStmt)):
+        return node.var
+    # Call statements in `x = nama(...)` form carry the name as `target`
+    return getattr(node, 'target', None)
+
+
+def _child_bodies(node: Node) -> List[List[Node]]:
+    if isinstance(node, IfStmt):
+        bodies = [body for _, body in node.branches]
+        if node.else_body is not None:
+            bodies.append(node.else_body)
+        return bodies
+    if isinstance(node, (WhileStmt, ForRangeStmt, ForEachStmt, TransactionStmt)):
+        return [node.body]
+    return []
+
+
+class Resolver:
+    """Map every assigned identifier to a fixed (depth, slot) pair.
+
+    Depth 0 is the interpreter's global table, whose slots are handed out
+    by `global_slot`; depth 1 is the frame of the enclosing function.
+    Functions do not close over each other, so no deeper chains exist.
+    """
+
+    def __init__(self, global_slot: Callable[[str], int]):
+        self.global_slot = global_slot
+
+    def resolve(self, program: Program):
+        for name in RESERVED_GLOBALS:
+            self.global_slot(name)
+        self._resolve_body(program.body, None)
+
+    def _resolve_body(self, body: List[Node], func: Optional[FunctionDef]):
+        for node in body:
+            if isinstance(node, FunctionDef):
+                self._resolve_function(node)
+                continue
+            name = _target_name(node)
+            if name is not None:
+                node.ref = self._ref(name, func)
+            for child in _child_bodies(node):
+                self._resolve_body(child, func)
+
+    def _ref(self, name: str, func: Optional[FunctionDef]) -> Ref:
+        if func is not None and name in func.slots:
+            return (1, func.slots[name])
+        return (0, self.global_slot(name))
+
+    def _resolve_function(self, func: FunctionDef):
+        declared = set(RESERVED_GLOBALS)
+        assigned: List[str] = list(func.params)
+        self._collect(func.body, declared, assigned)
+
+        func.slots = {}
+        for name in assigned:
+            if name not in declared and name not in func.slots:
+                func.slots[name] = len(func.slots)
+        func.scope = next(_scope_ids)
+        self._resolve_body(func.body, func)
+
+    def _collect(self, body: List[Node], declared: set, assigned: List[str]):
+        """Gather `global` declarations and assignment targets of one function"""
+        for node in body:
+            if isinstance(node, GlobalStmt):
+                declared.update(node.names)
+            elif not isinstance(node, FunctionDef):
+                name = _target_name(node)
+                if name is not None and not isinstance(node, IndexAssignStmt):
+                    assigned.append(name)
+                for child in _child_bodies(node):
+                    self._collect(child, declared, assigned)
+
+
+# Statements a pure function may contain; output, file/DB/HTTP work,
+# Korupsi/Mangkrak, index assignment and nested definitions are effects
+PURE_STATEMENTS = (AssignStmt, GlobalStmt, IfStmt, WhileStmt, ForRangeStmt, ForEachStmt,
+                   ReturnStmt, BreakStmt, ContinueStmt, ExprStmt)
+
+
+def _expression_sources(node: Node) -> List[str]:
+    if isinstance(node, IfStmt):
+        return [condition for condition, _ in node.branches]
+    if isinstance(node, WhileStmt):
+        return [node.condition]
+    if isinstance(node, ForRangeStmt):
+        return [node.start, node.end]
+    if isinstance(node, ForEachStmt):
+        return [node.iterable]
+    if isinstance(node, ReturnStmt):
+        return [node.expr] if node.expr else []
+    if isinstance(node, (AssignStmt, ExprStmt)):
+        return [node.expr]
+    return []
+
+
+def find_functions(body: List[Node]) -> List[FunctionDef]:
+    """Every function definition in body, including nested ones"""
+    found = []
+    for node in body:
+        if isinstance(node, FunctionDef):
+            found.append(node)
+            found.extend(find_functions(node.body))
+        else:
+            for child in _child_bodies(node):
+                found.extend(find_functions(child))
+    return found
+
+
+class PurityAnalyzer:
+    """Find functions whose result depends only on their arguments.
+
+    Runs on resolved definitions. A pure function only contains
+    PURE_STATEMENTS, neither reads nor writes globals, and only calls pure
+    builtins or other pure functions. A local may only be read where it is
+    assigned on every path before the read, since an unassigned local slot
+    falls back to the global of the same name. Recursion is handled by
+    assuming every function is pure and dropping offenders until nothing
+    changes.
+    """
+
+    def __init__(self, tree_of: Callable[[str], Expr], pure_builtins: Iterable[str]):
+        self.tree_of = tree_of
+        self.pure_builtins = set(pure_builtins)
+
+    def analyze(self, functions: Iterable[FunctionDef]) -> Set[str]:
+        """Names whose every definition is pure"""
+        by_name: Dict[str, List[FunctionDef]] = {}
+        for func in functions:
+            by_name.setdefault(func.name, []).append(func)
+
+        pure = set(by_name)
+        changed = True
+        while changed:
+            changed = False
+            for name in list(pure):
+                if not all(self._body_is_pure(func.body, set(func.params), pure) is not None
+                           for func in by_name[name]):
+                    pure.discard(name)
+                    changed = True
+        return pure
+
+    def _body_is_pure(self, body: List[Node], assigned: Set[str], pure: Set[str]) -> Optional[Set[str]]:
+        """Locals definitely assigned after body, starting from `assigned`; None if impure"""
+        assigned = set(assigned)
+        for node in body:
+            if not isinstance(node, PURE_STATEMENTS):
+                return None
+            ref = getattr(node, 'ref', None)
+            if ref is not None and ref[0] == 0:
+                return None
+            for source in _expression_sources(node):
+                if not self._expr_is_pure(self.tree_of(source), assigned, pure):
+                    return None
+
+            if isinstance(node, AssignStmt):
+                assigned.add(node.name)
+            elif isinstance(node, IfStmt):
+                # Only names every branch assigns are assigned afterwards
+                after = None
+                for branch in [branch for _, branch in node.branches] + [node.else_body or []]:
+                    result = self._body_is_pure(branch, assigned, pure)
+                    if result is None:
+                        return None
+                    after = result if after is None else after & result
+                assigned = after
+            elif isinstance(node, (ForRangeStmt, ForEachStmt)):
+                # The loop variable is only assigned if the body runs at all
+                if self._body_is_pure(node.body, assigned | {node.var}, pure) is None:
+                    return None
+            elif isinstance(node, WhileStmt):
+                if self._body_is_pure(node.body, assigned, pure) is None:
+                    return None
+        return assigned
+
+    def _expr_is_pure(self, node: Expr, assigned: Set[str], pure: Set[str]) -> bool:
+        check = self._expr_is_pure
+        if isinstance(node, Var):
+            return node.name in assigned
+        if isinstance(node, CallExpr):
+            return (node.name in self.pure_builtins or node.name in pure) and \
+                all(check(arg, assigned, pure) for arg in node.args)
+        if isinstance(node, BinaryExpr):
+            return check(node.left, assigned, pure) and check(node.right, assigned, pure)
+        if isinstance(node, UnaryExpr):
+            return check(node.operand, assigned, pure)
+        if isinstance(node, IndexExpr):
+            return check(node.target, assigned, pure) and check(node.key, assigned, pure)
+        if isinstance(node, ListExpr):
+            return all(check(item, assigned, pure) for item in node.items)
+        if isinstance(node, DictExpr):
+            return all(check(k, assigned, pure) and check(v, assigned, pure) for k, v in node.pairs)
+        return True
+
+
+def resolve(program: Program, global_slot: Callable[[str], int]) -> Program:
+    """Resolve variable references of a parsed program in place"""
+    Resolver(global_slot).resolve(program)
+    return program
+
+
+def parse(code: str) -> Program:
+    """Parse v2 source code into a Program node"""
+    return Parser(code).parse()
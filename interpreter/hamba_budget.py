@@ -0,0 +1,117 @@
+"""
+HambaLang Execution Budget
+One fuel / wall-clock / memory budget accepted by every engine (hamba.py,
+hamba_v2, hamba_advanced, HambaVM and ObfuscatedVM). Engines charge fuel at
+cheap points - loop back-edges and calls in hamba_v2, statements in the
+tree walkers, instructions in the VMs - and the deadline and memory
+ceiling are only looked at every `check_interval` units of fuel.
+"""
+import time
+import tracemalloc
+from typing import Optional
+
+if __package__:
+    from .hamba_lexer import HambaError
+else:
+    from hamba_lexer import HambaError
+
+
+class BudgetExhausted(HambaError):
+    """A script ran out of fuel, time or memory; scripts cannot catch this"""
+    resource = 'budget'
+
+    def __init__(self, limit, line: Optional[int] = None):
+        self.limit = limit
+        super().__init__(self.describe(limit), line)
+
+    @staticmethod
+    def describe(limit) -> str:
+        return f"Anggaran eksekusi habis (batas {limit})"
+
+
+class FuelExhausted(BudgetExhausted):
+    resource = 'fuel'
+
+    @staticmethod
+    def describe(limit) -> str:
+        return f"Anggaran eksekusi habis: batas {limit} langkah terlampaui"
+
+
+class DeadlineExceeded(BudgetExhausted):
+    resource = 'waktu'
+
+    @staticmethod
+    def describe(limit) -> str:
+        return f"Batas waktu {limit} detik terlampaui"
+
+
+class MemoryLimitExceeded(BudgetExhausted):
+    resource = 'memori'
+
+    @staticmethod
+    def describe(limit) -> str:
+        return f"Batas memori {limit} byte terlampaui"
+
+
+class Budget:
+    """Fuel, deadline (seconds) and memory ceiling (bytes) for one run; None means unlimited.
+
+    Hot loops may inline charge(): add to `used` and call check() once it
+    reaches `next_check`.
+    """
+    __slots__ = ('fuel', 'deadline', 'memory', 'check_interval', 'used', 'next_check',
+                 '_expires_at', '_started', '_tracing')
+
+    def __init__(self, fuel: Optional[int] = None, deadline: Optional[float] = None,
+                 memory: Optional[int] = None, check_interval: int = 1000):
+        self.fuel = fuel
+        self.deadline = deadline
+        self.memory = memory
+        self.check_interval = check_interval
+        self.used = 0
+        self._expires_at: Optional[float] = None
+        self._started = False
+        self._tracing = False
+        self._schedule()
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return None if self.fuel is None else max(self.fuel - self.used, 0)
+
+    def start(self):
+        """Start the clock on first use and trace allocations if memory is capped"""
+        if not self._started:
+            self._started = True
+            if self.deadline is not None:
+                self._expires_at = time.monotonic() + self.deadline
+        if self.memory is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
+    def stop(self):
+        """Stop allocation tracing started by this budget (the clock keeps running)"""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def charge(self, amount: int = 1):
+        self.used += amount
+        if self.used >= self.next_check:
+            self.check()
+
+    def check(self):
+        if self.fuel is not None and self.used > self.fuel:
+            raise FuelExhausted(self.fuel)
+        if self._expires_at is not None and time.monotonic() > self._expires_at:
+            raise DeadlineExceeded(self.deadline)
+        if self.memory is not None and tracemalloc.is_tracing() \
+                and tracemalloc.get_traced_memory()[0] > self.memory:
+            raise MemoryLimitExceeded(self.memory)
+        self._schedule()
+
+    def _schedule(self):
+        """Next fuel count at which check() runs"""
+        next_check = self.used + self.check_interval
+        if self.fuel is not None:
+            next_check = min(next_check, self.fuel + 1)
+        self.next_check = next_check
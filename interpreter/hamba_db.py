@@ -0,0 +1,283 @@
+"""
+HambaLang v2 - Database Connection Pool
+sambungDB names are bound to pooled connections keyed by database type and
+path, so reconnecting to the same database reuses the open connection.
+Every connection keeps an LRU of statement cursors keyed by SQL text:
+prepared cursors on MySQL, and on SQLite plain cursors whose compiled
+statements come from sqlite3's own statement cache of the same size.
+Streamed queries get a cursor of their own and fetch rows in batches.
+Statements commit on their own unless a transaction is open on the
+connection, in which case the commit waits for the outermost one to end.
+"""
+import re
+import sqlite3
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+# Optional driver
+try:
+    import mysql.connector
+    HAS_MYSQL = True
+except ImportError:
+    HAS_MYSQL = False
+
+DEFAULT_STATEMENT_CACHE_SIZE = 128
+
+# Rows fetched per round trip by a streamed query
+DEFAULT_FETCH_SIZE = 500
+
+DB_TYPE_NAMES = {'sqlite': 'SQLite', 'mysql': 'MySQL'}
+
+# SQLite tuning profiles for sambungDB's optional fourth argument
+SQLITE_PROFILES: Dict[str, Dict[str, Any]] = {
+    'standar': {},
+    'cepat': {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'cache_size': -64000, 'temp_store': 'MEMORY'},
+    'aman': {'journal_mode': 'WAL', 'synchronous': 'FULL'},
+}
+
+SQLITE_PRAGMAS = ('journal_mode', 'synchronous', 'cache_size', 'temp_store', 'mmap_size', 'busy_timeout')
+
+PRAGMA_VALUE = re.compile(r"-?\w+")
+
+Params = Union[Sequence[Any], Dict[str, Any]]
+
+
+def sqlite_pragmas(profile: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """PRAGMA settings for a profile name or an object of PRAGMA names to values"""
+    if isinstance(profile, str):
+        if profile not in SQLITE_PROFILES:
+            raise Exception(f"Profil SQLite tidak dikenal: {profile} (pilih: {', '.join(SQLITE_PROFILES)})")
+        return SQLITE_PROFILES[profile]
+    if not isinstance(profile, dict):
+        raise Exception("Profil SQLite harus nama profil atau object")
+    for name, value in profile.items():
+        if name not in SQLITE_PRAGMAS:
+            raise Exception(f"PRAGMA tidak didukung: {name}")
+        if isinstance(value, bool) or not PRAGMA_VALUE.fullmatch(str(value)):
+            raise Exception(f"Nilai PRAGMA {name} tidak valid: {value}")
+    return profile
+
+
+class Row:
+    """One result row, read by position or by column name through its result set's index"""
+    __slots__ = ('values', 'index')
+
+    def __init__(self, values: Sequence[Any], index: Dict[str, int]):
+        self.values = values
+        self.index = index
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        if isinstance(key, str):
+            position = self.index.get(key)
+            if position is None:
+                raise Exception(f"Kolom '{key}' tidak ditemukan")
+            return self.values[position]
+        return self.values[key]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(zip(self.index, self.values))
+
+
+class ResultSet:
+    """Rows of a query fetched lazily in batches of `fetch_size`; can be iterated once"""
+
+    def __init__(self, cursor, fetch_size: int = DEFAULT_FETCH_SIZE):
+        self.cursor = cursor
+        self.fetch_size = fetch_size
+        self.columns: List[str] = [column[0] for column in cursor.description]
+        self.index = {name: i for i, name in enumerate(self.columns)}
+        self.fetched = 0
+        self.started = False
+
+    def __iter__(self) -> Iterator[Row]:
+        if self.started:
+            raise Exception("Hasil queryStream hanya bisa dibaca sekali; jalankan query lagi")
+        self.started = True
+        return self._rows()
+
+    def _rows(self) -> Iterator[Row]:
+        cursor = self.cursor
+        if cursor is None:
+            return
+        index = self.index
+        try:
+            while True:
+                batch = cursor.fetchmany(self.fetch_size)
+                if not batch:
+                    break
+                self.fetched += len(batch)
+                for values in batch:
+                    yield Row(values, index)
+        finally:
+            self.close()
+
+    def close(self):
+        if self.cursor is not None:
+            self.cursor.close()
+            self.cursor = None
+
+    def __str__(self) -> str:
+        return f"<hasil query: {', '.join(self.columns)}>"
+
+
+class PooledConnection:
+    """One open connection shared by every sambungDB name bound to it"""
+
+    def __init__(self, key: Tuple[str, str], raw, statement_cache_size: int,
+                 prepared: bool = False):
+        self.key = key
+        self.raw = raw
+        self.users = 0
+        self.statement_cache_size = statement_cache_size
+        self._prepared = prepared
+        self._statements: 'OrderedDict[str, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Open transactions; nested ones commit together with the outermost
+        self.transaction_depth = 0
+
+    def cursor_for(self, sql: str):
+        """Cached cursor for a statement, created (and prepared) on first use"""
+        cursor = self._statements.get(sql)
+        if cursor is not None:
+            self.hits += 1
+            self._statements.move_to_end(sql)
+            return cursor
+
+        self.misses += 1
+        cursor = self.raw.cursor(prepared=True) if self._prepared else self.raw.cursor()
+        self._statements[sql] = cursor
+        if len(self._statements) > self.statement_cache_size:
+            self._statements.popitem(last=False)[1].close()
+        return cursor
+
+    def execute(self, sql: str, params: Params = ()) -> Union[list, int]:
+        """Rows of a query that returns rows, otherwise the committed row count"""
+        cursor = self.cursor_for(sql)
+        cursor.execute(sql, params)
+        if cursor.description is not None:
+            return cursor.fetchall()
+        self._autocommit()
+        return cursor.rowcount
+
+    def stream(self, sql: str, params: Params = (), fetch_size: int = DEFAULT_FETCH_SIZE) -> Union[ResultSet, int]:
+        """Lazy ResultSet on a cursor of its own, or the committed row count if no rows come back"""
+        cursor = self.raw.cursor()
+        cursor.execute(sql, params)
+        if cursor.description is None:
+            self._autocommit()
+            count = cursor.rowcount
+            cursor.close()
+            return count
+        return ResultSet(cursor, fetch_size)
+
+    def execute_many(self, sql: str, rows: Iterable[Params]) -> int:
+        """Run one statement for every row in a single transaction; total rows affected"""
+        cursor = self.cursor_for(sql)
+        try:
+            cursor.executemany(sql, rows)
+        except BaseException:
+            # Inside a transaction the whole transaction is rolled back by its owner
+            if not self.transaction_depth:
+                self.raw.rollback()
+            raise
+        self._autocommit()
+        return cursor.rowcount
+
+    def begin(self):
+        self.transaction_depth += 1
+
+    def commit(self):
+        if not self.transaction_depth:
+            raise Exception("Tidak ada transaksi yang aktif")
+        self.transaction_depth -= 1
+        if not self.transaction_depth:
+            self.raw.commit()
+
+    def rollback(self):
+        """Undo the outermost transaction, including any nested in it"""
+        if not self.transaction_depth:
+            raise Exception("Tidak ada transaksi yang aktif")
+        self.transaction_depth = 0
+        self.raw.rollback()
+
+    def _autocommit(self):
+        if not self.transaction_depth:
+            self.raw.commit()
+
+    def tune(self, pragmas: Dict[str, Any]):
+        """Apply PRAGMA settings (see sqlite_pragmas) to an SQLite connection"""
+        if self.key is None or self.key[0] != 'sqlite':
+            raise Exception("Profil tuning hanya untuk SQLite")
+        for name, value in pragmas.items():
+            self.raw.execute(f"PRAGMA {name} = {value}").fetchall()
+
+    def close(self):
+        for cursor in self._statements.values():
+            cursor.close()
+        self._statements.clear()
+        self.raw.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'users': self.users,
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._statements),
+            'maxsize': self.statement_cache_size,
+        }
+
+
+class ConnectionPool:
+    """Open connections keyed by (type, path); idle ones stay open until close_idle()"""
+
+    def __init__(self, statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE):
+        self.statement_cache_size = statement_cache_size
+        self._connections: Dict[Tuple[str, str], PooledConnection] = {}
+
+    def acquire(self, db_type: str, target: str) -> PooledConnection:
+        key = (db_type, target)
+        conn = self._connections.get(key)
+        if conn is None:
+            conn = self._open(db_type, target)
+            # Every ':memory:' connection is its own database, so it is never shared
+            if target != ':memory:':
+                self._connections[key] = conn
+        conn.users += 1
+        return conn
+
+    def release(self, conn: PooledConnection):
+        conn.users -= 1
+        if conn.users <= 0 and conn.key not in self._connections:
+            conn.close()
+
+    def close_idle(self):
+        for key, conn in list(self._connections.items()):
+            if conn.users <= 0:
+                del self._connections[key]
+                conn.close()
+
+    def close_all(self):
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {f"{db_type}:{target}": conn.stats() for (db_type, target), conn in self._connections.items()}
+
+    def _open(self, db_type: str, target: str) -> PooledConnection:
+        if db_type == 'sqlite':
+            raw = sqlite3.connect(target, cached_statements=self.statement_cache_size)
+            return PooledConnection((db_type, target), raw, self.statement_cache_size)
+        if db_type == 'mysql':
+            if not HAS_MYSQL:
+                raise Exception("mysql-connector-python tidak terinstall")
+            raw = mysql.connector.connect(target)
+            return PooledConnection((db_type, target), raw, self.statement_cache_size, prepared=True)
+        raise Exception(f"Tipe database tidak didukung: {db_type}")
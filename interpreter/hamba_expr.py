@@ -0,0 +1,340 @@
+"""
+HambaLang v2 - Expression Compiler
+Parses expression tokens into a small tree once; interpreters turn the
+tree into closures and keep them in a bounded LRU cache keyed by source.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+if __package__:
+    from .hamba_lexer import HambaError, Token, tokenize
+else:
+    from hamba_lexer import HambaError, Token, tokenize
+
+
+# =====================
+# Expression Nodes
+# =====================
+@dataclass
+class Expr:
+    pass
+
+
+@dataclass
+class Const(Expr):
+    value: Any
+
+
+@dataclass
+class Var(Expr):
+    name: str
+
+
+@dataclass
+class ListExpr(Expr):
+    items: List[Expr]
+
+
+@dataclass
+class DictExpr(Expr):
+    pairs: List[Tuple[Expr, Expr]]
+
+
+@dataclass
+class IndexExpr(Expr):
+    target: Expr
+    key: Expr
+
+
+@dataclass
+class CallExpr(Expr):
+    name: str
+    args: List[Expr]
+
+
+@dataclass
+class UnaryExpr(Expr):
+    op: str
+    operand: Expr
+
+
+@dataclass
+class BinaryExpr(Expr):
+    op: str
+    left: Expr
+    right: Expr
+
+
+@dataclass
+class Template(Expr):
+    """A literal-only list/object built once at load time; each evaluation
+    gets a fresh copy from `copy` so scripts can still mutate the result"""
+    value: Any
+
+    def __post_init__(self):
+        self.copy = make_copier(self.value)
+
+
+LITERAL_NAMES = {'benar': True, 'salah': False, 'kosong': None}
+
+BINARY_PRECEDENCE = {
+    'atau': 1,
+    'dan': 2,
+    '==': 3, '!=': 3, '<': 3, '>': 3, '<=': 3, '>=': 3,
+    '+': 4, '-': 4,
+    '*': 5, '/': 5, '%': 5,
+}
+
+
+# =====================
+# Parser (precedence climbing over lexer tokens)
+# =====================
+class ExpressionParser:
+    def __init__(self, tokens: List[Token], source: str = ''):
+        if not tokens or tokens[-1].kind != 'end':
+            last = tokens[-1] if tokens else None
+            end_col = last.col + len(last.text) if last else 1
+            tokens = list(tokens) + [Token('end', '', last.line if last else 1, end_col, 0)]
+        self.tokens = tokens
+        self.source = source
+        self.pos = 0
+
+    def parse(self) -> Expr:
+        if self.tokens[0].kind == 'end':
+            self._error("ekspresi kosong")
+        node = self._parse_binary(1)
+        if self._peek().kind != 'end':
+            self._error(f"token tidak terduga '{self._peek().text}'")
+        return node
+
+    def _peek(self) -> Token:
+        return self.tokens[self.pos]
+
+    def _at(self, text: str) -> bool:
+        token = self.tokens[self.pos]
+        return token.kind == 'op' and token.text == text
+
+    def _advance(self) -> Token:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect(self, text: str):
+        if not self._at(text):
+            self._error(f"diharapkan '{text}'")
+        self.pos += 1
+
+    def _error(self, detail: str):
+        token = self._peek()
+        message = f"Tidak dapat mengevaluasi: {self.source} ({detail})" if self.source else detail
+        raise HambaError(message, token.line, token.col)
+
+    def _parse_binary(self, min_precedence: int) -> Expr:
+        left = self._parse_unary()
+        while True:
+            token = self._peek()
+            precedence = BINARY_PRECEDENCE.get(token.text) if token.kind in ('op', 'name') else None
+            if precedence is None or precedence < min_precedence:
+                return left
+            self._advance()
+            right = self._parse_binary(precedence + 1)
+            left = BinaryExpr(token.text, left, right)
+
+    def _parse_unary(self) -> Expr:
+        if self._at('-') or self._at('+'):
+            op = self._advance().text
+            operand = self._parse_unary()
+            if isinstance(operand, Const) and isinstance(operand.value, (int, float)) \
+                    and not isinstance(operand.value, bool):
+                return Const(-operand.value if op == '-' else operand.value)
+            return UnaryExpr(op, operand)
+        return self._parse_postfix()
+
+    def _parse_postfix(self) -> Expr:
+        node = self._parse_primary()
+        while self._at('['):
+            self._advance()
+            key = self._parse_binary(1)
+            self._expect(']')
+            node = IndexExpr(node, key)
+        return node
+
+    def _parse_primary(self) -> Expr:
+        token = self._peek()
+        kind, text = token.kind, token.text
+
+        if kind == 'number':
+            self._advance()
+            return Const(float(text) if '.' in text else int(text))
+        if kind == 'string':
+            self._advance()
+            return Const(text[1:-1])
+        if kind == 'name':
+            self._advance()
+            if text in LITERAL_NAMES:
+                return Const(LITERAL_NAMES[text])
+            if self._at('('):
+                self._advance()
+                return CallExpr(text, self._parse_sequence(')'))
+            return Var(text)
+        if kind == 'op':
+            if text == '(':
+                self._advance()
+                node = self._parse_binary(1)
+                self._expect(')')
+                return node
+            if text == '[':
+                self._advance()
+                return ListExpr(self._parse_sequence(']'))
+            if text == '{':
+                self._advance()
+                return self._parse_dict()
+
+        self._error(f"token tidak terduga '{text}'" if text else "ekspresi tidak lengkap")
+
+    def _parse_sequence(self, closer: str) -> List[Expr]:
+        items = []
+        if self._at(closer):
+            self._advance()
+            return items
+        while True:
+            items.append(self._parse_binary(1))
+            if self._at(','):
+                self._advance()
+                continue
+            self._expect(closer)
+            return items
+
+    def _parse_dict(self) -> DictExpr:
+        pairs = []
+        if self._at('}'):
+            self._advance()
+            return DictExpr(pairs)
+        while True:
+            key = self._parse_binary(1)
+            self._expect(':')
+            pairs.append((key, self._parse_binary(1)))
+            if self._at(','):
+                self._advance()
+                continue
+            self._expect('}')
+            return DictExpr(pairs)
+
+
+def parse_expression(source: str) -> Expr:
+    """Parse expression source into an Expr tree"""
+    return ExpressionParser(tokenize(source, newlines=False), source).parse()
+
+
+def parse_expression_tokens(tokens: List[Token], source: str = '') -> Expr:
+    """Parse an expression from a slice of an already tokenized file"""
+    return ExpressionParser(tokens, source).parse()
+
+
+# =====================
+# Constant folding
+# =====================
+IMMUTABLE_TYPES = (bool, int, float, str, type(None))
+
+
+def make_copier(value: Any) -> Callable[[], Any]:
+    """Cheapest zero-argument function that returns an independent copy of value"""
+    if isinstance(value, list):
+        if all(isinstance(item, IMMUTABLE_TYPES) for item in value):
+            return value.copy
+        items = [make_copier(item) for item in value]
+        return lambda: [item() for item in items]
+    if isinstance(value, dict):
+        if all(isinstance(item, IMMUTABLE_TYPES) for item in value.values()):
+            return value.copy
+        pairs = [(key, make_copier(item)) for key, item in value.items()]
+        return lambda: {key: item() for key, item in pairs}
+    return lambda: value
+
+
+def _literal(node: Expr) -> bool:
+    return isinstance(node, (Const, Template))
+
+
+def fold_constants(node: Expr, evaluate: Callable[[Expr], Any]) -> Expr:
+    """Evaluate literal-only subtrees once with the engine's own `evaluate`.
+
+    Operators on constants become a shared Const; list/object literals become
+    a Template. Subtrees that fail to evaluate (e.g. a division by zero) are
+    left alone so the error is raised at run time, with its line number.
+    """
+    if isinstance(node, ListExpr):
+        items = [fold_constants(item, evaluate) for item in node.items]
+        node = ListExpr(items)
+        foldable = all(_literal(item) for item in items)
+    elif isinstance(node, DictExpr):
+        pairs = [(fold_constants(k, evaluate), fold_constants(v, evaluate)) for k, v in node.pairs]
+        node = DictExpr(pairs)
+        foldable = all(_literal(k) and _literal(v) for k, v in pairs)
+    elif isinstance(node, IndexExpr):
+        return IndexExpr(fold_constants(node.target, evaluate), fold_constants(node.key, evaluate))
+    elif isinstance(node, CallExpr):
+        # Calls are never folded: user functions and most builtins have effects
+        return CallExpr(node.name, [fold_constants(arg, evaluate) for arg in node.args])
+    elif isinstance(node, UnaryExpr):
+        node = UnaryExpr(node.op, fold_constants(node.operand, evaluate))
+        foldable = isinstance(node.operand, Const)
+    elif isinstance(node, BinaryExpr):
+        node = BinaryExpr(node.op, fold_constants(node.left, evaluate), fold_constants(node.right, evaluate))
+        foldable = isinstance(node.left, Const) and isinstance(node.right, Const)
+    else:
+        return node
+
+    if not foldable:
+        return node
+    try:
+        value = evaluate(node)
+    except Exception:
+        return node
+    if isinstance(value, IMMUTABLE_TYPES):
+        return Const(value)
+    if isinstance(value, (list, dict)):
+        return Template(value)
+    return node
+
+
+# =====================
+# Compiled-expression cache
+# =====================
+class ExpressionCache:
+    """Bounded LRU cache of compiled expressions keyed by their source text"""
+
+    def __init__(self, compile_fn: Callable[[str], Callable[[], Any]], maxsize: int = 1024):
+        self._compile = compile_fn
+        self._entries: 'OrderedDict[str, Callable[[], Any]]' = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str) -> Callable[[], Any]:
+        compiled = self._entries.get(source)
+        if compiled is not None:
+            self.hits += 1
+            self._entries.move_to_end(source)
+            return compiled
+
+        self.misses += 1
+        compiled = self._compile(source)
+        self._entries[source] = compiled
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
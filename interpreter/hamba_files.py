@@ -0,0 +1,281 @@
+"""
+HambaLang v2 - Streaming File Access
+Lazy readers behind `bacaBaris`, `bacaPotongan`, `bacaCSV` and `bacaJSONL`,
+the buffered CSV writer behind `tulisCSV` and the `bukaFile` handles that
+keep a file open across many buffered writes. A reader only stores
+its path and sizes; every `untuk ... dalam` loop over it opens the file
+with a buffer of the given size, yields one line or chunk at a time and
+closes the file when the loop is done, so memory does not grow with the
+size of the file.
+
+`petakanFile` maps a file read-only with mmap instead: slices, searches
+and line lookups read straight from the mapping and copy only the bytes
+they return.
+"""
+import csv
+import json
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Union
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# bukaFile modes and the open() mode each maps to
+FILE_MODES = {'tulis': 'w', 'w': 'w', 'tambah': 'a', 'a': 'a'}
+
+# Bytes csv.Sniffer looks at to guess whether the first row is a header
+CSV_SNIFF_SIZE = 4096
+
+
+class FileStream:
+    """Re-iterable view of a text file, one line at a time without its line ending.
+
+    Subclasses override `_items` to yield other units (chunks, CSV rows).
+    """
+    kind = 'file'
+    newline: Optional[str] = None
+
+    def __init__(self, path: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if buffer_size < 1:
+            raise Exception("Ukuran buffer harus positif")
+        self.path = path
+        self.buffer_size = buffer_size
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            f = open(self.path, 'r', encoding='utf-8', buffering=self.buffer_size, newline=self.newline)
+        except OSError as e:
+            raise Exception(f"Gagal membaca file: {e}") from None
+        with f:
+            yield from self._items(f)
+
+    def _items(self, f: TextIO) -> Iterator[str]:
+        for line in f:
+            yield line[:-1] if line.endswith('\n') else line
+
+    def __str__(self) -> str:
+        return f"<{self.kind}: {self.path}>"
+
+
+class LineReader(FileStream):
+    """Lines of a file without their line ending"""
+    kind = 'bacaBaris'
+
+
+class ChunkReader(FileStream):
+    """Pieces of at most `chunk_size` characters; only the last may be shorter"""
+    kind = 'bacaPotongan'
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if chunk_size < 1:
+            raise Exception("Ukuran potongan harus positif")
+        super().__init__(path, buffer_size)
+        self.chunk_size = chunk_size
+
+    def _items(self, f: TextIO) -> Iterator[str]:
+        read, size = f.read, self.chunk_size
+        chunk = read(size)
+        while chunk:
+            yield chunk
+            chunk = read(size)
+
+
+class CsvReader(FileStream):
+    """Rows of a CSV file: objects keyed by the header, or arrays without one.
+
+    `header` None means sniffing the start of the file with csv.Sniffer.
+    """
+    kind = 'bacaCSV'
+    newline = ''
+
+    def __init__(self, path: str, header: Optional[bool] = None, delimiter: str = ',',
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if len(delimiter) != 1:
+            raise Exception("Pemisah CSV harus satu karakter")
+        super().__init__(path, buffer_size)
+        self.header = header
+        self.delimiter = delimiter
+
+    def _items(self, f: TextIO) -> Iterator[Union[Dict[str, str], List[str]]]:
+        header = self.header
+        if header is None:
+            header = self._sniff_header(f)
+        if header:
+            yield from csv.DictReader(f, delimiter=self.delimiter, restval='')
+        else:
+            yield from csv.reader(f, delimiter=self.delimiter)
+
+    @staticmethod
+    def _sniff_header(f: TextIO) -> bool:
+        sample = f.read(CSV_SNIFF_SIZE)
+        f.seek(0)
+        if not sample:
+            return False
+        try:
+            return csv.Sniffer().has_header(sample)
+        except csv.Error:
+            return True
+
+
+class JsonLinesReader(FileStream):
+    """One parsed JSON value per non-empty line"""
+    kind = 'bacaJSONL'
+
+    def _items(self, f: TextIO) -> Iterator[Any]:
+        loads = json.loads
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                try:
+                    yield loads(line)
+                except ValueError as e:
+                    raise Exception(f"JSON tidak valid di baris {number}: {e}") from None
+
+
+def write_csv(path: str, rows: Iterable[Union[Sequence[Any], Dict[str, Any]]],
+              fieldnames: Optional[List[str]] = None, delimiter: str = ',',
+              buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """Write rows through one buffered file; with fieldnames, rows are objects under a header"""
+    try:
+        with open(path, 'w', encoding='utf-8', newline='', buffering=buffer_size) as f:
+            if fieldnames is None:
+                writer = csv.writer(f, delimiter=delimiter)
+            else:
+                writer = csv.DictWriter(f, fieldnames, delimiter=delimiter, restval='', extrasaction='ignore')
+                writer.writeheader()
+            count = 0
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+    except OSError as e:
+        raise Exception(f"Gagal menulis file: {e}") from None
+    return count
+
+
+class FileHandle:
+    """A file opened by bukaFile; writes go through one buffer until tutupFile or program end"""
+
+    def __init__(self, path: str, mode: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if mode not in FILE_MODES:
+            raise Exception(f"Mode file tidak dikenal: {mode} (pilih: tulis, tambah)")
+        try:
+            self.file = open(path, FILE_MODES[mode], encoding='utf-8', buffering=buffer_size)
+        except OSError as e:
+            raise Exception(f"Gagal membuka file: {e}") from None
+        self.path = path
+        self.mode = mode
+
+    @property
+    def closed(self) -> bool:
+        return self.file.closed
+
+    def write(self, text: str):
+        if self.file.closed:
+            raise Exception(f"File sudah ditutup: {self.path}")
+        try:
+            self.file.write(text)
+        except OSError as e:
+            raise Exception(f"Gagal menulis file: {e}") from None
+
+    def close(self):
+        self.file.close()
+
+    def __str__(self) -> str:
+        return f"<bukaFile: {self.path}>"
+
+
+class MappedFile:
+    """Read-only memory map of a file; positions and lengths are in bytes"""
+
+    def __init__(self, path: str):
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                # An empty file cannot be mapped
+                self._data: Optional[Union[mmap.mmap, bytes]] = \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        except (OSError, ValueError) as e:
+            raise Exception(f"Gagal memetakan file: {e}") from None
+        self.path = path
+        # Start offset of every line, built on the first line lookup
+        self._line_starts: Optional[array] = None
+
+    @property
+    def data(self) -> Union[mmap.mmap, bytes]:
+        if self._data is None:
+            raise Exception(f"File sudah ditutup: {self.path}")
+        return self._data
+
+    @property
+    def closed(self) -> bool:
+        return self._data is None
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int) -> int:
+        return self.data[index]
+
+    def text(self, start: int, end: Optional[int] = None) -> str:
+        return self.data[start:end].decode('utf-8', errors='replace')
+
+    def find(self, needle: str, start: int = 0) -> int:
+        return self.data.find(needle.encode('utf-8'), start)
+
+    def line_starts(self) -> array:
+        if self._line_starts is None:
+            data, find = self.data, self.data.find
+            starts = array('q')
+            position = 0
+            while position < len(data):
+                starts.append(position)
+                end = find(b'\n', position)
+                if end == -1:
+                    break
+                position = end + 1
+            self._line_starts = starts
+        return self._line_starts
+
+    def line(self, number: int) -> str:
+        starts = self.line_starts()
+        if not 0 <= number < len(starts):
+            raise Exception(f"Baris {number} di luar jangkauan")
+        start = starts[number]
+        end = self.data.find(b'\n', start)
+        return self._strip(self.data[start:end if end != -1 else len(self.data)])
+
+    def find_line(self, needle: str, first_line: int = 0) -> int:
+        """Number of the first line from `first_line` on that contains needle, or -1"""
+        starts = self.line_starts()
+        if first_line >= len(starts):
+            return -1
+        position = self.find(needle, starts[max(first_line, 0)])
+        if position == -1:
+            return -1
+        return bisect_right(starts, position) - 1
+
+    def __iter__(self) -> Iterator[str]:
+        data, find = self.data, self.data.find
+        position = 0
+        while position < len(data):
+            end = find(b'\n', position)
+            if end == -1:
+                end = len(data)
+            yield self._strip(data[position:end])
+            position = end + 1
+
+    @staticmethod
+    def _strip(line: bytes) -> str:
+        return line.rstrip(b'\r').decode('utf-8', errors='replace')
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = None
+
+    def __str__(self) -> str:
+        return f"<petakanFile: {self.path}>"
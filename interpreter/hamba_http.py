@@ -0,0 +1,81 @@
+"""
+HambaLang v2 - HTTP Session Pool
+httpGet/httpPost go through one requests.Session per scheme and host, so
+repeated calls to the same server reuse kept-alive TCP/TLS connections
+instead of opening a new one per request. Every session shares the pool
+size, default headers and timeout set with `aturHTTP`.
+"""
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Optional dependency
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+# Kept-alive connections per host
+DEFAULT_POOL_SIZE = 10
+
+# Seconds to wait for a server
+DEFAULT_TIMEOUT = 10
+
+
+class SessionPool:
+    """requests.Session per (scheme, host:port), created on first use"""
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT,
+                 headers: Optional[Dict[str, str]] = None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.headers: Dict[str, str] = dict(headers or {})
+        self._sessions: Dict[Tuple[str, str], Any] = {}
+        self._requests: Dict[Tuple[str, str], int] = {}
+
+    def configure(self, pool_size: Optional[int] = None, timeout: Optional[float] = None,
+                  headers: Optional[Dict[str, str]] = None):
+        """Change the settings; open sessions are closed so new ones pick them up"""
+        if pool_size is not None:
+            if pool_size < 1:
+                raise Exception("Ukuran pool HTTP harus positif")
+            self.pool_size = pool_size
+        if timeout is not None:
+            if timeout <= 0:
+                raise Exception("Timeout HTTP harus positif")
+            self.timeout = timeout
+        if headers is not None:
+            self.headers = dict(headers)
+        self.close()
+
+    def session_for(self, url: str):
+        if not HAS_REQUESTS:
+            raise Exception("Library 'requests' tidak terinstall")
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        session = self._sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(self.headers)
+            self._sessions[key] = session
+            self._requests[key] = 0
+        self._requests[key] += 1
+        return session
+
+    def request(self, method: str, url: str, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session_for(url).request(method, url, **kwargs)
+
+    def close(self):
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+        self._requests.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Requests sent through each open session, keyed by "scheme://host" """
+        return {f"{scheme}://{host}": count for (scheme, host), count in self._requests.items()}
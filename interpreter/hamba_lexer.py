@@ -0,0 +1,176 @@
+"""
+HambaLang Lexer
+Single-pass tokenizer shared by every front end (hamba.py, hamba_v2,
+hamba_advanced). A whole file is tokenized once into a flat stream of
+tokens carrying line and column positions.
+"""
+import re
+from typing import List, NamedTuple, Optional
+
+
+class HambaError(Exception):
+    """Error tagged with the source position that caused it"""
+
+    def __init__(self, message: str, line: Optional[int] = None, col: Optional[int] = None):
+        self.message = message
+        self.line = line
+        self.col = col
+        if line is not None and col is not None:
+            message = f"Error pada baris {line}, kolom {col}: {message}"
+        elif line is not None:
+            message = f"Error pada baris {line}: {message}"
+        super().__init__(message)
+
+
+class LexError(HambaError):
+    pass
+
+
+class Token(NamedTuple):
+    kind: str     # 'number', 'string', 'name', 'op', 'newline' or 'end'
+    text: str     # exact source text (strings keep their quotes)
+    line: int
+    col: int
+    offset: int   # index of the first character in the source
+
+
+TOKEN_RE = re.compile(r'''
+    (?P<newline>\n)
+  | (?P<ws>[ \t\r\f\v]+)
+  | (?P<comment>//[^\n]*)
+  | (?P<number>\d+\.\d+|\d+)
+  | (?P<string>"[^"]*"|'[^']*')
+  | (?P<name>[A-Za-z_]\w*)
+  | (?P<op>==|!=|<=|>=|[-+*/%<>=()\[\]{},:.@])
+''', re.X)
+
+OPENERS = '([{'
+CLOSERS = ')]}'
+
+
+def tokenize(source: str, newlines: bool = True) -> List[Token]:
+    """Tokenize source in a single pass.
+
+    With newlines=True a 'newline' token ends each logical line; line
+    breaks inside brackets do not end a line, so literals may span lines.
+    The stream always ends with an 'end' token.
+    """
+    tokens: List[Token] = []
+    append = tokens.append
+    match_at = TOKEN_RE.match
+    pos = 0
+    line = 1
+    line_start = 0
+    depth = 0
+    length = len(source)
+
+    while pos < length:
+        match = match_at(source, pos)
+        if match is None:
+            col = pos - line_start + 1
+            char = source[pos]
+            if char in ('"', "'"):
+                raise LexError("String tidak ditutup", line, col)
+            raise LexError(f"Karakter tidak dikenal: {char!r}", line, col)
+
+        kind = match.lastgroup
+        end = match.end()
+
+        if kind == 'newline':
+            if newlines and depth <= 0 and tokens and tokens[-1].kind != 'newline':
+                append(Token('newline', '\n', line, pos - line_start + 1, pos))
+            line += 1
+            line_start = end
+        elif kind == 'string':
+            text = match.group()
+            append(Token(kind, text, line, pos - line_start + 1, pos))
+            breaks = text.count('\n')
+            if breaks:
+                line += breaks
+                line_start = pos + text.rindex('\n') + 1
+        elif kind != 'ws' and kind != 'comment':
+            text = match.group()
+            if kind == 'op':
+                if text in OPENERS:
+                    depth += 1
+                elif text in CLOSERS:
+                    depth -= 1
+            append(Token(kind, text, line, pos - line_start + 1, pos))
+
+        pos = end
+
+    if newlines and tokens and tokens[-1].kind != 'newline':
+        append(Token('newline', '\n', line, pos - line_start + 1, pos))
+    append(Token('end', '', line, pos - line_start + 1, pos))
+    return tokens
+
+
+def split_lines(tokens: List[Token]) -> List[List[Token]]:
+    """Group a token stream into logical lines (newline/end tokens dropped)"""
+    lines = []
+    current: List[Token] = []
+    for token in tokens:
+        if token.kind == 'newline' or token.kind == 'end':
+            if current:
+                lines.append(current)
+                current = []
+        else:
+            current.append(token)
+    return lines
+
+
+def split_top_level(tokens: List[Token], sep: str = ',') -> List[List[Token]]:
+    """Split tokens on an operator, ignoring separators nested in brackets"""
+    parts: List[List[Token]] = []
+    depth = 0
+    last = 0
+    for i, token in enumerate(tokens):
+        if token.kind != 'op':
+            continue
+        if token.text in OPENERS:
+            depth += 1
+        elif token.text in CLOSERS:
+            depth -= 1
+        elif token.text == sep and depth == 0:
+            parts.append(tokens[last:i])
+            last = i + 1
+    if last < len(tokens) or parts:
+        parts.append(tokens[last:])
+    return parts
+
+
+def matching_close(tokens: List[Token], start: int) -> int:
+    """Index of the token closing the bracket at tokens[start], or -1"""
+    depth = 0
+    for i in range(start, len(tokens)):
+        token = tokens[i]
+        if token.kind != 'op':
+            continue
+        if token.text in OPENERS:
+            depth += 1
+        elif token.text in CLOSERS:
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def find_name(tokens: List[Token], name: str, start: int = 0) -> int:
+    """Index of the first top-level name token equal to name, or -1"""
+    depth = 0
+    for i in range(start, len(tokens)):
+        token = tokens[i]
+        if token.kind == 'op':
+            if token.text in OPENERS:
+                depth += 1
+            elif token.text in CLOSERS:
+                depth -= 1
+        elif token.kind == 'name' and token.text == name and depth == 0:
+            return i
+    return -1
+
+
+def span(source: str, tokens: List[Token]) -> str:
+    """Exact source text covered by a non-empty token slice"""
+    first, last = tokens[0], tokens[-1]
+    return source[first.offset:last.offset + len(last.text)]
@@ -0,0 +1,68 @@
+"""
+HambaLang v2 - Function Memoization
+Bounded result tables for functions that are pure (found by the purity
+analysis in hamba_ast, or declared `@murni`). Only calls whose arguments
+are plain numbers, strings, booleans or `kosong` are cached, and only
+results of those types are stored, so no cached value can be mutated.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_MEMO_SIZE = 1024
+
+# Sentinel returned by MemoTable.lookup() on a miss
+MISSING = object()
+
+KEY_TYPES = frozenset((bool, int, float, str, type(None)))
+
+
+def memo_key(args: List[Any]) -> Optional[Tuple]:
+    """Hashable key for an argument list, or None if it cannot be cached.
+
+    Types are part of the key: 1, 1.0 and benar compare equal in Python
+    but print differently in HambaLang.
+    """
+    for arg in args:
+        if type(arg) not in KEY_TYPES:
+            return None
+    return (*args, *map(type, args))
+
+
+class MemoTable:
+    """LRU table of one function's results keyed by memo_key()"""
+    __slots__ = ('maxsize', 'hits', 'misses', '_entries')
+
+    def __init__(self, maxsize: int = DEFAULT_MEMO_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple, Any]' = OrderedDict()
+
+    def lookup(self, key: Tuple) -> Any:
+        value = self._entries.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def store(self, key: Tuple, value: Any):
+        if type(value) not in KEY_TYPES:
+            return
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
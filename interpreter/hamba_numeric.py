@@ -0,0 +1,154 @@
+"""
+HambaLang v2 - Packed Numeric Arrays
+The value behind `angkaArray`: float64 numbers stored contiguously as an
+array('d'), or as a NumPy ndarray when NumPy is installed. Arithmetic with
+a number or another array of the same length, reductions and slicing work
+on the whole array instead of going through the interpreter loop.
+"""
+import operator
+from array import array
+from itertools import repeat
+from typing import Any, Callable, Iterable, Iterator, List, Union
+
+# Optional backend
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    numpy = None
+    HAS_NUMPY = False
+
+Number = Union[int, float]
+
+SCALAR_TYPES = (int, float)  # bool is an int, so benar/salah count as 1/0
+
+
+class NumericArray:
+    """Fixed-type float64 array; elementwise operators return new arrays"""
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    @classmethod
+    def filled(cls, count: int, value: Number = 0) -> 'NumericArray':
+        if count < 0:
+            raise Exception("angkaArray() butuh jumlah yang tidak negatif")
+        if HAS_NUMPY:
+            return cls(numpy.full(count, float(value)))
+        return cls(array('d', [float(value)]) * count)
+
+    @classmethod
+    def from_values(cls, values: Iterable[Number]) -> 'NumericArray':
+        if HAS_NUMPY:
+            return cls(numpy.array(list(values), dtype=numpy.float64))
+        return cls(array('d', values))
+
+    # Sequence protocol: panjang(), indexing and `untuk ... dalam`
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[float]:
+        if HAS_NUMPY:
+            return iter(self.data.tolist())
+        return iter(self.data)
+
+    def __getitem__(self, index: int) -> float:
+        return float(self.data[index])
+
+    def __setitem__(self, index: int, value: Number):
+        self.data[index] = value
+
+    def tolist(self) -> List[float]:
+        return self.data.tolist()
+
+    def slice(self, start: int, end: Union[int, None] = None) -> 'NumericArray':
+        part = self.data[start:end]
+        # NumPy slices are views; array('d') slices are already copies
+        return NumericArray(part.copy() if HAS_NUMPY else part)
+
+    # Reductions
+    def sum(self) -> float:
+        return float(self.data.sum()) if HAS_NUMPY else sum(self.data)
+
+    def min(self) -> float:
+        return float(self.data.min()) if HAS_NUMPY else min(self.data)
+
+    def max(self) -> float:
+        return float(self.data.max()) if HAS_NUMPY else max(self.data)
+
+    def mean(self) -> float:
+        return self.sum() / len(self.data)
+
+    # Elementwise arithmetic
+    def _apply(self, op: Callable[[Any, Any], Any], other: Any, reflected: bool = False) -> 'NumericArray':
+        if isinstance(other, NumericArray):
+            if len(other) != len(self):
+                raise Exception(f"Panjang angkaArray berbeda: {len(self)} dan {len(other)}")
+            other = other.data
+        elif isinstance(other, SCALAR_TYPES):
+            other = float(other)
+        else:
+            raise Exception("Operasi angkaArray butuh angka atau angkaArray")
+        left, right = (other, self.data) if reflected else (self.data, other)
+
+        if HAS_NUMPY:
+            try:
+                with numpy.errstate(divide='raise', invalid='raise'):
+                    return NumericArray(op(left, right))
+            except FloatingPointError:
+                raise ZeroDivisionError("float division by zero") from None
+        left = repeat(left) if isinstance(left, float) else left
+        right = repeat(right) if isinstance(right, float) else right
+        return NumericArray(array('d', map(op, left, right)))
+
+    def __add__(self, other):
+        return self._apply(operator.add, other)
+
+    def __radd__(self, other):
+        return self._apply(operator.add, other, reflected=True)
+
+    def __sub__(self, other):
+        return self._apply(operator.sub, other)
+
+    def __rsub__(self, other):
+        return self._apply(operator.sub, other, reflected=True)
+
+    def __mul__(self, other):
+        return self._apply(operator.mul, other)
+
+    def __rmul__(self, other):
+        return self._apply(operator.mul, other, reflected=True)
+
+    def __truediv__(self, other):
+        return self._apply(operator.truediv, other)
+
+    def __rtruediv__(self, other):
+        return self._apply(operator.truediv, other, reflected=True)
+
+    def __mod__(self, other):
+        return self._apply(operator.mod, other)
+
+    def __rmod__(self, other):
+        return self._apply(operator.mod, other, reflected=True)
+
+    def __neg__(self):
+        return NumericArray(-self.data) if HAS_NUMPY else NumericArray(array('d', map(operator.neg, self.data)))
+
+    def __pos__(self):
+        return self
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, NumericArray):
+            return False
+        if HAS_NUMPY:
+            return bool(numpy.array_equal(self.data, other.data))
+        return self.data == other.data
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"NumericArray({self.tolist()!r})"
@@ -0,0 +1,71 @@
+"""
+HambaLang Output Sink
+Buffered destination for `lapor` output. Lines are written to the stream
+in batches (flushed by size or age) and the most recent lines are kept
+in an optionally bounded capture for get_output().
+"""
+import sys
+import time
+from collections import deque
+from typing import Deque, List, Optional, TextIO
+
+
+class OutputSink:
+    """Buffered writer with an optional ring-buffer capture and quiet mode"""
+
+    def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = 8192,
+                 flush_interval: float = 0.1, max_lines: Optional[int] = None,
+                 max_chars: Optional[int] = None, quiet: bool = False):
+        # None means sys.stdout at flush time, so redirection keeps working
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self.quiet = quiet
+
+        self.lines: Deque[str] = deque()
+        self._captured_chars = 0
+        self._capture = max_lines != 0 and max_chars != 0
+        self._bounded = max_lines is not None or max_chars is not None
+
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, message: str):
+        if self._capture:
+            self.lines.append(message)
+            if self._bounded:
+                self._captured_chars += len(message) + 1
+                self._trim()
+
+        if not self.quiet:
+            self._pending.append(message)
+            self._pending_chars += len(message) + 1
+            if self._pending_chars >= self.buffer_size or \
+                    time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def _trim(self):
+        """Drop the oldest captured lines until the limits hold again"""
+        lines = self.lines
+        while lines and ((self.max_lines is not None and len(lines) > self.max_lines) or
+                         (self.max_chars is not None and self._captured_chars > self.max_chars)):
+            self._captured_chars -= len(lines.popleft()) + 1
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._pending_chars = 0
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(pending) + "\n")
+            stream.flush()
+
+    def getvalue(self) -> str:
+        return "\n".join(self.lines)
+
+    def clear(self):
+        self.lines.clear()
+        self._captured_chars = 0
@@ -22,24 +22,61 @@ import random
 import re
 import json
 import os
-import sqlite3
-import csv
+import operator
+import itertools
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-# Optional imports for extended features
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
-
-try:
-    import mysql.connector
-    HAS_MYSQL = True
-except ImportError:
-    HAS_MYSQL = False
+if __package__:
+    from .hamba_ast import (
+        HambaError, Parser, Node, Ref, RESERVED_GLOBALS, resolve, find_functions, PurityAnalyzer,
+        FunctionDef, GlobalStmt, IfStmt, WhileStmt, ForRangeStmt, ForEachStmt,
+        ReturnStmt, BreakStmt, ContinueStmt, PrintStmt, AssignStmt, IndexAssignStmt, ExprStmt,
+        MangkrakStmt, KorupsiStmt, RapatInfiniteStmt, SelesaiStmt,
+        FileWriteStmt, FileReadStmt, DbConnectStmt, DbQueryStmt, DbStreamStmt, DbBatchStmt, DbCloseStmt,
+        TransactionStmt, DbTransactionStmt,
+        HttpGetStmt, HttpPostStmt,
+    )
+    from .hamba_expr import (
+        ExpressionCache, parse_expression, fold_constants, make_copier, Expr,
+        Const, Var, ListExpr, DictExpr, IndexExpr, CallExpr, UnaryExpr, BinaryExpr, Template,
+    )
+    from .hamba_numeric import NumericArray
+    from .hamba_memo import MemoTable, memo_key, MISSING, DEFAULT_MEMO_SIZE
+    from .hamba_output import OutputSink
+    from .hamba_files import (
+        FileStream, LineReader, ChunkReader, CsvReader, JsonLinesReader, MappedFile, FileHandle, write_csv,
+        DEFAULT_BUFFER_SIZE, DEFAULT_CHUNK_SIZE,
+    )
+    from .hamba_http import SessionPool
+    from .hamba_db import ConnectionPool, ResultSet, Row, sqlite_pragmas, DB_TYPE_NAMES, DEFAULT_FETCH_SIZE
+    from .hamba_budget import Budget, BudgetExhausted
+else:
+    from hamba_ast import (
+        HambaError, Parser, Node, Ref, RESERVED_GLOBALS, resolve, find_functions, PurityAnalyzer,
+        FunctionDef, GlobalStmt, IfStmt, WhileStmt, ForRangeStmt, ForEachStmt,
+        ReturnStmt, BreakStmt, ContinueStmt, PrintStmt, AssignStmt, IndexAssignStmt, ExprStmt,
+        MangkrakStmt, KorupsiStmt, RapatInfiniteStmt, SelesaiStmt,
+        FileWriteStmt, FileReadStmt, DbConnectStmt, DbQueryStmt, DbStreamStmt, DbBatchStmt, DbCloseStmt,
+        TransactionStmt, DbTransactionStmt,
+        HttpGetStmt, HttpPostStmt,
+    )
+    from hamba_expr import (
+        ExpressionCache, parse_expression, fold_constants, make_copier, Expr,
+        Const, Var, ListExpr, DictExpr, IndexExpr, CallExpr, UnaryExpr, BinaryExpr, Template,
+    )
+    from hamba_numeric import NumericArray
+    from hamba_memo import MemoTable, memo_key, MISSING, DEFAULT_MEMO_SIZE
+    from hamba_output import OutputSink
+    from hamba_files import (
+        FileStream, LineReader, ChunkReader, CsvReader, JsonLinesReader, MappedFile, FileHandle, write_csv,
+        DEFAULT_BUFFER_SIZE, DEFAULT_CHUNK_SIZE,
+    )
+    from hamba_http import SessionPool
+    from hamba_db import ConnectionPool, ResultSet, Row, sqlite_pragmas, DB_TYPE_NAMES, DEFAULT_FETCH_SIZE
+    from hamba_budget import Budget, BudgetExhausted
 
+# Optional imports for extended features
 try:
     import psycopg2
     HAS_POSTGRES = True
@@ -47,742 +84,1516 @@ except ImportError:
     HAS_POSTGRES = False
 
 
+# Marks a slot that has not been assigned yet
+UNSET = object()
+
+# Exact types that take the numeric fast paths (bool is deliberately excluded)
+NUMERIC_TYPES = frozenset((int, float))
+
+
+def to_number(value: Any) -> Union[int, float, NumericArray]:
+    """Convert a value to a number, keeping integers as ints.
+    
+    Packed arrays pass through unchanged so the arithmetic operators apply elementwise.
+    """
+    if type(value) in NUMERIC_TYPES:
+        return value
+    if isinstance(value, bool):
+        return 1 if value else 0
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            return float(text)
+        except ValueError:
+            return 0
+    if isinstance(value, (int, float, NumericArray)):
+        return value
+    return 0
+
+
+def divide(left: Any, right: Any) -> Union[int, float]:
+    """`/` stays an int when both sides are ints and it divides exactly"""
+    left, right = to_number(left), to_number(right)
+    if type(left) is int and type(right) is int and right and left % right == 0:
+        return left // right
+    return left / right
+
+
+def multiply(left: Any, right: Any) -> Any:
+    """`*` on numbers, or repeats a string by an integer count (`"=" * 50`)"""
+    if type(left) in NUMERIC_TYPES and type(right) in NUMERIC_TYPES:
+        return left * right
+    if isinstance(left, str) and type(right) is int:
+        return left * right
+    if isinstance(right, str) and type(left) is int:
+        return right * left
+    return to_number(left) * to_number(right)
+
+
+def numeric(fn: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """Wrap a numeric operator with an int/float fast path that skips conversion"""
+    def apply(left, right):
+        if type(left) in NUMERIC_TYPES and type(right) in NUMERIC_TYPES:
+            return fn(left, right)
+        return fn(to_number(left), to_number(right))
+    return apply
+
+
+class Frame:
+    """Slot array of one function call; unset slots read through to globals"""
+    __slots__ = ('function', 'slots')
+    
+    def __init__(self, function: FunctionDef, slots: List[Any]):
+        self.function = function
+        self.slots = slots
+
+
 class HambaRuntime:
-    def __init__(self):
-        # Built-in state (satire variables)
-        self.anggaran = 1_000_000_000
-        self.status_proyek = "Direncanakan"
-        self.progress = 0
+    def __init__(self, sink: Optional[OutputSink] = None):
+        # Global slot table; the built-in satire variables sit in reserved slots
+        self.globals: List[Any] = [1_000_000_000, "Direncanakan", 0]
+        self.global_index: Dict[str, int] = {name: i for i, name in enumerate(RESERVED_GLOBALS)}
         
-        # User variables
-        self.variables = {}
+        # Active call frames and the scope id of the innermost one
+        self.frames: List[Frame] = []
+        self.frame: Optional[Frame] = None
+        self.scope = 0
         
         # Functions
         self.functions = {}
         
-        # Output
-        self.output = []
+        # Output (buffered; see OutputSink for capture limits and quiet mode)
+        self.sink = sink or OutputSink()
         self.terminated = False
         
-        # Loop control
-        self.break_loop = False
-        self.continue_loop = False
-        
-        # Database connections
+        # Database connections by sambungDB name, drawn from a pool keyed by path
         self.db_connections = {}
+        self.db_pool = ConnectionPool()
+        # queryStream results whose cursors may still be open
+        self.result_sets: List[ResultSet] = []
         
-        # Function return value
-        self.return_value = None
-        self.has_return = False
+        # HTTP sessions by host, reused by httpGet/httpPost until the program ends
+        self.http = SessionPool()
+        
+        # Handles opened by bukaFile and maps made by petakanFile, not yet closed
+        self.open_files: List[FileHandle] = []
+        self.mapped_files: List[MappedFile] = []
+    
+    def close_files(self):
+        """Flush and close every bukaFile handle and unmap every petakanFile map still open"""
+        for handle in self.open_files:
+            handle.close()
+        self.open_files.clear()
+        for mapped in self.mapped_files:
+            mapped.close()
+        self.mapped_files.clear()
+    
+    def close_databases(self):
+        """Release every sambungDB name and close the connections no longer used"""
+        for result in self.result_sets:
+            result.close()
+        self.result_sets.clear()
+        for conn in self.db_connections.values():
+            self.db_pool.release(conn)
+        self.db_connections.clear()
+        self.db_pool.close_idle()
+    
+    def rollback_transactions(self):
+        """Roll back every transaction left open by an error or a missing commitDB"""
+        for name, conn in self.db_connections.items():
+            if conn.transaction_depth:
+                conn.rollback()
+                self.log(f"⚠️ Transaksi tanpa commit dibatalkan: {name}")
+    
+    # Built-in state (satire variables)
+    @property
+    def anggaran(self):
+        return self.globals[0]
+    
+    @anggaran.setter
+    def anggaran(self, value):
+        self.globals[0] = value
+    
+    @property
+    def status_proyek(self):
+        return self.globals[1]
+    
+    @status_proyek.setter
+    def status_proyek(self, value):
+        self.globals[1] = value
+    
+    @property
+    def progress(self):
+        return self.globals[2]
+    
+    @progress.setter
+    def progress(self, value):
+        self.globals[2] = value
+    
+    @property
+    def variables(self) -> Dict[str, Any]:
+        """Snapshot of the user-defined global variables"""
+        reserved = len(RESERVED_GLOBALS)
+        return {
+            name: self.globals[slot]
+            for name, slot in self.global_index.items()
+            if slot >= reserved and self.globals[slot] is not UNSET
+        }
+    
+    @property
+    def output(self) -> List[str]:
+        """Captured output lines (only the most recent ones if the sink is bounded)"""
+        return list(self.sink.lines)
     
     def log(self, message):
-        self.output.append(str(message))
-        print(message)
+        self.sink.write(str(message))
+    
+    def flush(self):
+        self.sink.flush()
     
     def get_output(self):
-        return "\n".join(self.output)
+        return self.sink.getvalue()
+    
+    def global_slot(self, name: str) -> int:
+        """Slot of a global variable, allocating it on first use"""
+        slot = self.global_index.get(name)
+        if slot is None:
+            slot = len(self.globals)
+            self.globals.append(UNSET)
+            self.global_index[name] = slot
+        return slot
+    
+    def load_global(self, slot: int, name: str) -> Any:
+        value = self.globals[slot]
+        if value is UNSET:
+            raise Exception(f"Variable '{name}' tidak ditemukan")
+        return value
+    
+    def store_global(self, slot: int, value: Any):
+        if slot == 1:
+            value = str(value)
+        elif slot < len(RESERVED_GLOBALS):
+            value = to_number(value)
+        self.globals[slot] = value
     
     def set_variable(self, name: str, value: Any):
-        # Update built-in variables
-        if name == 'anggaran':
-            self.anggaran = self._to_number(value)
-        elif name == 'status_proyek':
-            self.status_proyek = str(value)
-        elif name == 'progress':
-            self.progress = self._to_number(value)
-        else:
-            self.variables[name] = value
+        frame = self.frame
+        if frame is not None:
+            slot = frame.function.slots.get(name)
+            if slot is not None:
+                frame.slots[slot] = value
+                return
+        self.store_global(self.global_slot(name), value)
     
     def get_variable(self, name: str) -> Any:
-        # Check built-in variables
-        if name == 'anggaran':
-            return self.anggaran
-        elif name == 'status_proyek':
-            return self.status_proyek
-        elif name == 'progress':
-            return self.progress
-        elif name in self.variables:
-            return self.variables[name]
-        else:
+        frame = self.frame
+        if frame is not None:
+            slot = frame.function.slots.get(name)
+            if slot is not None and frame.slots[slot] is not UNSET:
+                return frame.slots[slot]
+        slot = self.global_index.get(name)
+        if slot is None or self.globals[slot] is UNSET:
             raise Exception(f"Variable '{name}' tidak ditemukan")
+        return self.globals[slot]
     
-    def _to_number(self, value: Any) -> float:
-        try:
-            return float(value)
-        except:
-            return 0.0
+    def push_frame(self, function: FunctionDef, slots: List[Any]) -> Frame:
+        frame = Frame(function, slots)
+        self.frames.append(frame)
+        self.frame = frame
+        self.scope = function.scope
+        return frame
+    
+    def pop_frame(self):
+        self.frames.pop()
+        if self.frames:
+            self.frame = self.frames[-1]
+            self.scope = self.frame.function.scope
+        else:
+            self.frame = None
+            self.scope = 0
+
+
+# `+`, `==` and `!=` work on any values; the rest are numeric
+BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.add,
+    '-': numeric(operator.sub),
+    '*': multiply,
+    '/': divide,
+    '%': numeric(operator.mod),
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': numeric(operator.lt),
+    '>': numeric(operator.gt),
+    '<=': numeric(operator.le),
+    '>=': numeric(operator.ge),
+}
+
+# Default limit on nested HambaLang calls (the interpreter no longer uses
+# the Python stack for them, so this is independent of sys.getrecursionlimit)
+DEFAULT_MAX_CALL_DEPTH = 5000
+
+# A compiled instruction: (opcode, argument, source line)
+Instruction = Tuple[str, Any, int]
+
+
+# `:nama` (SQLite) or `%(nama)s` (MySQL) placeholders bind parameters by name
+NAMED_PLACEHOLDER = re.compile(r":\w+|%\(\w+\)s")
+
+# Builtins without side effects; pure functions may call them
+PURE_BUILTINS = ('panjang', 'tipe', 'angka', 'teks', 'jumlah', 'minimum', 'maksimum', 'rataRata',
+                 'gabung', 'gabungTeks', 'potong', 'indeksDari', 'isiArray', 'angkaArray')
+
+# 'auto' memoizes functions the purity analysis accepts plus `@murni` ones,
+# 'murni' only the annotated ones, 'off' none
+MEMOIZE_MODES = ('auto', 'murni', 'off')
+
+# Marks a `transaksi` block on the compiler's loop stack, which
+# `hentikan`, `lanjut` and `kembalikan` may not jump out of
+TRANSACTION_BLOCK = object()
 
 
 class HambaInterpreter:
-    def __init__(self, runtime=None):
+    def __init__(self, runtime=None, expression_cache_size: int = 1024,
+                 max_call_depth: int = DEFAULT_MAX_CALL_DEPTH, budget: Optional[Budget] = None,
+                 memoize: str = 'auto', memo_size: int = DEFAULT_MEMO_SIZE):
         self.runtime = runtime or HambaRuntime()
+        # Fuel is charged per loop iteration (weighted by loop size) and per call
+        self.budget = budget or Budget()
+        self.expression_cache = ExpressionCache(self._compile_expression, expression_cache_size)
+        self.parsed_expressions: Dict[str, Expr] = {}
+        # Frame layout of every function scope seen so far; 0 is the global scope
+        self.scope_slots: Dict[int, Dict[str, int]] = {0: {}}
+        # Compiled instruction lists of function bodies, by scope id
+        self.function_code: Dict[int, List[Instruction]] = {}
+        self.max_call_depth = max_call_depth
+        
+        if memoize not in MEMOIZE_MODES:
+            raise ValueError(f"memoize harus salah satu dari {MEMOIZE_MODES}")
+        self.memoize = memoize
+        self.memo_size = memo_size
+        # Result tables of the currently defined pure functions, by name
+        self.memo_tables: Dict[str, MemoTable] = {}
+        self.pure_functions: set = set()
+        self.pure_builtins = set(PURE_BUILTINS)
+        
+        # Statements without a dedicated instruction: node type -> handler
+        self.statement_handlers: Dict[type, Callable[[Node], None]] = {
+            IndexAssignStmt: self._assign_index,
+            MangkrakStmt: self._exec_mangkrak,
+            KorupsiStmt: self._exec_korupsi,
+            RapatInfiniteStmt: lambda node: self._rapat_infinite(),
+            SelesaiStmt: lambda node: self._selesai(),
+            FileWriteStmt: self._handle_file_operation,
+            FileReadStmt: self._handle_file_operation,
+            DbConnectStmt: self._handle_db_operation,
+            DbQueryStmt: self._handle_db_operation,
+            DbStreamStmt: self._handle_db_operation,
+            DbBatchStmt: self._handle_db_operation,
+            DbTransactionStmt: self._handle_db_operation,
+            DbCloseStmt: self._handle_db_operation,
+            HttpGetStmt: self._handle_http_operation,
+            HttpPostStmt: self._handle_http_operation,
+        }
+        
+        # Built-in functions: name -> handler taking the evaluated arguments
+        self.builtins: Dict[str, Callable[[List[Any]], Any]] = {
+            'panjang': self._builtin_panjang,
+            'tipe': self._builtin_tipe,
+            'angka': self._builtin_angka,
+            'teks': self._builtin_teks,
+            'tambahArray': self._builtin_tambah_array,
+            'hapusArray': self._builtin_hapus_array,
+            'jumlah': self._builtin_jumlah,
+            'minimum': self._builtin_minimum,
+            'maksimum': self._builtin_maksimum,
+            'rataRata': self._builtin_rata_rata,
+            'urutkan': self._builtin_urutkan,
+            'peta': self._builtin_peta,
+            'saring': self._builtin_saring,
+            'gabung': self._builtin_gabung,
+            'gabungTeks': self._builtin_gabung_teks,
+            'tambahTeks': self._builtin_tambah_teks,
+            'potong': self._builtin_potong,
+            'indeksDari': self._builtin_indeks_dari,
+            'isiArray': self._builtin_isi_array,
+            'angkaArray': self._builtin_angka_array,
+            'kolom': self._builtin_kolom,
+            'bacaBaris': self._builtin_baca_baris,
+            'bacaPotongan': self._builtin_baca_potongan,
+            'petakanFile': self._builtin_petakan_file,
+            'barisKe': self._builtin_baris_ke,
+            'cariBaris': self._builtin_cari_baris,
+            'bacaCSV': self._builtin_baca_csv,
+            'tulisCSV': self._builtin_tulis_csv,
+            'bacaJSON': self._builtin_baca_json,
+            'tulisJSON': self._builtin_tulis_json,
+            'bacaJSONL': self._builtin_baca_jsonl,
+            'bukaFile': self._builtin_buka_file,
+            'tulis': self._builtin_tulis,
+            'tulisBaris': self._builtin_tulis_baris,
+            'tutupFile': self._builtin_tutup_file,
+            'aturHTTP': self._builtin_atur_http,
+        }
+    
+    def register_statement(self, node_type: type, handler: Callable[[Node], None]):
+        """Execute statements of node_type with handler(node)"""
+        self.statement_handlers[node_type] = handler
+    
+    def register_builtin(self, name: str, handler: Callable[[List[Any]], Any], pure: bool = False):
+        """Make name(...) call handler(args); register before executing code that uses it.
+        
+        Mark it pure if it has no side effects, so functions calling it can be memoized.
+        """
+        self.builtins[name] = handler
+        if pure:
+            self.pure_builtins.add(name)
+        else:
+            self.pure_builtins.discard(name)
+    
+    def memo_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counts of every memoized function"""
+        return {name: table.stats() for name, table in self.memo_tables.items()}
     
     def execute(self, code: str):
         """Execute HambaLang code"""
-        lines = code.split('\n')
-        self._execute_block(lines, 0, len(lines))
-    
-    def _execute_block(self, lines: List[str], start: int, end: int) -> int:
-        """Execute a block of code and return next line index"""
-        i = start
-        while i < end and not self.runtime.terminated:
-            if self.runtime.break_loop or self.runtime.continue_loop or self.runtime.has_return:
-                break
-            
-            line = lines[i].strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('//'):
-                i += 1
-                continue
-            
-            # Check for block statements
-            if line.startswith('fungsi '):
-                i = self._parse_function(lines, i)
-            elif line.startswith('jika '):
-                i = self._parse_if(lines, i)
-            elif line.startswith('selama '):
-                i = self._parse_while(lines, i)
-            elif line.startswith('untuk '):
-                i = self._parse_for(lines, i)
-            else:
-                try:
-                    self._execute_line(line)
-                except Exception as e:
-                    raise Exception(f"Error pada baris {i+1}: {str(e)}")
-                i += 1
-        
-        return i
+        self.budget.start()
+        try:
+            program = resolve(Parser(code).parse(), self.runtime.global_slot)
+            for source, tree in program.expressions.items():
+                self.parsed_expressions[source] = self._fold(tree)
+            if self.memoize == 'auto':
+                functions = find_functions(program.body) + list(self.runtime.functions.values())
+                analyzer = PurityAnalyzer(self._expression_tree, self.pure_builtins)
+                self.pure_functions = analyzer.analyze(functions)
+            self._run(self._compile_body(program.body, 0, {}))
+        finally:
+            self.budget.stop()
+            self.runtime.rollback_transactions()
+            self.runtime.close_databases()
+            self.runtime.close_files()
+            self.runtime.http.close()
+            self.runtime.flush()
     
-    def _execute_line(self, line: str):
-        """Execute a single line of code"""
-        
-        # Return statement
-        if line.startswith('kembalikan '):
-            expr = line[11:].strip()
-            self.runtime.return_value = self._eval_expression(expr)
-            self.runtime.has_return = True
-            return
-        
-        # Break
-        if line == 'hentikan':
-            self.runtime.break_loop = True
-            return
-        
-        # Continue
-        if line == 'lanjut':
-            self.runtime.continue_loop = True
-            return
-        
-        # lapor / print
-        if line.startswith('lapor ') or line.startswith('print '):
-            content = line.split(' ', 1)[1].strip()
-            message = self._eval_expression(content)
-            self.runtime.log(self._to_string(message))
-            return
-        
-        # Mangkrak(ms)
-        match = re.match(r'Mangkrak\((.+?)\)', line)
-        if match:
-            ms = self._eval_expression(match.group(1))
-            self._mangkrak(self._to_number(ms))
-            return
-        
-        # Korupsi(percent)
-        match = re.match(r'Korupsi\((.+?)\)', line)
-        if match:
-            percent = self._eval_expression(match.group(1))
-            self._korupsi(self._to_number(percent))
-            return
-        
-        # RapatInfinite()
-        if line == 'RapatInfinite()':
-            self._rapat_infinite()
-            return
-        
-        # selesai() or selesai
-        if line == 'selesai()' or line == 'selesai':
-            self._selesai()
-            return
-        
-        # File operations
-        if line.startswith('tulisFile(') or line.startswith('bacaFile('):
-            self._handle_file_operation(line)
-            return
-        
-        # Database operations
-        if line.startswith('sambungDB(') or line.startswith('queryDB(') or line.startswith('tutupDB('):
-            self._handle_db_operation(line)
-            return
-        
-        # HTTP operations
-        if line.startswith('httpGet(') or line.startswith('httpPost('):
-            self._handle_http_operation(line)
-            return
-        
-        # Function call (user-defined or built-in)
-        func_name_match = re.match(r'^(\w+)\s*\(', line)
-        if func_name_match:
-            func_name = func_name_match.group(1)
-            # User-defined functions
-            if func_name in self.runtime.functions:
-                args_str = self._extract_function_args(line, line.index('(') + 1)
-                args = self._parse_arguments(args_str) if args_str.strip() else []
-                self._call_function(func_name, args)
-                return
-            # Built-in functions (just evaluate as expression, may have side effects)
-            elif func_name in ['tambahArray', 'hapusArray', 'panjang', 'tipe', 'angka', 'teks']:
-                self._eval_expression(line)
-                return
-        
-        # Variable assignment
-        if '=' in line and not any(op in line for op in ['==', '!=', '<=', '>=', '<', '>']):
-            self._assign_variable(line)
-            return
-        
-        raise Exception(f"Syntax tidak dikenali: {line}")
+    # =====================
+    # Code generation
+    # =====================
+    def _compile_body(self, body: List[Node], scope: int, slots: Dict[str, int]) -> List[Instruction]:
+        """Flatten a statement list into instructions for the execution loop"""
+        code: List[list] = []
+        self._emit_block(body, code, scope, slots, [])
+        code.append(['RETURN', False, body[-1].line if body else 0])
+        return [tuple(instruction) for instruction in code]
     
-    def _parse_function(self, lines: List[str], start: int) -> int:
-        """Parse function definition"""
-        line = lines[start].strip()
-        
-        # fungsi namaFungsi(param1, param2)
-        match = re.match(r'fungsi\s+(\w+)\s*\(([^)]*)\)', line)
-        if not match:
-            raise Exception("Format fungsi salah. Gunakan: fungsi nama(param1, param2)")
-        
-        func_name = match.group(1)
-        params_str = match.group(2).strip()
-        params = [p.strip() for p in params_str.split(',')] if params_str else []
-        
-        # Find function body (until 'akhir')
-        body_start = start + 1
-        body_end = body_start
-        indent_level = 0
-        
-        for i in range(body_start, len(lines)):
-            line = lines[i].strip()
-            if line == 'akhir':
-                if indent_level == 0:
-                    body_end = i
-                    break
-                else:
-                    indent_level -= 1
-            elif line.startswith('fungsi ') or line.startswith('jika ') or line.startswith('selama '):
-                indent_level += 1
-        
-        if body_end == body_start:
-            raise Exception(f"Function {func_name} tidak memiliki 'akhir'")
-        
-        # Store function
-        self.runtime.functions[func_name] = {
-            'params': params,
-            'body': lines[body_start:body_end]
-        }
-        
-        return body_end + 1
+    def _emit_block(self, body: List[Node], code: List[list], scope: int,
+                    slots: Dict[str, int], loops: List[Tuple[List[int], List[int], int]]):
+        for node in body:
+            self._emit_statement(node, code, scope, slots, loops)
     
-    def _parse_if(self, lines: List[str], start: int) -> int:
-        """Parse if/elif/else statement"""
-        i = start
-        executed = False
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if line.startswith('jika '):
-                # jika condition
-                condition = line[5:].strip()
-                result = self._eval_expression(condition)
-                
-                # Find block end
-                block_end = self._find_block_end(lines, i + 1, ['ataujika', 'atau', 'akhir'])
-                
-                if self._to_boolean(result) and not executed:
-                    self._execute_block(lines, i + 1, block_end)
-                    executed = True
-                
-                i = block_end
-                
-            elif line.startswith('ataujika '):
-                # elif condition
-                condition = line[8:].strip()
-                result = self._eval_expression(condition)
-                
-                block_end = self._find_block_end(lines, i + 1, ['ataujika', 'atau', 'akhir'])
-                
-                if self._to_boolean(result) and not executed:
-                    self._execute_block(lines, i + 1, block_end)
-                    executed = True
-                
-                i = block_end
-                
-            elif line == 'atau':
-                # else
-                block_end = self._find_block_end(lines, i + 1, ['akhir'])
-                
-                if not executed:
-                    self._execute_block(lines, i + 1, block_end)
-                
-                i = block_end
-                
-            elif line == 'akhir':
-                return i + 1
+    def _emit_statement(self, node: Node, code: List[list], scope: int,
+                        slots: Dict[str, int], loops: List[Tuple[List[int], List[int], int]]):
+        line = node.line
+        emit = code.append
+        
+        if isinstance(node, AssignStmt):
+            value = self._expression_closure(node.expr, scope, slots)
+            if value is not None:
+                assign = self._compile_self_append(node, slots) or self._compile_assignment(node.ref, value)
+                emit(['STMT', assign, line])
             else:
-                i += 1
-        
-        return i
+                self._emit_expression(node.expr, code, line, scope, slots)
+                emit(['STORE', node.ref, line])
+        elif isinstance(node, PrintStmt):
+            value = self._expression_closure(node.expr, scope, slots)
+            if value is not None:
+                log, to_string = self.runtime.log, self._to_string
+                emit(['STMT', lambda: log(to_string(value())), line])
+            else:
+                self._emit_expression(node.expr, code, line, scope, slots)
+                emit(['PRINT', None, line])
+        elif isinstance(node, ExprStmt):
+            value = self._expression_closure(node.expr, scope, slots)
+            if value is not None:
+                emit(['STMT', value, line])
+            else:
+                self._emit_expression(node.expr, code, line, scope, slots)
+                emit(['POP', 1, line])
+        elif isinstance(node, ReturnStmt):
+            if TRANSACTION_BLOCK in loops:
+                raise HambaError("'kembalikan' tidak boleh di dalam blok 'transaksi'", line)
+            if node.expr:
+                self._emit_expression(node.expr, code, line, scope, slots)
+            emit(['RETURN', bool(node.expr), line])
+        elif isinstance(node, IfStmt):
+            exits = []
+            for condition, branch in node.branches:
+                test = self._emit_test(condition, code, line, scope, slots)
+                self._emit_block(branch, code, scope, slots, loops)
+                exits.append(len(code))
+                emit(['JUMP', None, line])
+                self._patch_test(code, test, len(code))
+            if node.else_body is not None:
+                self._emit_block(node.else_body, code, scope, slots, loops)
+            for jump in exits:
+                code[jump][1] = len(code)
+        elif isinstance(node, WhileStmt):
+            top = len(code)
+            test = self._emit_test(node.condition, code, line, scope, slots)
+            self._emit_loop_body(node.body, code, scope, slots, loops, top, test, state=0)
+        elif isinstance(node, ForRangeStmt):
+            self._emit_expression(node.start, code, line, scope, slots)
+            self._emit_expression(node.end, code, line, scope, slots)
+            emit(['RANGE_PREP', None, line])
+            top = len(code)
+            emit(['RANGE_NEXT', None, line])
+            self._emit_loop_body(node.body, code, scope, slots, loops, top, top, node.ref, 2)
+        elif isinstance(node, ForEachStmt):
+            self._emit_expression(node.iterable, code, line, scope, slots)
+            emit(['ITER_PREP', None, line])
+            top = len(code)
+            emit(['ITER_NEXT', None, line])
+            self._emit_loop_body(node.body, code, scope, slots, loops, top, top, node.ref, 1)
+        elif isinstance(node, (BreakStmt, ContinueStmt)):
+            if not loops or loops[-1] is TRANSACTION_BLOCK:
+                keyword = 'hentikan' if isinstance(node, BreakStmt) else 'lanjut'
+                if any(loop is not TRANSACTION_BLOCK for loop in loops):
+                    raise HambaError(f"'{keyword}' tidak boleh keluar dari blok 'transaksi'", line)
+                raise HambaError(f"'{keyword}' hanya boleh di dalam loop", line)
+            breaks, continues, _ = loops[-1]
+            if isinstance(node, BreakStmt):
+                breaks.append(len(code))
+                emit(['JUMP', None, line])
+            else:
+                continues.append(len(code))
+                emit(['LOOP', None, line])
+        elif isinstance(node, TransactionStmt):
+            # Commits once at `akhir`; errors roll back in execute()
+            emit(['EXEC', (self._begin_transaction, node), line])
+            loops.append(TRANSACTION_BLOCK)
+            self._emit_block(node.body, code, scope, slots, loops)
+            loops.pop()
+            emit(['EXEC', (self._commit_transaction, node), line])
+        elif isinstance(node, FunctionDef):
+            # Compiled with the enclosing code, so errors in its body surface at load time
+            self.scope_slots[node.scope] = node.slots
+            self._function_code(node)
+            emit(['DEFINE', node, line])
+        elif isinstance(node, GlobalStmt):
+            pass  # applied by the resolver
+        else:
+            handler = self.statement_handlers.get(type(node))
+            if handler is None:
+                raise HambaError(f"Node tidak dikenali: {node}", line)
+            emit(['EXEC', (handler, node), line])
     
-    def _parse_while(self, lines: List[str], start: int) -> int:
-        """Parse while loop"""
-        line = lines[start].strip()
-        condition = line[7:].strip()
-        
-        # Find loop body
-        body_start = start + 1
-        body_end = self._find_block_end(lines, body_start, ['akhir'])
-        
-        # Execute loop
-        max_iterations = 10000  # Safety limit
-        iterations = 0
-        
-        while self._to_boolean(self._eval_expression(condition)) and iterations < max_iterations:
-            self.runtime.break_loop = False
-            self.runtime.continue_loop = False
-            
-            self._execute_block(lines, body_start, body_end)
+    def _emit_loop_body(self, body, code, scope, slots, loops, top: int, test: int,
+                        ref: Optional[Ref] = None, state: int = 1):
+        """Emit a loop body closed by a fuel-charging back-edge.
+
+        `test` exits to the cleanup that drops `state` stack values.
+        """
+        breaks: List[int] = []
+        continues: List[int] = []
+        loops.append((breaks, continues, top))
+        self._emit_block(body, code, scope, slots, loops)
+        loops.pop()
+        line = code[test][2]
+        # One iteration costs at most the instructions between top and back-edge
+        back_edge = (top, len(code) + 1 - top)
+        code.append(['LOOP', back_edge, line])
+        for jump in continues:
+            code[jump][1] = back_edge
+        end = len(code)
+        if state:
+            code.append(['POP', state, line])
+        if ref is None:
+            self._patch_test(code, test, end)
+        else:
+            code[test][1] = (ref, end)
+        for jump in breaks:
+            code[jump][1] = end
+    
+    def _expression_closure(self, source: str, scope: int,
+                            slots: Dict[str, int]) -> Optional[Callable[[], Any]]:
+        """Compiled closure for an expression, or None if it calls user functions"""
+        if self._calls_user_function(self._expression_tree(source)):
+            return None
+        return self.expression_cache.get((scope, source))
+    
+    def _expression_tree(self, source: str) -> Expr:
+        tree = self.parsed_expressions.get(source)
+        if tree is None:
+            tree = self._fold(parse_expression(source))
+            self.parsed_expressions[source] = tree
+        return tree
+    
+    def _fold(self, tree: Expr) -> Expr:
+        """Fold literal-only subexpressions using this interpreter's own operators"""
+        return fold_constants(tree, lambda node: self._compile_node(node, {})())
+    
+    def _emit_expression(self, source: str, code: List[list], line: int,
+                         scope: int, slots: Dict[str, int]):
+        """Emit an expression; only calls to user functions are split into stack ops"""
+        value = self._expression_closure(source, scope, slots)
+        if value is None:
+            self._emit_tree(self._expression_tree(source), code, line, slots)
+        else:
+            code.append(['LOAD', value, line])
+    
+    def _emit_test(self, source: str, code: List[list], line: int,
+                   scope: int, slots: Dict[str, int]) -> int:
+        """Emit a conditional jump on an expression; returns its index for patching"""
+        value = self._expression_closure(source, scope, slots)
+        if value is None:
+            self._emit_tree(self._expression_tree(source), code, line, slots)
+            code.append(['JUMP_IF_FALSE', None, line])
+        else:
+            code.append(['TEST', (value, None), line])
+        return len(code) - 1
+    
+    def _patch_test(self, code: List[list], index: int, target: int):
+        if code[index][0] == 'TEST':
+            code[index][1] = (code[index][1][0], target)
+        else:
+            code[index][1] = target
+    
+    def _compile_assignment(self, ref: Ref, value: Callable[[], Any]) -> Callable[[], None]:
+        """Closure storing a call-free expression straight into its slot"""
+        runtime = self.runtime
+        depth, slot = ref
+        if depth:
+            def assign():
+                runtime.frame.slots[slot] = value()
+        elif slot >= len(RESERVED_GLOBALS):
+            values = runtime.globals
             
-            if self.runtime.break_loop:
-                self.runtime.break_loop = False
-                break
+            def assign():
+                values[slot] = value()
+        else:
+            store_global = runtime.store_global
             
-            iterations += 1
-        
-        if iterations >= max_iterations:
-            self.runtime.log("⚠️ Loop dihentikan: Mencapai batas maksimum iterasi")
-        
-        return body_end + 1
+            def assign():
+                store_global(slot, value())
+        return assign
     
-    def _parse_for(self, lines: List[str], start: int) -> int:
-        """Parse for loop"""
-        line = lines[start].strip()
+    def _compile_self_append(self, node: AssignStmt, slots: Dict[str, int]) -> Optional[Callable[[], None]]:
+        """Closure for `x = x + a + b ...` that appends text in place, or None for other assignments.
+        
+        The slot is cleared before `+=` so the string has a single reference
+        and CPython can grow it in place instead of copying it every time;
+        building a report line by line stays linear.
+        """
+        # `x + a + b` parses as `(x + a) + b`: walk down the left spine to x
+        tree = self._expression_tree(node.expr)
+        pieces = []
+        while isinstance(tree, BinaryExpr) and tree.op == '+':
+            pieces.append(tree.right)
+            tree = tree.left
+        if not pieces or not (isinstance(tree, Var) and tree.name == node.name):
+            return None
+        depth, slot = node.ref
+        if not depth and slot < len(RESERVED_GLOBALS):
+            return None
         
-        # untuk i dalam [1, 2, 3]
-        # untuk i dari 1 sampai 10
+        runtime = self.runtime
+        current = self._compile_var(node.name, slots)
+        pieces = [self._compile_node(piece, slots) for piece in reversed(pieces)]
+        add = BINARY_OPERATORS['+']
+        globals_ = runtime.globals
         
-        if ' dalam ' in line:
-            parts = line.split(' dalam ', 1)
-            var_name = parts[0].replace('untuk', '').strip()
-            array_expr = parts[1].strip()
-            
-            array = self._eval_expression(array_expr)
-            if not isinstance(array, list):
-                raise Exception("'dalam' membutuhkan array/list")
-            
-            body_start = start + 1
-            body_end = self._find_block_end(lines, body_start, ['akhir'])
-            
-            for item in array:
-                self.runtime.set_variable(var_name, item)
-                self.runtime.break_loop = False
-                self.runtime.continue_loop = False
-                
-                self._execute_block(lines, body_start, body_end)
-                
-                if self.runtime.break_loop:
-                    self.runtime.break_loop = False
-                    break
-            
-            return body_end + 1
-            
-        elif ' dari ' in line and ' sampai ' in line:
-            match = re.match(r'untuk\s+(\w+)\s+dari\s+(.+?)\s+sampai\s+(.+)', line)
-            if not match:
-                raise Exception("Format loop salah")
-            
-            var_name = match.group(1)
-            start_val = self._to_number(self._eval_expression(match.group(2)))
-            end_val = self._to_number(self._eval_expression(match.group(3)))
-            
-            body_start = start + 1
-            body_end = self._find_block_end(lines, body_start, ['akhir'])
+        if len(pieces) == 1:
+            piece = pieces[0]
             
-            current = start_val
-            while current <= end_val:
-                self.runtime.set_variable(var_name, current)
-                self.runtime.break_loop = False
-                self.runtime.continue_loop = False
-                
-                self._execute_block(lines, body_start, body_end)
-                
-                if self.runtime.break_loop:
-                    self.runtime.break_loop = False
-                    break
-                
-                current += 1
-            
-            return body_end + 1
-        
-        raise Exception("Format loop tidak valid")
+            def append_one():
+                text = current()
+                more = piece()
+                values = runtime.frame.slots if depth else globals_
+                if type(text) is str and type(more) is str:
+                    values[slot] = None
+                    text += more
+                    values[slot] = text
+                else:
+                    values[slot] = add(text, more)
+            return append_one
+        
+        def append():
+            text = current()
+            more = [piece() for piece in pieces]
+            values = runtime.frame.slots if depth else globals_
+            if type(text) is str and all(type(item) is str for item in more):
+                values[slot] = None
+                for item in more:
+                    text += item
+                values[slot] = text
+            else:
+                for item in more:
+                    text = add(text, item)
+                values[slot] = text
+        return append
+    
+    def _emit_tree(self, node: Expr, code: List[list], line: int, slots: Dict[str, int]):
+        emit = code.append
+        if not self._calls_user_function(node):
+            emit(['LOAD', self._compile_node(node, slots), line])
+        elif isinstance(node, CallExpr):
+            for arg in node.args:
+                self._emit_tree(arg, code, line, slots)
+            builtin = self.builtins.get(node.name)
+            if builtin is not None:
+                emit(['BUILTIN', (builtin, len(node.args)), line])
+            else:
+                emit(['CALL', (node.name, len(node.args)), line])
+        elif isinstance(node, BinaryExpr) and node.op in ('dan', 'atau'):
+            self._emit_tree(node.left, code, line, slots)
+            jump = len(code)
+            emit(['AND' if node.op == 'dan' else 'OR', None, line])
+            self._emit_tree(node.right, code, line, slots)
+            emit(['TO_BOOL', None, line])
+            code[jump][1] = len(code)
+        elif isinstance(node, BinaryExpr):
+            self._emit_tree(node.left, code, line, slots)
+            self._emit_tree(node.right, code, line, slots)
+            emit(['BINARY', self._binary_function(node.op), line])
+        elif isinstance(node, UnaryExpr):
+            self._emit_tree(node.operand, code, line, slots)
+            emit(['UNARY', node.op, line])
+        elif isinstance(node, IndexExpr):
+            self._emit_tree(node.target, code, line, slots)
+            self._emit_tree(node.key, code, line, slots)
+            emit(['INDEX', None, line])
+        elif isinstance(node, ListExpr):
+            for item in node.items:
+                self._emit_tree(item, code, line, slots)
+            emit(['LIST', len(node.items), line])
+        elif isinstance(node, DictExpr):
+            for key, value in node.pairs:
+                self._emit_tree(key, code, line, slots)
+                self._emit_tree(value, code, line, slots)
+            emit(['DICT', len(node.pairs), line])
+        else:
+            raise HambaError(f"Ekspresi tidak dikenali: {node}", line)
+    
+    def _calls_user_function(self, node: Expr) -> bool:
+        if isinstance(node, CallExpr):
+            return node.name not in self.builtins or any(self._calls_user_function(a) for a in node.args)
+        if isinstance(node, BinaryExpr):
+            return self._calls_user_function(node.left) or self._calls_user_function(node.right)
+        if isinstance(node, UnaryExpr):
+            return self._calls_user_function(node.operand)
+        if isinstance(node, IndexExpr):
+            return self._calls_user_function(node.target) or self._calls_user_function(node.key)
+        if isinstance(node, ListExpr):
+            return any(self._calls_user_function(item) for item in node.items)
+        if isinstance(node, DictExpr):
+            return any(self._calls_user_function(k) or self._calls_user_function(v) for k, v in node.pairs)
+        return False
     
-    def _find_block_end(self, lines: List[str], start: int, end_keywords: List[str]) -> int:
-        """Find the end of a block"""
-        indent_level = 0
+    def _function_code(self, func: FunctionDef) -> List[Instruction]:
+        code = self.function_code.get(func.scope)
+        if code is None:
+            code = self._compile_body(func.body, func.scope, func.slots)
+            self.function_code[func.scope] = code
+        return code
+    
+    # =====================
+    # Execution loop
+    # =====================
+    def _run(self, code: List[Instruction]) -> Any:
+        """Run instructions with an explicit stack of caller activations.
+
+        HambaLang calls push an activation instead of recursing in Python,
+        so call depth is bounded only by `max_call_depth`.
+        """
+        runtime = self.runtime
+        budget = self.budget
+        to_bool = self._to_boolean
+        num = self._to_number
+        store_global = runtime.store_global
+        base_depth = len(runtime.frames)
+        memo_tables = self.memo_tables
+        # Caller activations: (code, pc, stack, (memo table, key) to fill on return)
+        callers: List[Tuple[List[Instruction], int, List[Any], Optional[Tuple]]] = []
+        stack: List[Any] = []
+        pc = 0
+        line = None
         
-        for i in range(start, len(lines)):
-            line = lines[i].strip()
-            
-            if line in end_keywords and indent_level == 0:
-                return i
-            elif line == 'akhir':
-                if indent_level == 0 and 'akhir' in end_keywords:
-                    return i
+        try:
+            while True:
+                op, arg, line = code[pc]
+                pc += 1
+                
+                if op == 'STMT':
+                    arg()
+                elif op == 'JUMP':
+                    pc = arg
+                elif op == 'LOOP':
+                    budget.used += arg[1]
+                    if budget.used >= budget.next_check:
+                        budget.check()
+                    pc = arg[0]
+                elif op == 'RANGE_NEXT':
+                    current = stack[-2]
+                    if current > stack[-1]:
+                        pc = arg[1]
+                    else:
+                        depth, slot = arg[0]
+                        if depth:
+                            runtime.frame.slots[slot] = current
+                        else:
+                            store_global(slot, current)
+                        stack[-2] = current + 1
+                elif op == 'TEST':
+                    if not to_bool(arg[0]()):
+                        pc = arg[1]
+                elif op == 'LOAD':
+                    stack.append(arg())
+                elif op == 'CALL':
+                    name, argc = arg
+                    args = stack[len(stack) - argc:]
+                    del stack[len(stack) - argc:]
+                    budget.used += 1
+                    if budget.used >= budget.next_check:
+                        budget.check()
+                    pending = None
+                    memo = memo_tables.get(name)
+                    if memo is not None:
+                        key = memo_key(args)
+                        if key is not None:
+                            value = memo.lookup(key)
+                            if value is not MISSING:
+                                stack.append(value)
+                                continue
+                            pending = (memo, key)
+                    func = self._enter_function(name, args)
+                    callers.append((code, pc, stack, pending))
+                    code, pc, stack = self._function_code(func), 0, []
+                elif op == 'RETURN':
+                    value = stack.pop() if arg else None
+                    if not callers:
+                        return value
+                    runtime.pop_frame()
+                    code, pc, stack, pending = callers.pop()
+                    if pending is not None:
+                        pending[0].store(pending[1], value)
+                    stack.append(value)
+                elif op == 'BINARY':
+                    right = stack.pop()
+                    stack[-1] = arg(stack[-1], right)
+                elif op == 'STORE':
+                    depth, slot = arg
+                    if depth:
+                        runtime.frame.slots[slot] = stack.pop()
+                    else:
+                        store_global(slot, stack.pop())
+                elif op == 'JUMP_IF_FALSE':
+                    if not to_bool(stack.pop()):
+                        pc = arg
+                elif op == 'ITER_NEXT':
+                    item = next(stack[-1], UNSET)
+                    if item is UNSET:
+                        pc = arg[1]
+                    else:
+                        depth, slot = arg[0]
+                        if depth:
+                            runtime.frame.slots[slot] = item
+                        else:
+                            store_global(slot, item)
+                elif op == 'EXEC':
+                    arg[0](arg[1])
+                    if runtime.terminated:
+                        return None
+                elif op == 'PRINT':
+                    runtime.log(self._to_string(stack.pop()))
+                elif op == 'POP':
+                    del stack[len(stack) - arg:]
+                elif op == 'PUSH':
+                    stack.append(arg)
+                elif op == 'RANGE_PREP':
+                    end_val = num(stack.pop())
+                    stack[-1] = num(stack[-1])
+                    stack.append(end_val)
+                elif op == 'ITER_PREP':
+                    array = stack[-1]
+                    if not isinstance(array, (list, NumericArray, ResultSet, FileStream, MappedFile)):
+                        raise Exception("'dalam' membutuhkan array/list")
+                    stack[-1] = iter(array)
+                elif op == 'BUILTIN':
+                    builtin, argc = arg
+                    args = stack[len(stack) - argc:]
+                    del stack[len(stack) - argc:]
+                    stack.append(builtin(args))
+                elif op == 'AND':
+                    if not to_bool(stack[-1]):
+                        stack[-1] = False
+                        pc = arg
+                    else:
+                        stack.pop()
+                elif op == 'OR':
+                    if to_bool(stack[-1]):
+                        stack[-1] = True
+                        pc = arg
+                    else:
+                        stack.pop()
+                elif op == 'TO_BOOL':
+                    stack[-1] = to_bool(stack[-1])
+                elif op == 'UNARY':
+                    stack[-1] = -num(stack[-1]) if arg == '-' else num(stack[-1])
+                elif op == 'INDEX':
+                    key = stack.pop()
+                    stack[-1] = self._index(stack[-1], key)
+                elif op == 'LIST':
+                    items = stack[len(stack) - arg:]
+                    del stack[len(stack) - arg:]
+                    stack.append(items)
+                elif op == 'DICT':
+                    flat = stack[len(stack) - 2 * arg:]
+                    del stack[len(stack) - 2 * arg:]
+                    stack.append({str(flat[i]): flat[i + 1] for i in range(0, len(flat), 2)})
+                elif op == 'DEFINE':
+                    runtime.functions[arg.name] = arg
+                    self._define_memo(arg)
                 else:
-                    indent_level -= 1
-            elif line.startswith(('fungsi ', 'jika ', 'selama ', 'untuk ')):
-                indent_level += 1
-        
-        return len(lines)
+                    raise HambaError(f"Instruksi tidak dikenali: {op}", line)
+        except BudgetExhausted as e:
+            if e.line is None:
+                raise type(e)(e.limit, line) from None
+            raise
+        except HambaError as e:
+            if e.line is None:
+                raise HambaError(e.message, line) from e
+            raise
+        except Exception as e:
+            raise HambaError(str(e), line) from e
+        finally:
+            while len(runtime.frames) > base_depth:
+                runtime.pop_frame()
     
-    def _call_function(self, name: str, args: List[Any]) -> Any:
-        """Call a user-defined function"""
-        if name not in self.runtime.functions:
+    def _exec_mangkrak(self, node: MangkrakStmt):
+        self._mangkrak(self._to_number(self._eval_expression(node.expr)))
+    
+    def _exec_korupsi(self, node: KorupsiStmt):
+        self._korupsi(self._to_number(self._eval_expression(node.expr)))
+    
+    def _define_memo(self, func: FunctionDef):
+        """Give a (re)defined function a fresh memo table if it may be memoized"""
+        if self.memoize != 'off' and self.memo_size > 0 and \
+                (func.murni or (self.memoize == 'auto' and func.name in self.pure_functions)):
+            self.memo_tables[func.name] = MemoTable(self.memo_size)
+        else:
+            self.memo_tables.pop(func.name, None)
+    
+    def _enter_function(self, name: str, args: List[Any]) -> FunctionDef:
+        """Check a call and push a fresh slot frame for it"""
+        func = self.runtime.functions.get(name)
+        if func is None:
             raise Exception(f"Function '{name}' tidak ditemukan")
         
-        func = self.runtime.functions[name]
+        if len(args) != len(func.params):
+            raise Exception(f"Function {name} butuh {len(func.params)} parameter, diberikan {len(args)}")
         
-        if len(args) != len(func['params']):
-            raise Exception(f"Function {name} butuh {len(func['params'])} parameter, diberikan {len(args)}")
+        runtime = self.runtime
+        if len(runtime.frames) >= self.max_call_depth:
+            raise HambaError(f"Stack overflow: kedalaman panggilan melebihi {self.max_call_depth}")
         
-        # Save state
-        saved_vars = self.runtime.variables.copy()
-        self.runtime.has_return = False
-        self.runtime.return_value = None
-        
-        # Set parameters
-        for param, arg in zip(func['params'], args):
-            self.runtime.set_variable(param, arg)
-        
-        # Execute function body
-        self._execute_block(func['body'], 0, len(func['body']))
-        
-        result = self.runtime.return_value
-        
-        # Restore state
-        self.runtime.variables = saved_vars
-        self.runtime.has_return = False
-        
-        return result
+        # Parameters live in a fresh slot frame; globals are reached through it
+        slots = [UNSET] * len(func.slots)
+        for param, arg in zip(func.params, args):
+            slot = func.slots.get(param)
+            if slot is None:
+                runtime.set_variable(param, arg)  # declared global or built-in
+            else:
+                slots[slot] = arg
+        runtime.push_frame(func, slots)
+        return func
+    
+    def _call_function(self, name: str, args: List[Any]) -> Any:
+        """Call a user-defined function from a compiled expression closure"""
+        memo = self.memo_tables.get(name)
+        key = memo_key(args) if memo is not None else None
+        if key is not None:
+            value = memo.lookup(key)
+            if value is not MISSING:
+                return value
+        func = self._enter_function(name, args)
+        try:
+            value = self._run(self._function_code(func))
+        finally:
+            self.runtime.pop_frame()
+        if key is not None:
+            memo.store(key, value)
+        return value
+    
+    def _load(self, ref: Ref, name: str) -> Any:
+        """Read a resolved variable"""
+        depth, slot = ref
+        if depth:
+            value = self.runtime.frame.slots[slot]
+            if value is not UNSET:
+                return value
+            return self.runtime.get_variable(name)
+        return self.runtime.load_global(slot, name)
+    
+    def _store(self, ref: Ref, value: Any):
+        """Write a resolved variable"""
+        depth, slot = ref
+        if depth:
+            self.runtime.frame.slots[slot] = value
+        else:
+            self.runtime.store_global(slot, value)
     
-    def _assign_variable(self, line: str):
-        """Handle variable assignment"""
-        parts = line.split('=', 1)
-        if len(parts) != 2:
-            raise Exception(f"Assignment tidak valid: {line}")
+    def _assign_index(self, node: IndexAssignStmt):
+        """Handle `arr[index] = value`"""
+        arr = self._load(node.ref, node.name)
+        key = self._eval_expression(node.index)
+        value = self._eval_expression(node.expr)
+        
+        if isinstance(arr, dict):
+            arr[str(key)] = value
+            return
         
-        var_name = parts[0].strip()
-        value_expr = parts[1].strip()
+        if not isinstance(arr, (list, NumericArray)):
+            raise Exception(f"{node.name} bukan array")
         
-        # Special case: array index assignment
-        if '[' in var_name and ']' in var_name:
-            match = re.match(r'(\w+)\[(.+?)\]', var_name)
-            if match:
-                arr_name = match.group(1)
-                index_expr = match.group(2)
-                
-                arr = self.runtime.get_variable(arr_name)
-                index = int(self._to_number(self._eval_expression(index_expr)))
-                value = self._eval_expression(value_expr)
-                
-                if not isinstance(arr, list):
-                    raise Exception(f"{arr_name} bukan array")
-                
-                if index < 0 or index >= len(arr):
-                    raise Exception(f"Index {index} di luar jangkauan")
-                
-                arr[index] = value
-                return
+        index = int(self._to_number(key))
+        if index < 0 or index >= len(arr):
+            raise Exception(f"Index {index} di luar jangkauan")
         
-        value = self._eval_expression(value_expr)
-        self.runtime.set_variable(var_name, value)
+        if isinstance(arr, NumericArray):
+            value = self._to_number(value)
+            if not isinstance(value, (int, float)):
+                raise Exception("angkaArray hanya bisa berisi angka")
+        arr[index] = value
     
     def _eval_expression(self, expr: str) -> Any:
-        """Evaluate an expression"""
-        expr = expr.strip()
-        
-        # String literal (MUST BE FIRST to handle quoted strings)
-        if (expr.startswith('"') and expr.endswith('"')) or (expr.startswith("'") and expr.endswith("'")):
-            return expr[1:-1]
-        
-        # Boolean literals
-        if expr == 'benar':
-            return True
-        if expr == 'salah':
-            return False
-        
-        # Null
-        if expr == 'kosong':
-            return None
-        
-        # Array literal
-        if expr.startswith('[') and expr.endswith(']'):
-            inner = expr[1:-1].strip()
-            if not inner:
-                return []
-            
-            items = self._split_arguments(inner)
-            return [self._eval_expression(item) for item in items]
-        
-        # Object/Dict literal
-        if expr.startswith('{') and expr.endswith('}'):
-            inner = expr[1:-1].strip()
-            if not inner:
-                return {}
-            
-            result = {}
-            pairs = self._split_arguments(inner)
-            
-            for pair in pairs:
-                if ':' not in pair:
-                    raise Exception(f"Format object salah: {pair}")
-                
-                key_expr, val_expr = pair.split(':', 1)
-                key = self._eval_expression(key_expr.strip())
-                val = self._eval_expression(val_expr.strip())
-                result[str(key)] = val
-            
-            return result
-        
-        # Function call (with proper nested parentheses handling)
-        if '(' in expr and expr.endswith(')'):
-            func_name_match = re.match(r'^(\w+)\(', expr)
-            if func_name_match:
-                func_name = func_name_match.group(1)
-                # Extract arguments with balanced parentheses
-                args_str = self._extract_function_args(expr, len(func_name) + 1)
-                
-                # Built-in functions
-                if func_name == 'panjang':
-                    args = self._parse_arguments(args_str)
-                    if len(args) != 1:
-                        raise Exception("panjang() butuh 1 parameter")
-                    val = args[0]
-                    if isinstance(val, (str, list, dict)):
-                        return len(val)
-                    raise Exception("panjang() hanya untuk string/array/object")
-                
-                elif func_name == 'tipe':
-                    args = self._parse_arguments(args_str)
-                    if len(args) != 1:
-                        raise Exception("tipe() butuh 1 parameter")
-                    return type(args[0]).__name__
-                
-                elif func_name == 'angka':
-                    args = self._parse_arguments(args_str)
-                    if len(args) != 1:
-                        raise Exception("angka() butuh 1 parameter")
-                    return self._to_number(args[0])
-                
-                elif func_name == 'teks':
-                    args = self._parse_arguments(args_str)
-                    if len(args) != 1:
-                        raise Exception("teks() butuh 1 parameter")
-                    return self._to_string(args[0])
-                
-                elif func_name == 'tambahArray':
-                    args = self._parse_arguments(args_str)
-                    if len(args) != 2:
-                        raise Exception("tambahArray() butuh 2 parameter")
-                    if not isinstance(args[0], list):
-                        raise Exception("Parameter pertama harus array")
-                    args[0].append(args[1])
-                    return args[0]
-                
-                elif func_name == 'hapusArray':
-                    args = self._parse_arguments(args_str)
-                    if len(args) != 2:
-                        raise Exception("hapusArray() butuh 2 parameter")
-                    if not isinstance(args[0], list):
-                        raise Exception("Parameter pertama harus array")
-                    index = int(self._to_number(args[1]))
-                    if 0 <= index < len(args[0]):
-                        return args[0].pop(index)
-                    raise Exception(f"Index {index} di luar jangkauan")
-                
-                # User functions
-                elif func_name in self.runtime.functions:
-                    args = self._parse_arguments(args_str) if args_str.strip() else []
-                    return self._call_function(func_name, args)
-        
-        # Array/Object access
-        access_match = re.match(r'(\w+)\[(.+?)\]', expr)
-        if access_match:
-            var_name = access_match.group(1)
-            key_expr = access_match.group(2)
-            
-            obj = self.runtime.get_variable(var_name)
-            key = self._eval_expression(key_expr)
+        """Evaluate an expression, compiling it on first use in the current scope"""
+        return self.expression_cache.get((self.runtime.scope, expr))()
+    
+    def _compile_expression(self, key) -> Callable[[], Any]:
+        """Compile (scope, source) into a zero-argument closure"""
+        scope, expr = key
+        tree = self.parsed_expressions.get(expr)
+        if tree is None:
+            tree = self._fold(parse_expression(expr))
+        return self._compile_node(tree, self.scope_slots.get(scope, {}))
+    
+    def _compile_node(self, node: Expr, slots: Dict[str, int]) -> Callable[[], Any]:
+        """Turn an expression tree into a closure, binding variables to their slots"""
+        if isinstance(node, Const):
+            value = node.value
+            return lambda: value
+        
+        if isinstance(node, Template):
+            return node.copy
+        
+        if isinstance(node, Var):
+            return self._compile_var(node.name, slots)
+        
+        if isinstance(node, ListExpr):
+            items = [self._compile_node(item, slots) for item in node.items]
+            return lambda: [item() for item in items]
+        
+        if isinstance(node, DictExpr):
+            pairs = [(self._compile_node(k, slots), self._compile_node(v, slots)) for k, v in node.pairs]
+            return lambda: {str(k()): v() for k, v in pairs}
+        
+        if isinstance(node, IndexExpr):
+            target = self._compile_node(node.target, slots)
+            key = self._compile_node(node.key, slots)
+            index = self._index
+            return lambda: index(target(), key())
+        
+        if isinstance(node, CallExpr):
+            name = node.name
+            args = [self._compile_node(arg, slots) for arg in node.args]
+            builtin = self.builtins.get(name)
+            if builtin is not None:
+                return lambda: builtin([arg() for arg in args])
+            call_function = self._call_function
+            return lambda: call_function(name, [arg() for arg in args])
+        
+        if isinstance(node, UnaryExpr):
+            operand = self._compile_node(node.operand, slots)
+            if node.op == '-':
+                return lambda: -to_number(operand())
+            return lambda: to_number(operand())
+        
+        if isinstance(node, BinaryExpr):
+            return self._compile_binary(node, slots)
+        
+        raise Exception(f"Ekspresi tidak dikenali: {node}")
+    
+    def _compile_var(self, name: str, slots: Dict[str, int]) -> Callable[[], Any]:
+        """Compile a variable read into a direct slot access"""
+        runtime = self.runtime
+        slot = slots.get(name)
+        if slot is not None:
+            get_variable = runtime.get_variable
             
-            if isinstance(obj, list):
-                index = int(self._to_number(key))
-                if 0 <= index < len(obj):
-                    return obj[index]
-                raise Exception(f"Index {index} di luar jangkauan")
-            elif isinstance(obj, dict):
-                key_str = str(key)
-                if key_str in obj:
-                    return obj[key_str]
-                raise Exception(f"Key '{key_str}' tidak ditemukan")
-            else:
-                raise Exception(f"{var_name} bukan array atau object")
-        
-        # Number literal (BEFORE variable check!)
+            def load_local():
+                value = runtime.frame.slots[slot]
+                if value is UNSET:
+                    return get_variable(name)
+                return value
+            return load_local
+        
+        values = runtime.globals
+        slot = runtime.global_slot(name)
+        
+        def load_global():
+            value = values[slot]
+            if value is UNSET:
+                raise Exception(f"Variable '{name}' tidak ditemukan")
+            return value
+        return load_global
+    
+    def _compile_binary(self, node: BinaryExpr, slots: Dict[str, int]) -> Callable[[], Any]:
+        """Compile a binary operation"""
+        op = node.op
+        left = self._compile_node(node.left, slots)
+        right = self._compile_node(node.right, slots)
+        to_bool = self._to_boolean
+        
+        if op == 'dan':
+            return lambda: to_bool(left()) and to_bool(right())
+        elif op == 'atau':
+            return lambda: to_bool(left()) or to_bool(right())
+        
+        fn = self._binary_function(op)
+        return lambda: fn(left(), right())
+    
+    def _binary_function(self, op: str) -> Callable[[Any, Any], Any]:
+        """Two-argument function implementing a non-short-circuit operator"""
+        fn = BINARY_OPERATORS.get(op)
+        if fn is None:
+            raise Exception(f"Operator tidak dikenal: {op}")
+        return fn
+    
+    def _index(self, obj: Any, key: Any) -> Any:
+        """Array/Object access"""
+        if isinstance(obj, (list, NumericArray, MappedFile)):
+            index = int(self._to_number(key))
+            if 0 <= index < len(obj):
+                return obj[index]
+            raise Exception(f"Index {index} di luar jangkauan")
+        elif isinstance(obj, dict):
+            key_str = str(key)
+            if key_str in obj:
+                return obj[key_str]
+            raise Exception(f"Key '{key_str}' tidak ditemukan")
+        elif isinstance(obj, Row):
+            if isinstance(key, str):
+                return obj[key]
+            index = int(self._to_number(key))
+            if 0 <= index < len(obj):
+                return obj[index]
+            raise Exception(f"Index {index} di luar jangkauan")
+        raise Exception(f"{self._to_string(obj)} bukan array atau object")
+    
+    # Built-in functions
+    
+    def _builtin_panjang(self, args: List[Any]) -> int:
+        if len(args) != 1:
+            raise Exception("panjang() butuh 1 parameter")
+        val = args[0]
+        if isinstance(val, (str, list, dict, NumericArray, MappedFile)):
+            return len(val)
+        raise Exception("panjang() hanya untuk string/array/object")
+    
+    def _builtin_tipe(self, args: List[Any]) -> str:
+        if len(args) != 1:
+            raise Exception("tipe() butuh 1 parameter")
+        return type(args[0]).__name__
+    
+    def _builtin_angka(self, args: List[Any]) -> Union[int, float]:
+        if len(args) != 1:
+            raise Exception("angka() butuh 1 parameter")
+        return self._to_number(args[0])
+    
+    def _builtin_teks(self, args: List[Any]) -> str:
+        if len(args) != 1:
+            raise Exception("teks() butuh 1 parameter")
+        return self._to_string(args[0])
+    
+    def _builtin_tambah_array(self, args: List[Any]) -> list:
+        if len(args) != 2:
+            raise Exception("tambahArray() butuh 2 parameter")
+        if not isinstance(args[0], list):
+            raise Exception("Parameter pertama harus array")
+        args[0].append(args[1])
+        return args[0]
+    
+    def _builtin_hapus_array(self, args: List[Any]) -> Any:
+        if len(args) != 2:
+            raise Exception("hapusArray() butuh 2 parameter")
+        if not isinstance(args[0], list):
+            raise Exception("Parameter pertama harus array")
+        index = int(self._to_number(args[1]))
+        if 0 <= index < len(args[0]):
+            return args[0].pop(index)
+        raise Exception(f"Index {index} di luar jangkauan")
+    
+    # Bulk builtins: whole arrays (or an object's values) are processed in Python
+    
+    @staticmethod
+    def _check_args(name: str, args: List[Any], low: int, high: Optional[int] = None):
+        high = low if high is None else high
+        if not low <= len(args) <= high:
+            count = low if low == high else f"{low}-{high}"
+            raise Exception(f"{name}() butuh {count} parameter")
+    
+    @staticmethod
+    def _array(name: str, value: Any) -> list:
+        if isinstance(value, NumericArray):
+            return value.tolist()
+        if not isinstance(value, list):
+            raise Exception(f"{name}() butuh array")
+        return value
+    
+    def _numbers(self, name: str, value: Any) -> list:
+        """Numeric items of an array or the values of an object"""
+        if isinstance(value, NumericArray):
+            return value.tolist()
+        if isinstance(value, dict):
+            value = list(value.values())
+        elif not isinstance(value, list):
+            raise Exception(f"{name}() butuh array atau object")
+        for item in value:
+            if type(item) not in NUMERIC_TYPES:
+                return [to_number(item) for item in value]
+        return value
+    
+    def _item_function(self, name: str, ref: Any) -> Callable[[Any], Any]:
+        """Per-item function named by a string: a user function, a builtin, or an object field"""
+        if not isinstance(ref, str):
+            raise Exception(f"{name}() butuh nama fungsi atau field")
+        if ref in self.runtime.functions:
+            call_function = self._call_function
+            return lambda item: call_function(ref, [item])
+        builtin = self.builtins.get(ref)
+        if builtin is not None:
+            return lambda item: builtin([item])
+        index = self._index
+        return lambda item: index(item, ref)
+    
+    def _builtin_jumlah(self, args: List[Any]) -> Union[int, float]:
+        self._check_args('jumlah', args, 1)
+        if isinstance(args[0], NumericArray):
+            return args[0].sum()
+        return sum(self._numbers('jumlah', args[0]))
+    
+    def _builtin_minimum(self, args: List[Any]) -> Union[int, float]:
+        self._check_args('minimum', args, 1)
+        if isinstance(args[0], NumericArray) and len(args[0]):
+            return args[0].min()
+        values = self._numbers('minimum', args[0])
+        if not values:
+            raise Exception("minimum() butuh array yang tidak kosong")
+        return min(values)
+    
+    def _builtin_maksimum(self, args: List[Any]) -> Union[int, float]:
+        self._check_args('maksimum', args, 1)
+        if isinstance(args[0], NumericArray) and len(args[0]):
+            return args[0].max()
+        values = self._numbers('maksimum', args[0])
+        if not values:
+            raise Exception("maksimum() butuh array yang tidak kosong")
+        return max(values)
+    
+    def _builtin_rata_rata(self, args: List[Any]) -> Union[int, float]:
+        self._check_args('rataRata', args, 1)
+        if isinstance(args[0], NumericArray) and len(args[0]):
+            return args[0].mean()
+        values = self._numbers('rataRata', args[0])
+        if not values:
+            raise Exception("rataRata() butuh array yang tidak kosong")
+        return divide(sum(values), len(values))
+    
+    def _builtin_urutkan(self, args: List[Any]) -> list:
+        """urutkan(arr, kunci?, terbalik?) returns a sorted copy"""
+        self._check_args('urutkan', args, 1, 3)
+        items = self._array('urutkan', args[0])
+        key = self._item_function('urutkan', args[1]) if len(args) > 1 and args[1] is not None else None
+        reverse = len(args) > 2 and self._to_boolean(args[2])
         try:
-            return float(expr) if '.' in expr else int(expr)
-        except ValueError:
-            pass
-        
-        # Variable reference (AFTER number check!)
-        if re.match(r'^[a-zA-Z_]\w*$', expr):
-            return self.runtime.get_variable(expr)
-        
-        # Comparison and logical operators
-        for op in ['==', '!=', '<=', '>=', '<', '>', ' dan ', ' atau ']:
-            if op in expr:
-                return self._eval_binary_operation(expr, op)
-        
-        # Arithmetic operators
-        for op in ['+', '-', '*', '/', '%']:
-            if op in expr:
-                # Avoid splitting negative numbers
-                if op == '-' and expr.startswith('-'):
-                    continue
-                return self._eval_binary_operation(expr, op)
-        
-        raise Exception(f"Tidak dapat mengevaluasi: {expr}")
-    
-    def _eval_binary_operation(self, expr: str, op: str) -> Any:
-        """Evaluate binary operation"""
-        parts = expr.split(op, 1)
-        if len(parts) != 2:
-            raise Exception(f"Operasi binary tidak valid: {expr}")
-        
-        left = self._eval_expression(parts[0].strip())
-        right = self._eval_expression(parts[1].strip())
-        
-        if op == '+':
-            return left + right
-        elif op == '-':
-            return self._to_number(left) - self._to_number(right)
-        elif op == '*':
-            return self._to_number(left) * self._to_number(right)
-        elif op == '/':
-            return self._to_number(left) / self._to_number(right)
-        elif op == '%':
-            return self._to_number(left) % self._to_number(right)
-        elif op == '==':
-            return left == right
-        elif op == '!=':
-            return left != right
-        elif op == '<':
-            return self._to_number(left) < self._to_number(right)
-        elif op == '>':
-            return self._to_number(left) > self._to_number(right)
-        elif op == '<=':
-            return self._to_number(left) <= self._to_number(right)
-        elif op == '>=':
-            return self._to_number(left) >= self._to_number(right)
-        elif op == ' dan ':
-            return self._to_boolean(left) and self._to_boolean(right)
-        elif op == ' atau ':
-            return self._to_boolean(left) or self._to_boolean(right)
-        
-        raise Exception(f"Operator tidak dikenal: {op}")
-    
-    def _extract_function_args(self, expr: str, start_pos: int) -> str:
-        """Extract function arguments with balanced parentheses"""
-        depth = 0
-        in_string = False
-        string_char = None
-        result = ""
-        
-        for i in range(start_pos, len(expr)):
-            char = expr[i]
-            
-            if char in ('"', "'") and not in_string:
-                in_string = True
-                string_char = char
-                result += char  # ADD QUOTE TO RESULT
-            elif char == string_char and in_string:
-                in_string = False
-                result += char  # ADD CLOSING QUOTE TO RESULT
-            elif not in_string:
-                if char == '(':
-                    depth += 1
-                    result += char
-                elif char == ')':
-                    if depth == 0:
-                        return result
-                    depth -= 1
-                    result += char
-                else:
-                    result += char
-            else:
-                result += char
-        
-        raise Exception(f"Unclosed parentheses in: {expr}")
-    
-    def _parse_arguments(self, args_str: str) -> List[Any]:
-        """Parse function arguments"""
-        if not args_str.strip():
-            return []
-        
-        args = self._split_arguments(args_str)
-        return [self._eval_expression(arg.strip()) for arg in args]
-    
-    def _split_arguments(self, args_str: str) -> List[str]:
-        """Split arguments by comma, respecting nested structures"""
-        args = []
-        current = ""
-        depth = 0
-        in_string = False
-        string_char = None
-        
-        for char in args_str:
-            if char in ('"', "'") and not in_string:
-                in_string = True
-                string_char = char
-            elif char == string_char and in_string:
-                in_string = False
-            elif not in_string:
-                if char in ('(', '[', '{'):
-                    depth += 1
-                elif char in (')', ']', '}'):
-                    depth -= 1
-                elif char == ',' and depth == 0:
-                    args.append(current.strip())
-                    current = ""
-                    continue
-            
-            current += char
-        
-        if current.strip():
-            args.append(current.strip())
-        
-        return args
+            return sorted(items, key=key, reverse=reverse)
+        except TypeError:
+            raise Exception("urutkan() tidak bisa membandingkan nilai dengan tipe berbeda")
     
-    def _to_number(self, value: Any) -> float:
-        """Convert value to number"""
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            try:
-                return float(value)
-            except ValueError:
-                return 0.0
-        if isinstance(value, bool):
-            return 1.0 if value else 0.0
-        return 0.0
+    def _builtin_peta(self, args: List[Any]) -> list:
+        self._check_args('peta', args, 2)
+        items = self._array('peta', args[0])
+        return list(map(self._item_function('peta', args[1]), items))
+    
+    def _builtin_saring(self, args: List[Any]) -> list:
+        self._check_args('saring', args, 2)
+        items = self._array('saring', args[0])
+        test = self._item_function('saring', args[1])
+        to_bool = self._to_boolean
+        return [item for item in items if to_bool(test(item))]
+    
+    def _builtin_gabung(self, args: List[Any]) -> str:
+        return self._join('gabung', args)
+    
+    def _builtin_gabung_teks(self, args: List[Any]) -> str:
+        """gabungTeks(daftar, pemisah?) materializes pieces collected with tambahTeks"""
+        return self._join('gabungTeks', args)
+    
+    def _join(self, name: str, args: List[Any]) -> str:
+        self._check_args(name, args, 1, 2)
+        items = self._array(name, args[0])
+        separator = self._to_string(args[1]) if len(args) > 1 else ''
+        return separator.join(map(self._to_string, items))
+    
+    def _builtin_tambah_teks(self, args: List[Any]) -> list:
+        """tambahTeks(daftar, nilai) appends nilai as text to a builder array"""
+        self._check_args('tambahTeks', args, 2)
+        if not isinstance(args[0], list):
+            raise Exception("Parameter pertama harus array")
+        args[0].append(self._to_string(args[1]))
+        return args[0]
+    
+    def _builtin_potong(self, args: List[Any]) -> Any:
+        """potong(arr atau teks, awal, akhir?) like a Python slice"""
+        self._check_args('potong', args, 2, 3)
+        value = args[0]
+        if not isinstance(value, (list, str, NumericArray, MappedFile)):
+            raise Exception("potong() butuh array atau string")
+        start = int(self._to_number(args[1]))
+        end = int(self._to_number(args[2])) if len(args) > 2 and args[2] is not None else None
+        if isinstance(value, NumericArray):
+            return value.slice(start, end)
+        if isinstance(value, MappedFile):
+            return value.text(start, end)
+        return value[start:end]
+    
+    def _builtin_indeks_dari(self, args: List[Any]) -> int:
+        """Position of a value in an array (or substring in a string), -1 if absent"""
+        self._check_args('indeksDari', args, 2)
+        value, target = args
+        if isinstance(value, (str, MappedFile)):
+            return value.find(self._to_string(target))
+        # benar/salah never match 1/0
+        is_bool = type(target) is bool
+        for index, item in enumerate(self._array('indeksDari', value)):
+            if item == target and (type(item) is bool) == is_bool:
+                return index
+        return -1
+    
+    def _builtin_isi_array(self, args: List[Any]) -> list:
+        """isiArray(n, nilai) is an array of n independent copies of nilai"""
+        self._check_args('isiArray', args, 2)
+        count = int(self._to_number(args[0]))
+        if count < 0:
+            raise Exception("isiArray() butuh jumlah yang tidak negatif")
+        value = args[1]
+        if isinstance(value, (list, dict)):
+            copy = make_copier(value)
+            return [copy() for _ in range(count)]
+        return [value] * count
+    
+    def _builtin_angka_array(self, args: List[Any]) -> NumericArray:
+        """angkaArray(n, isi?) is a packed float array; angkaArray(arr) converts an array"""
+        self._check_args('angkaArray', args, 1, 2)
+        source = args[0]
+        if isinstance(source, (list, dict, NumericArray)):
+            if len(args) > 1:
+                raise Exception("angkaArray() dari array butuh 1 parameter")
+            return NumericArray.from_values(self._numbers('angkaArray', source))
+        fill = self._to_number(args[1]) if len(args) > 1 else 0
+        if not isinstance(fill, (int, float)):
+            raise Exception("angkaArray hanya bisa berisi angka")
+        return NumericArray.filled(int(self._to_number(source)), fill)
+    
+    def _builtin_kolom(self, args: List[Any]) -> List[str]:
+        """Column names of a queryStream result or one of its rows"""
+        self._check_args('kolom', args, 1)
+        value = args[0]
+        if isinstance(value, ResultSet):
+            return list(value.columns)
+        if isinstance(value, Row):
+            return list(value.index)
+        raise Exception("kolom() butuh hasil queryStream atau barisnya")
+    
+    def _builtin_baca_baris(self, args: List[Any]) -> LineReader:
+        """bacaBaris(path, ukuranBuffer?) yields a file's lines one by one in `untuk ... dalam`"""
+        self._check_args('bacaBaris', args, 1, 2)
+        buffer_size = int(self._to_number(args[1])) if len(args) > 1 else DEFAULT_BUFFER_SIZE
+        return LineReader(self._to_string(args[0]), buffer_size)
+    
+    def _builtin_baca_potongan(self, args: List[Any]) -> ChunkReader:
+        """bacaPotongan(path, ukuran?, ukuranBuffer?) yields fixed-size pieces of a file"""
+        self._check_args('bacaPotongan', args, 1, 3)
+        chunk_size = int(self._to_number(args[1])) if len(args) > 1 else DEFAULT_CHUNK_SIZE
+        buffer_size = int(self._to_number(args[2])) if len(args) > 2 else DEFAULT_BUFFER_SIZE
+        return ChunkReader(self._to_string(args[0]), chunk_size, buffer_size)
+    
+    def _builtin_petakan_file(self, args: List[Any]) -> MappedFile:
+        """petakanFile(path) maps a file read-only for indexing, potong and searching"""
+        self._check_args('petakanFile', args, 1)
+        mapped = MappedFile(self._to_string(args[0]))
+        self.runtime.mapped_files.append(mapped)
+        return mapped
+    
+    @staticmethod
+    def _mapped(name: str, value: Any) -> MappedFile:
+        if not isinstance(value, MappedFile):
+            raise Exception(f"{name}() butuh hasil petakanFile")
+        return value
+    
+    def _builtin_baris_ke(self, args: List[Any]) -> str:
+        """barisKe(peta, n) is line n (from 0) of a mapped file"""
+        self._check_args('barisKe', args, 2)
+        return self._mapped('barisKe', args[0]).line(int(self._to_number(args[1])))
+    
+    def _builtin_cari_baris(self, args: List[Any]) -> int:
+        """cariBaris(peta, teks, dariBaris?) is the first line containing teks, -1 if none"""
+        self._check_args('cariBaris', args, 2, 3)
+        first_line = int(self._to_number(args[2])) if len(args) > 2 else 0
+        return self._mapped('cariBaris', args[0]).find_line(self._to_string(args[1]), first_line)
+    
+    def _builtin_baca_csv(self, args: List[Any]) -> CsvReader:
+        """bacaCSV(path, kepala?, pemisah?) streams rows; without kepala the header is guessed"""
+        self._check_args('bacaCSV', args, 1, 3)
+        header = self._to_boolean(args[1]) if len(args) > 1 and args[1] is not None else None
+        delimiter = self._to_string(args[2]) if len(args) > 2 else ','
+        return CsvReader(self._to_string(args[0]), header, delimiter)
+    
+    def _builtin_tulis_csv(self, args: List[Any]) -> int:
+        """tulisCSV(path, baris, pemisah?) writes array rows, or object rows under a header; returns the row count"""
+        self._check_args('tulisCSV', args, 2, 3)
+        rows = args[1]
+        if not isinstance(rows, (list, ResultSet, FileStream)):
+            raise Exception("tulisCSV() butuh array baris")
+        delimiter = self._to_string(args[2]) if len(args) > 2 else ','
+        
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if isinstance(first, Row):
+            fieldnames = list(first.index)
+        elif isinstance(first, dict):
+            fieldnames = list(first)
+        elif isinstance(rows, ResultSet):
+            fieldnames = list(rows.columns)
+        else:
+            fieldnames = None
+        cell = self._csv_cell
+        
+        def cells(row: Any) -> Union[list, dict]:
+            if isinstance(row, Row):
+                row = row.as_dict()
+            if fieldnames is not None and isinstance(row, dict):
+                return {key: cell(value) for key, value in row.items()}
+            if fieldnames is None and isinstance(row, list):
+                return [cell(value) for value in row]
+            raise Exception("Baris tulisCSV harus semuanya array atau semuanya object")
+        
+        if first is not None:
+            iterator = itertools.chain((first,), iterator)
+        return write_csv(self._to_string(args[0]), map(cells, iterator), fieldnames, delimiter)
+    
+    def _csv_cell(self, value: Any) -> Any:
+        if isinstance(value, str) or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+            return value
+        return '' if value is None else self._to_string(value)
+    
+    def _builtin_baca_json(self, args: List[Any]) -> Any:
+        """bacaJSON(path) parses a whole JSON file"""
+        self._check_args('bacaJSON', args, 1)
+        path = self._to_string(args[0])
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except OSError as e:
+            raise Exception(f"Gagal membaca file: {e}")
+        except ValueError as e:
+            raise Exception(f"JSON tidak valid: {e}")
+    
+    def _builtin_tulis_json(self, args: List[Any]) -> Any:
+        """tulisJSON(path, nilai, indentasi?) writes a value as JSON"""
+        self._check_args('tulisJSON', args, 2, 3)
+        indent = int(self._to_number(args[2])) if len(args) > 2 else None
+        try:
+            with open(self._to_string(args[0]), 'w', encoding='utf-8') as f:
+                json.dump(args[1], f, ensure_ascii=False, indent=indent, default=self._json_default)
+        except OSError as e:
+            raise Exception(f"Gagal menulis file: {e}")
+        return args[1]
+    
+    def _json_default(self, value: Any) -> Any:
+        if isinstance(value, NumericArray):
+            return value.tolist()
+        if isinstance(value, Row):
+            return value.as_dict()
+        if isinstance(value, (ResultSet, FileStream, MappedFile)):
+            raise Exception(f"{self._to_string(value)} tidak bisa ditulis sebagai JSON")
+        return self._to_string(value)
+    
+    def _builtin_baca_jsonl(self, args: List[Any]) -> JsonLinesReader:
+        """bacaJSONL(path, ukuranBuffer?) streams one JSON value per line"""
+        self._check_args('bacaJSONL', args, 1, 2)
+        buffer_size = int(self._to_number(args[1])) if len(args) > 1 else DEFAULT_BUFFER_SIZE
+        return JsonLinesReader(self._to_string(args[0]), buffer_size)
+    
+    def _builtin_buka_file(self, args: List[Any]) -> FileHandle:
+        """bukaFile(path, mode?) opens a file for writing ("tulis") or appending ("tambah")"""
+        self._check_args('bukaFile', args, 1, 2)
+        mode = self._to_string(args[1]) if len(args) > 1 else 'tulis'
+        handle = FileHandle(self._to_string(args[0]), mode)
+        self.runtime.open_files.append(handle)
+        return handle
+    
+    @staticmethod
+    def _handle(name: str, value: Any) -> FileHandle:
+        if not isinstance(value, FileHandle):
+            raise Exception(f"{name}() butuh file dari bukaFile")
+        return value
+    
+    def _builtin_tulis(self, args: List[Any]) -> None:
+        """tulis(file, data) writes text into the file's buffer"""
+        self._check_args('tulis', args, 2)
+        self._handle('tulis', args[0]).write(self._to_string(args[1]))
+    
+    def _builtin_tulis_baris(self, args: List[Any]) -> None:
+        """tulisBaris(file, data) writes text followed by a newline"""
+        self._check_args('tulisBaris', args, 2)
+        self._handle('tulisBaris', args[0]).write(self._to_string(args[1]) + "\n")
+    
+    def _builtin_tutup_file(self, args: List[Any]) -> None:
+        """tutupFile(file) closes a bukaFile handle or unmaps a petakanFile map"""
+        self._check_args('tutupFile', args, 1)
+        value = args[0]
+        if isinstance(value, MappedFile):
+            opened = self.runtime.mapped_files
+        else:
+            value = self._handle('tutupFile', value)
+            opened = self.runtime.open_files
+        value.close()
+        if value in opened:
+            opened.remove(value)
+    
+    def _builtin_atur_http(self, args: List[Any]) -> None:
+        """aturHTTP({"timeout": detik, "header": {...}, "ukuranPool": n}) sets options for later requests"""
+        self._check_args('aturHTTP', args, 1)
+        options = args[0]
+        if not isinstance(options, dict):
+            raise Exception("aturHTTP() butuh object")
+        unknown = set(options) - {'timeout', 'header', 'ukuranPool'}
+        if unknown:
+            raise Exception(f"Opsi aturHTTP tidak dikenal: {', '.join(sorted(unknown))}")
+        headers = options.get('header')
+        if headers is not None and not isinstance(headers, dict):
+            raise Exception("Opsi header aturHTTP harus object")
+        self.runtime.http.configure(
+            pool_size=int(self._to_number(options['ukuranPool'])) if 'ukuranPool' in options else None,
+            timeout=self._to_number(options['timeout']) if 'timeout' in options else None,
+            headers={key: self._to_string(value) for key, value in headers.items()} if headers is not None else None,
+        )
+    
+    # Numbers keep their int/float type; see to_number()
+    _to_number = staticmethod(to_number)
     
     def _to_string(self, value: Any) -> str:
         """Convert value to string"""
@@ -792,6 +1603,10 @@ class HambaInterpreter:
             return "benar" if value else "salah"
         if isinstance(value, (list, dict)):
             return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, NumericArray):
+            return json.dumps(value.tolist())
+        if isinstance(value, Row):
+            return json.dumps(value.as_dict(), ensure_ascii=False, default=str)
         return str(value)
     
     def _to_boolean(self, value: Any) -> bool:
@@ -804,7 +1619,7 @@ class HambaInterpreter:
             return value != 0
         if isinstance(value, str):
             return len(value) > 0 and value != "salah"
-        if isinstance(value, (list, dict)):
+        if isinstance(value, (list, dict, NumericArray, Row, MappedFile)):
             return len(value) > 0
         return True
     
@@ -814,6 +1629,7 @@ class HambaInterpreter:
         """Mangkrak: Delay dengan event random"""
         seconds = ms / 1000
         self.runtime.log(f"⏳ Proyek mangkrak selama {seconds} detik...")
+        self.runtime.flush()
         
         time.sleep(min(seconds, 2))
         
@@ -855,6 +1671,7 @@ class HambaInterpreter:
         
         for i in range(5):
             self.runtime.log(f"📋 Rapat sesi ke-{i+1}: Belum ada keputusan...")
+            self.runtime.flush()
             time.sleep(0.5)
         
         self.runtime.log("⏸️ (RapatInfinite dihentikan paksa untuk demo)")
@@ -875,14 +1692,13 @@ class HambaInterpreter:
     
     # File operations
     
-    def _handle_file_operation(self, line: str):
+    def _handle_file_operation(self, node: Node):
         """Handle file I/O operations"""
         
         # tulisFile(path, content)
-        match = re.match(r'tulisFile\((.+?),\s*(.+)\)', line)
-        if match:
-            path = self._to_string(self._eval_expression(match.group(1)))
-            content = self._to_string(self._eval_expression(match.group(2)))
+        if isinstance(node, FileWriteStmt):
+            path = self._to_string(self._eval_expression(node.path))
+            content = self._to_string(self._eval_expression(node.content))
             
             try:
                 with open(path, 'w', encoding='utf-8') as f:
@@ -893,137 +1709,212 @@ class HambaInterpreter:
             return
         
         # bacaFile(path)
-        match = re.match(r'(\w+)\s*=\s*bacaFile\((.+?)\)', line)
-        if match:
-            var_name = match.group(1)
-            path = self._to_string(self._eval_expression(match.group(2)))
-            
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.runtime.set_variable(var_name, content)
-                self.runtime.log(f"✅ File dibaca: {path}")
-            except Exception as e:
-                raise Exception(f"Gagal membaca file: {str(e)}")
-            return
+        path = self._to_string(self._eval_expression(node.path))
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            raise Exception(f"Gagal membaca file: {str(e)}")
+        
+        if node.target:
+            self._store(node.ref, content)
+        self.runtime.log(f"✅ File dibaca: {path}")
     
     # Database operations
     
-    def _handle_db_operation(self, line: str):
+    def _handle_db_operation(self, node: Node):
         """Handle database operations"""
         
         # sambungDB(nama, tipe, path/connection_string)
-        match = re.match(r'sambungDB\((.+?),\s*(.+?),\s*(.+)\)', line)
-        if match:
-            name = self._to_string(self._eval_expression(match.group(1)))
-            db_type = self._to_string(self._eval_expression(match.group(2)))
-            conn_str = self._to_string(self._eval_expression(match.group(3)))
+        if isinstance(node, DbConnectStmt):
+            name = self._to_string(self._eval_expression(node.name))
+            db_type = self._to_string(self._eval_expression(node.db_type))
+            conn_str = self._to_string(self._eval_expression(node.conn_str))
+            
+            profile = self._eval_expression(node.profile) if node.profile is not None else None
             
             try:
-                if db_type == 'sqlite':
-                    conn = sqlite3.connect(conn_str)
-                    self.runtime.db_connections[name] = conn
-                    self.runtime.log(f"✅ Terhubung ke SQLite: {name}")
-                elif db_type == 'mysql':
-                    if not HAS_MYSQL:
-                        raise Exception("mysql-connector-python tidak terinstall")
-                    # Parse connection string
-                    conn = mysql.connector.connect(conn_str)
-                    self.runtime.db_connections[name] = conn
-                    self.runtime.log(f"✅ Terhubung ke MySQL: {name}")
-                else:
-                    raise Exception(f"Tipe database tidak didukung: {db_type}")
+                conn = self.runtime.db_pool.acquire(db_type, conn_str)
             except Exception as e:
                 raise Exception(f"Gagal koneksi database: {str(e)}")
+            if profile is not None:
+                try:
+                    conn.tune(sqlite_pragmas(profile))
+                except Exception as e:
+                    self.runtime.db_pool.release(conn)
+                    raise Exception(f"Gagal koneksi database: {str(e)}")
+            previous = self.runtime.db_connections.get(name)
+            if previous is not None:
+                self.runtime.db_pool.release(previous)
+            self.runtime.db_connections[name] = conn
+            self.runtime.log(f"✅ Terhubung ke {DB_TYPE_NAMES[db_type]}: {name}")
             return
         
-        # queryDB(nama, query)
-        match = re.match(r'(\w+)\s*=\s*queryDB\((.+?),\s*(.+)\)', line)
-        if match:
-            var_name = match.group(1)
-            db_name = self._to_string(self._eval_expression(match.group(2)))
-            query = self._to_string(self._eval_expression(match.group(3)))
+        # queryDB(nama, query, parameter?)
+        if isinstance(node, DbQueryStmt):
+            db_name = self._to_string(self._eval_expression(node.db_name))
+            query = self._to_string(self._eval_expression(node.query))
+            params = self._query_params(node.params)
             
             if db_name not in self.runtime.db_connections:
                 raise Exception(f"Database '{db_name}' tidak terhubung")
             
             try:
-                conn = self.runtime.db_connections[db_name]
-                cursor = conn.cursor()
-                cursor.execute(query)
-                
-                if query.strip().upper().startswith('SELECT'):
-                    results = cursor.fetchall()
-                    self.runtime.set_variable(var_name, list(results))
-                else:
-                    conn.commit()
-                    self.runtime.set_variable(var_name, cursor.rowcount)
-                
-                cursor.close()
-                self.runtime.log(f"✅ Query dijalankan: {var_name}")
+                result = self.runtime.db_connections[db_name].execute(query, params)
             except Exception as e:
                 raise Exception(f"Gagal menjalankan query: {str(e)}")
+            
+            if node.target:
+                self._store(node.ref, result)
+                self.runtime.log(f"✅ Query dijalankan: {node.target}")
             return
         
-        # tutupDB(nama)
-        match = re.match(r'tutupDB\((.+?)\)', line)
-        if match:
-            db_name = self._to_string(self._eval_expression(match.group(1)))
+        # queryStream(nama, query, parameter?, ukuranBatch?)
+        if isinstance(node, DbStreamStmt):
+            db_name = self._to_string(self._eval_expression(node.db_name))
+            query = self._to_string(self._eval_expression(node.query))
+            params = self._query_params(node.params)
+            fetch_size = DEFAULT_FETCH_SIZE
+            if node.fetch_size is not None:
+                fetch_size = int(self._to_number(self._eval_expression(node.fetch_size)))
+                if fetch_size < 1:
+                    raise Exception("Ukuran batch queryStream harus positif")
             
-            if db_name in self.runtime.db_connections:
-                self.runtime.db_connections[db_name].close()
-                del self.runtime.db_connections[db_name]
-                self.runtime.log(f"✅ Koneksi ditutup: {db_name}")
-            return
-    
-    # HTTP operations
-    
-    def _handle_http_operation(self, line: str):
-        """Handle HTTP operations"""
-        if not HAS_REQUESTS:
-            raise Exception("Library 'requests' tidak terinstall")
-        
-        # httpGet(url)
-        match = re.match(r'(\w+)\s*=\s*httpGet\((.+?)\)', line)
-        if match:
-            var_name = match.group(1)
-            url = self._to_string(self._eval_expression(match.group(2)))
+            if db_name not in self.runtime.db_connections:
+                raise Exception(f"Database '{db_name}' tidak terhubung")
             
             try:
-                response = requests.get(url, timeout=10)
-                result = {
-                    'status': response.status_code,
-                    'body': response.text,
-                    'json': response.json() if 'application/json' in response.headers.get('content-type', '') else None
-                }
-                self.runtime.set_variable(var_name, result)
-                self.runtime.log(f"✅ HTTP GET: {url} - Status {response.status_code}")
+                result = self.runtime.db_connections[db_name].stream(query, params, fetch_size)
             except Exception as e:
-                raise Exception(f"HTTP request gagal: {str(e)}")
+                raise Exception(f"Gagal menjalankan query: {str(e)}")
+            if isinstance(result, ResultSet):
+                self.runtime.result_sets.append(result)
+            
+            if node.target:
+                self._store(node.ref, result)
+                self.runtime.log(f"✅ Query dijalankan: {node.target}")
             return
         
-        # httpPost(url, data)
-        match = re.match(r'(\w+)\s*=\s*httpPost\((.+?),\s*(.+)\)', line)
-        if match:
-            var_name = match.group(1)
-            url = self._to_string(self._eval_expression(match.group(2)))
-            data = self._eval_expression(match.group(3))
+        # queryBatch(nama, query, baris)
+        if isinstance(node, DbBatchStmt):
+            db_name = self._to_string(self._eval_expression(node.db_name))
+            query = self._to_string(self._eval_expression(node.query))
+            rows = self._eval_expression(node.rows)
+            
+            if db_name not in self.runtime.db_connections:
+                raise Exception(f"Database '{db_name}' tidak terhubung")
             
             try:
-                response = requests.post(url, json=data, timeout=10)
-                result = {
-                    'status': response.status_code,
-                    'body': response.text,
-                    'json': response.json() if 'application/json' in response.headers.get('content-type', '') else None
-                }
-                self.runtime.set_variable(var_name, result)
-                self.runtime.log(f"✅ HTTP POST: {url} - Status {response.status_code}")
+                count = self.runtime.db_connections[db_name].execute_many(query, self._batch_rows(rows, query))
             except Exception as e:
-                raise Exception(f"HTTP request gagal: {str(e)}")
+                raise Exception(f"Gagal menjalankan batch: {str(e)}")
+            
+            if node.target:
+                self._store(node.ref, count)
+                self.runtime.log(f"✅ Batch dijalankan: {node.target} ({count} baris)")
             return
+        
+        # mulaiTransaksi(nama) / commitDB(nama) / rollbackDB(nama)
+        if isinstance(node, DbTransactionStmt):
+            conn = self._db_connection(node.name)
+            if node.action == 'mulai':
+                conn.begin()
+            elif node.action == 'commit':
+                conn.commit()
+            else:
+                conn.rollback()
+            return
+        
+        # tutupDB(nama)
+        db_name = self._to_string(self._eval_expression(node.name))
+        
+        if db_name in self.runtime.db_connections:
+            self.runtime.db_pool.release(self.runtime.db_connections.pop(db_name))
+            self.runtime.log(f"✅ Koneksi ditutup: {db_name}")
+    
+    def _db_connection(self, name_source: str):
+        db_name = self._to_string(self._eval_expression(name_source))
+        conn = self.runtime.db_connections.get(db_name)
+        if conn is None:
+            raise Exception(f"Database '{db_name}' tidak terhubung")
+        return conn
+    
+    def _begin_transaction(self, node: TransactionStmt):
+        self._db_connection(node.db_name).begin()
+    
+    def _commit_transaction(self, node: TransactionStmt):
+        self._db_connection(node.db_name).commit()
+    
+    def _batch_rows(self, rows: Any, query: str) -> Iterator[Union[tuple, dict]]:
+        """Parameter rows for queryBatch from an array, a stream or a CSV file path.
+        
+        Streams (bacaCSV, bacaJSONL, queryStream results) and CSV files are
+        read one row at a time while executemany consumes them. Objects, CSV
+        rows with a header and query rows bind by name if the query uses
+        named placeholders, in column order otherwise.
+        """
+        named = NAMED_PLACEHOLDER.search(query) is not None
+        if isinstance(rows, str):
+            rows = CsvReader(rows, header=True)
+        elif not isinstance(rows, (list, FileStream, ResultSet)):
+            raise Exception("queryBatch() butuh array baris, stream baris atau path file CSV")
+        for row in rows:
+            if isinstance(row, Row):
+                yield row.as_dict() if named else tuple(row.values)
+            elif isinstance(row, list):
+                yield tuple(row)
+            elif isinstance(row, dict):
+                yield row if named else tuple(row.values())
+            else:
+                raise Exception("Setiap baris queryBatch harus array atau object")
+    
+    def _query_params(self, source: Optional[str]) -> Union[tuple, dict]:
+        """Placeholder values for queryDB: an array binds in order, an object by name"""
+        if source is None:
+            return ()
+        params = self._eval_expression(source)
+        if isinstance(params, list):
+            return tuple(params)
+        if isinstance(params, dict):
+            return params
+        raise Exception("Parameter query harus array atau object")
+    
+    # HTTP operations
+    
+    def _handle_http_operation(self, node: Node):
+        """Handle HTTP operations"""
+        url = self._to_string(self._eval_expression(node.url))
+        
+        try:
+            if isinstance(node, HttpPostStmt):
+                # httpPost(url, data)
+                data = self._eval_expression(node.data)
+                response = self.runtime.http.request('POST', url, json=data)
+                method = 'POST'
+            else:
+                # httpGet(url)
+                response = self.runtime.http.request('GET', url)
+                method = 'GET'
+            result = {
+                'status': response.status_code,
+                'body': response.text,
+                'json': response.json() if 'application/json' in response.headers.get('content-type', '') else None
+            }
+        except Exception as e:
+            raise Exception(f"HTTP request gagal: {str(e)}")
+        
+        if node.target:
+            self._store(node.ref, result)
+        self.runtime.log(f"✅ HTTP {method}: {url} - Status {response.status_code}")
+
+
+# Lines of output kept in memory when running a file (nothing reads more)
+RUN_FILE_OUTPUT_LINES = 1000
 
 
-def run_file(filepath: str):
+def run_file(filepath: str, quiet: bool = False, budget: Optional[Budget] = None,
+             memoize: str = 'auto'):
     """Run a HambaLang file"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -1032,7 +1923,8 @@ def run_file(filepath: str):
         print(f"🏗️  Menjalankan: {filepath}\n")
         print("=" * 50)
         
-        interpreter = HambaInterpreter()
+        sink = OutputSink(max_lines=RUN_FILE_OUTPUT_LINES, quiet=quiet)
+        interpreter = HambaInterpreter(HambaRuntime(sink), budget=budget, memoize=memoize)
         interpreter.execute(code)
         
         print("=" * 50)
@@ -1056,17 +1948,23 @@ def main():
         except:
             pass
     
-    if len(sys.argv) < 2:
-        print("Usage: python hamba_v2.py <file.hl>")
-        sys.exit(1)
-    
-    filepath = sys.argv[1]
+    import argparse
+    parser = argparse.ArgumentParser(description="HambaLang v2.0 Interpreter")
+    parser.add_argument('file', help='Path to .hl file')
+    parser.add_argument('--quiet', action='store_true', help='Capture output without printing it')
+    parser.add_argument('--fuel', type=int, default=None, help='Execution fuel (loop iterations/calls)')
+    parser.add_argument('--timeout', type=float, default=None, help='Wall-clock limit (seconds)')
+    parser.add_argument('--max-memory', type=int, default=None, help='Memory ceiling (bytes)')
+    parser.add_argument('--memo', choices=MEMOIZE_MODES, default='auto',
+                        help='Memoize pure functions: auto, only @murni, or off')
+    args = parser.parse_args()
     
-    if not filepath.endswith('.hl'):
+    if not args.file.endswith('.hl'):
         print("❌ File harus berekstensi .hl")
         sys.exit(1)
     
-    run_file(filepath)
+    budget = Budget(fuel=args.fuel, deadline=args.timeout, memory=args.max_memory)
+    run_file(args.file, quiet=args.quiet, budget=budget, memoize=args.memo)
 
 
 if __name__ == '__main__':
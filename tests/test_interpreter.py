@@ -10,6 +10,8 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'interpreter'))
 
 from hamba_v2 import HambaInterpreter, HambaRuntime
+from hamba_ast import parse, build_block_index, FunctionDef, ForRangeStmt, IfStmt, AssignStmt
+from hamba_lexer import HambaError, tokenize, split_lines
 
 
 def test_basic_variables():
@@ -197,6 +199,1333 @@ def test_satire_functions():
         return False
 
 
+def test_ast_parser():
+    """Test that source is parsed once into typed nodes"""
+    print("Testing: AST Parser...")
+    
+    code = """
+    fungsi hitung(n)
+        total = 0
+        untuk i dari 1 sampai n
+            jika i % 2 == 0
+                total = total + i
+            akhir
+        akhir
+        kembalikan total
+    akhir
+    data = [
+        1,
+        2
+    ]
+    """
+    
+    try:
+        program = parse(code)
+        func = program.body[0]
+        assert isinstance(func, FunctionDef)
+        assert func.params == ['n']
+        assert isinstance(func.body[1], ForRangeStmt)
+        assert isinstance(func.body[1].body[0], IfStmt)
+        assert isinstance(program.body[1], AssignStmt)
+        assert program.body[1].line == 11
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_nested_blocks_in_function():
+    """Test nested loops inside a function body"""
+    print("Testing: Nested Blocks in Function...")
+    
+    code = """
+    fungsi hitung(n)
+        total = 0
+        untuk i dari 1 sampai n
+            untuk j dari 1 sampai 2
+                total = total + 1
+            akhir
+        akhir
+        kembalikan total
+    akhir
+    
+    hasil = hitung(3)
+    """
+    
+    runtime = HambaRuntime()
+    interpreter = HambaInterpreter(runtime)
+    
+    try:
+        interpreter.execute(code)
+        assert runtime.get_variable('hasil') == 6
+        
+        # Errors in a body that never runs are still reported when the program loads
+        from hamba_output import OutputSink
+        for body, line in (('hentikan', 3), ('jika benar\n lanjut\n akhir', 4),
+                           ('transaksi "db"\n kembalikan 1\n akhir', 4)):
+            runtime = HambaRuntime(OutputSink(quiet=True))
+            try:
+                HambaInterpreter(runtime).execute(f'print "mulai"\nfungsi f()\n{body}\nakhir')
+                raise AssertionError(f"fungsi tanpa panggilan diterima: {body!r}")
+            except HambaError as e:
+                assert e.line == line, (body, e.line)
+            assert runtime.output == []
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_expression_cache():
+    """Test that repeated expressions are compiled once"""
+    print("Testing: Expression Cache...")
+    
+    code = """
+    x = 0
+    selama x < 10
+        x = x + 1
+    akhir
+    y = x + 1
+    """
+    
+    runtime = HambaRuntime()
+    interpreter = HambaInterpreter(runtime, expression_cache_size=2)
+    
+    try:
+        interpreter.execute(code)
+        stats = interpreter.expression_cache.stats()
+        assert runtime.get_variable('x') == 10
+        assert runtime.get_variable('y') == 11
+        assert stats['misses'] == 3
+        assert stats['hits'] == 1
+        assert stats['size'] == 2
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_operator_precedence():
+    """Test operator precedence and associativity"""
+    print("Testing: Operator Precedence...")
+    
+    code = """
+    a = 10 - 3 - 2
+    b = 2 + 3 * 4
+    c = (2 + 3) * 4
+    d = 1 < 2 dan 3 == 3
+    e = "a=" + "b"
+    """
+    
+    runtime = HambaRuntime()
+    interpreter = HambaInterpreter(runtime)
+    
+    try:
+        interpreter.execute(code)
+        assert runtime.get_variable('a') == 5
+        assert runtime.get_variable('b') == 14
+        assert runtime.get_variable('c') == 20
+        assert runtime.get_variable('d') == True
+        assert runtime.get_variable('e') == "a=b"
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_block_index():
+    """Test the opener -> partner table built at load time"""
+    print("Testing: Block Index...")
+    
+    code = """jika a
+    untuk i dari 1 sampai 2
+    akhir
+ataujika b
+atau
+akhir
+selama c
+    jika d
+    akhir"""
+    
+    try:
+        index = build_block_index(split_lines(tokenize(code))[:6])
+        assert index == {0: [3, 4, 5], 1: [2]}
+        try:
+            parse(code)
+            assert False, "blok tanpa akhir harus ditolak"
+        except Exception as e:
+            assert "baris 7" in str(e) and "selama" in str(e)
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_elif_short_circuit():
+    """Test that ataujika conditions stop once a branch has run"""
+    print("Testing: Elif Short-Circuit...")
+    
+    code = """
+    dicek = []
+    fungsi cek(n, hasil)
+        tambahArray(dicek, n)
+        kembalikan hasil
+    akhir
+    
+    jika cek(1, salah)
+        x = 1
+    ataujika cek(2, benar)
+        x = 2
+    ataujika cek(3, benar)
+        x = 3
+    atau
+        x = 4
+    akhir
+    """
+    
+    runtime = HambaRuntime()
+    interpreter = HambaInterpreter(runtime)
+    
+    try:
+        interpreter.execute(code)
+        assert runtime.get_variable('x') == 2
+        assert runtime.get_variable('dicek') == [1, 2]
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_lexer_positions():
+    """Test that the shared lexer reports line and column positions"""
+    print("Testing: Lexer Positions...")
+    
+    code = """x = 1 // komentar
+teks = "dua
+baris"
+y = [1,
+  2]
+z = x $ 2"""
+    
+    try:
+        tokens = tokenize(code.split('\nz')[0])
+        lines = split_lines(tokens)
+        assert len(lines) == 3
+        assert [t.text for t in lines[0]] == ['x', '=', '1']
+        assert lines[1][2].kind == 'string' and lines[1][2].col == 8
+        assert lines[2][0].line == 4 and lines[2][-1].line == 5
+        try:
+            tokenize(code)
+            assert False, "karakter asing harus ditolak"
+        except Exception as e:
+            assert "baris 6, kolom 7" in str(e)
+        try:
+            parse("a = 1\nb = (2 +\n)")
+            assert False, "ekspresi tidak lengkap harus ditolak"
+        except Exception as e:
+            assert "baris 3, kolom 1" in str(e)
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_shared_lexer_front_ends():
+    """Test that the v1 and advanced front ends consume the token stream"""
+    print("Testing: Shared Lexer Front Ends...")
+    
+    try:
+        from hamba_advanced import Parser as AdvancedParser, SetStmt, IfStmt as AdvancedIf
+        from hamba import HambaInterpreter as LegacyInterpreter, HambaRuntime as LegacyRuntime
+        
+        program = AdvancedParser('set x = 1 + 2 * 3 // hitung\njika x > 5\n    lapor "besar"\nakhir').parse()
+        assert isinstance(program.body[0], SetStmt)
+        assert program.body[0].expr == '1 + 2 * 3'
+        assert isinstance(program.body[1], AdvancedIf) and program.body[1].line == 2
+        assert '1 + 2 * 3' in program.expressions
+        
+        runtime = LegacyRuntime()
+        LegacyInterpreter(runtime).execute('anggaran = 500\njika anggaran < 1000 maka progress = 50')
+        assert runtime.anggaran == 500
+        assert runtime.progress == 50
+        
+        # Built-in variables are read through the slots resolved at load time
+        from hamba_output import OutputSink
+        runtime = LegacyRuntime(OutputSink(quiet=True))
+        LegacyInterpreter(runtime).execute('progress = 40\njika progress < 50 maka status_proyek = "Molor"\n'
+                                           'lapor progress\nlapor status_proyek\nlapor anggaran')
+        assert runtime.globals == [1_000_000_000, "Molor", 40]
+        assert runtime.output == ["40%", "Molor", "Rp 1,000,000,000"]
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_call_frames():
+    """Test local call frames, recursion and `global` declarations"""
+    print("Testing: Call Frames...")
+    
+    code = """
+    total = 0
+    faktor = 2
+    
+    fungsi fib(n)
+        jika n < 2
+            kembalikan n
+        akhir
+        kembalikan fib(n - 1) + fib(n - 2)
+    akhir
+    
+    fungsi catat(x)
+        sementara = x * faktor
+        global total
+        total = total + sementara
+        kembalikan sementara
+    akhir
+    
+    hasil = fib(10)
+    a = catat(5)
+    b = catat(1)
+    """
+    
+    runtime = HambaRuntime()
+    interpreter = HambaInterpreter(runtime)
+    
+    try:
+        interpreter.execute(code)
+        assert runtime.get_variable('hasil') == 55
+        assert runtime.get_variable('total') == 12
+        assert 'sementara' not in runtime.variables
+        assert 'n' not in runtime.variables
+        assert runtime.frames == [] and runtime.frame is None
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_slot_resolution():
+    """Test that identifiers are resolved to fixed frame slots"""
+    print("Testing: Slot Resolution...")
+    
+    code = """
+    x = 7
+    fungsi geser(a)
+        b = a + x
+        global hasil
+        hasil = b
+        anggaran = anggaran - b
+        untuk i dari 1 sampai 2
+            b = b + i
+        akhir
+        kembalikan b
+    akhir
+    akhirnya = geser(3)
+    """
+    
+    try:
+        runtime = HambaRuntime()
+        interpreter = HambaInterpreter(runtime)
+        interpreter.execute(code)
+        func = runtime.functions['geser']
+        assert func.slots == {'a': 0, 'b': 1, 'i': 2}
+        assert runtime.get_variable('hasil') == 10
+        assert runtime.get_variable('akhirnya') == 13
+        assert runtime.anggaran == 1_000_000_000 - 10
+        assert runtime.global_index['anggaran'] == 0
+        assert 'b' not in runtime.variables and 'i' not in runtime.variables
+        
+        from hamba_advanced import Runtime as AdvancedRuntime
+        rt = AdvancedRuntime()
+        rt.set('x', 1)
+        rt.push_scope()
+        rt.set('x', 2)
+        assert rt.get('x') == 2
+        rt.pop_scope()
+        assert rt.get('x') == 1 and rt.get('tahun') == 2011
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_deep_recursion():
+    """Test that recursion depth is bounded by the interpreter, not by Python"""
+    print("Testing: Deep Recursion...")
+    
+    code = """
+    fungsi turun(n)
+        jika n == 0
+            kembalikan 0
+        akhir
+        kembalikan turun(n - 1) + 1
+    akhir
+    
+    hasil = turun(3000)
+    """
+    
+    try:
+        runtime = HambaRuntime()
+        HambaInterpreter(runtime).execute(code)
+        assert runtime.get_variable('hasil') == 3000
+        
+        runtime = HambaRuntime()
+        try:
+            HambaInterpreter(runtime, max_call_depth=100).execute(code)
+            raise AssertionError("stack overflow tidak terdeteksi")
+        except HambaError as e:
+            assert 'Stack overflow' in str(e) and e.line == 6
+        assert runtime.frames == []
+        
+        from hamba_advanced import Parser as AdvancedParser, Runtime as AdvancedRuntime, \
+            Evaluator, StackOverflowError
+        source = """
+        prosedur turun()
+            set n = n - 1
+            jika n > 0
+                turun()
+            akhir
+        akhirProsedur
+        set n = 2000
+        turun()
+        """
+        rt = AdvancedRuntime(step_limit=100_000, max_depth=5000)
+        evaluator = Evaluator(rt)
+        evaluator.execute(AdvancedParser(source).parse())
+        assert rt.get('n') == 2000 and len(rt.scopes) == 1 and evaluator.depth == 0
+        
+        rt = AdvancedRuntime(step_limit=100_000, max_depth=50)
+        try:
+            Evaluator(rt).execute(AdvancedParser(source).parse())
+            raise AssertionError("stack overflow tidak terdeteksi")
+        except StackOverflowError:
+            pass
+        assert len(rt.scopes) == 1
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_integer_arithmetic():
+    """Test that integer math stays integral and loop counters are ints"""
+    print("Testing: Integer Arithmetic...")
+    
+    code = """
+    terakhir = 0
+    untuk i dari 1 sampai 3
+        terakhir = i
+    akhir
+    bagi = 10 / 2
+    pecahan = 7 / 2
+    sisa = 17 % 5
+    campur = 2 * 1.5
+    dari_teks = angka("42") + 1
+    garis = "=" * 3
+    anggaran = anggaran - 1
+    """
+    
+    runtime = HambaRuntime()
+    interpreter = HambaInterpreter(runtime)
+    
+    try:
+        interpreter.execute(code)
+        values = runtime.variables
+        assert type(values['terakhir']) is int and values['terakhir'] == 3
+        assert type(values['bagi']) is int and values['bagi'] == 5
+        assert values['pecahan'] == 3.5
+        assert type(values['sisa']) is int and values['sisa'] == 2
+        assert type(values['campur']) is float and values['campur'] == 3.0
+        assert type(values['dari_teks']) is int and values['dari_teks'] == 43
+        assert values['garis'] == "==="
+        assert runtime.anggaran == 999_999_999 and type(runtime.anggaran) is int
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_output_sink():
+    """Test buffered output, bounded capture and quiet mode"""
+    print("Testing: Output Sink...")
+    
+    import io
+    from hamba_output import OutputSink
+    
+    try:
+        stream = io.StringIO()
+        sink = OutputSink(stream, buffer_size=1 << 20, flush_interval=60, max_lines=2)
+        runtime = HambaRuntime(sink)
+        HambaInterpreter(runtime).execute("""
+        untuk i dari 1 sampai 5
+            lapor "baris " + teks(i)
+        akhir
+        """)
+        assert stream.getvalue().splitlines() == [f"baris {i}" for i in range(1, 6)]
+        assert runtime.get_output() == "baris 4\nbaris 5"
+        
+        sink.write("tertunda")
+        assert stream.getvalue().count("\n") == 5
+        sink.flush()
+        assert stream.getvalue().endswith("tertunda\n")
+        
+        sink = OutputSink(io.StringIO(), max_chars=10)
+        for text in ("aaaa", "bbbb", "cccc"):
+            sink.write(text)
+        assert sink.getvalue() == "bbbb\ncccc"
+        
+        stream = io.StringIO()
+        runtime = HambaRuntime(OutputSink(stream, quiet=True))
+        HambaInterpreter(runtime).execute('lapor "diam"')
+        assert stream.getvalue() == "" and runtime.get_output() == "diam"
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_dispatch_tables():
+    """Test that builtins and call statements register into dispatch tables"""
+    print("Testing: Dispatch Tables...")
+    
+    from dataclasses import dataclass
+    from hamba_ast import Node, register_call_statement, CALL_STATEMENTS, ASSIGNABLE_CALLS
+    
+    @dataclass
+    class AuditStmt(Node):
+        target: str
+        expr: str
+        ref: object = None
+    
+    code = """
+    x = gandakan(21)
+    hasil = catatAudit("laporan " + teks(x))
+    """
+    
+    try:
+        register_call_statement(
+            'catatAudit', 1,
+            lambda line, target, args: AuditStmt(line=line, target=target, expr=args[0]),
+            assignable=True,
+        )
+        runtime = HambaRuntime()
+        interpreter = HambaInterpreter(runtime)
+        interpreter.register_builtin('gandakan', lambda args: args[0] * 2)
+        interpreter.register_statement(
+            AuditStmt,
+            lambda node: interpreter._store(node.ref, interpreter._eval_expression(node.expr).upper()),
+        )
+        interpreter.execute(code)
+        assert runtime.get_variable('x') == 42
+        assert runtime.get_variable('hasil') == "LAPORAN 42"
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+    finally:
+        CALL_STATEMENTS.pop('catatAudit', None)
+        ASSIGNABLE_CALLS.discard('catatAudit')
+
+
+def test_execution_budget():
+    """Test fuel, deadline and typed exhaustion errors across interpreters"""
+    print("Testing: Execution Budget...")
+    
+    from hamba_budget import Budget, FuelExhausted, DeadlineExceeded
+    
+    try:
+        # No hidden 10k cutoff on `selama` any more
+        runtime = HambaRuntime()
+        HambaInterpreter(runtime).execute("""
+        x = 0
+        selama x < 20000
+            x = x + 1
+        akhir
+        """)
+        assert runtime.get_variable('x') == 20000
+        
+        budget = Budget(fuel=500)
+        try:
+            HambaInterpreter(budget=budget).execute("""
+            fungsi putar()
+                selama benar
+                    y = 1
+                akhir
+            akhir
+            putar()
+            """)
+            raise AssertionError("fuel tidak habis")
+        except FuelExhausted as e:
+            assert e.line == 3 and e.limit == 500
+        
+        try:
+            HambaInterpreter(budget=Budget(deadline=0.05)).execute("""
+            selama benar
+                y = 1
+            akhir
+            """)
+            raise AssertionError("deadline tidak terlampaui")
+        except DeadlineExceeded:
+            pass
+        
+        from hamba_advanced import Parser as AdvancedParser, Runtime as AdvancedRuntime, Evaluator
+        source = """
+        coba
+            Rapat(100000)
+                set x = 1
+            selesaiRapat
+        jikaGagal
+            lapor "tertangkap"
+        akhirCoba
+        """
+        rt = AdvancedRuntime(budget=Budget(fuel=300))
+        try:
+            Evaluator(rt).execute(AdvancedParser(source).parse())
+            raise AssertionError("fuel tidak habis")
+        except FuelExhausted:
+            pass
+        assert len(rt.scopes) == 1
+        
+        from hamba import HambaInterpreter as V1Interpreter
+        try:
+            V1Interpreter(budget=Budget(fuel=2)).execute('status_proyek = "A"\nprogress = 1\nprogress = 2')
+            raise AssertionError("fuel tidak habis")
+        except FuelExhausted:
+            pass
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+def test_constant_folding():
+    """Test literal-only subexpressions are evaluated once at load time"""
+    print("Testing: Constant Folding...")
+    try:
+        from hamba_expr import Const, Template, parse_expression, fold_constants
+        from hamba_advanced import ExpressionEvaluator, Runtime as AdvancedRuntime
+        
+        interpreter = HambaInterpreter()
+        assert interpreter._fold(parse_expression('2 * 3 + 1')) == Const(7)
+        assert interpreter._fold(parse_expression('"Rp " + "1"')) == Const("Rp 1")
+        assert isinstance(interpreter._fold(parse_expression('[1, 2 + 3, [4]]')), Template)
+        # Failing folds stay in the tree so the error keeps its line number
+        assert not isinstance(interpreter._fold(parse_expression('1 / 0')), Const)
+        
+        interpreter.execute("""
+        untuk i dari 1 sampai 3
+            baris = [0, [0]]
+            baris[0] = i
+            tambahArray(baris[1], i)
+            lapor baris
+        akhir
+        """)
+        assert interpreter.runtime.output == ['[1, [0, 1]]', '[2, [0, 2]]', '[3, [0, 3]]']
+        
+        # hamba_advanced folds with its own operators ("+" joins text and numbers)
+        evaluator = ExpressionEvaluator(AdvancedRuntime())
+        assert fold_constants(parse_expression('"n=" + 2 * 2'), evaluator._eval) == Const("n=4")
+        first = evaluator.eval('[1, 2]')
+        first.append(3)
+        assert evaluator.eval('[1, 2]') == [1, 2]
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_memoization():
+    """Test pure functions are detected and memoized"""
+    print("Testing: Pure Function Memoization...")
+    try:
+        code = """
+        fungsi fib(n)
+            jika n < 2
+                kembalikan n
+            akhir
+            kembalikan fib(n - 1) + fib(n - 2)
+        akhir
+        fungsi sapa(n)
+            lapor "halo"
+            kembalikan n
+        akhir
+        skala = 2
+        fungsi kali(n)
+            kembalikan n * skala
+        akhir
+        @murni
+        fungsi kaliPaksa(n)
+            kembalikan n * skala
+        akhir
+        hasil = fib(80)
+        x = sapa(1) + sapa(1)
+        a = kaliPaksa(3)
+        skala = 10
+        b = kaliPaksa(3)
+        c = kali(3)
+        """
+        interpreter = HambaInterpreter()
+        interpreter.execute(code)
+        get = interpreter.runtime.get_variable
+        assert get('hasil') == 23416728348467685
+        assert interpreter.pure_functions == {'fib'}
+        stats = interpreter.memo_stats()
+        assert set(stats) == {'fib', 'kaliPaksa'}
+        assert stats['fib']['misses'] == 81
+        # Impure functions still run every time; @murni trusts the annotation
+        assert interpreter.runtime.output.count('halo') == 2
+        assert (get('a'), get('b'), get('c')) == (6, 6, 30)
+        
+        interpreter = HambaInterpreter(memoize='murni')
+        interpreter.execute(code.replace('fib(80)', 'fib(10)'))
+        assert set(interpreter.memo_stats()) == {'kaliPaksa'}
+        
+        # A local read before it is assigned on every path falls back to the global
+        interpreter = HambaInterpreter()
+        interpreter.execute("""
+        x = 5
+        fungsi f(n)
+            jika n > 0
+                x = 1
+            akhir
+            kembalikan x
+        akhir
+        fungsi g(n)
+            jika n > 0
+                y = 1
+            atau
+                y = 2
+            akhir
+            kembalikan y
+        akhir
+        a = f(0)
+        x = 7
+        b = f(0)
+        """)
+        get = interpreter.runtime.get_variable
+        assert (get('a'), get('b')) == (5, 7)
+        assert interpreter.pure_functions == {'g'}
+        
+        try:
+            HambaInterpreter().execute("@murni\nx = 1")
+            raise AssertionError("anotasi tanpa fungsi diterima")
+        except HambaError:
+            pass
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_bulk_builtins():
+    """Test whole-array builtins"""
+    print("Testing: Bulk Array Builtins...")
+    try:
+        interpreter = HambaInterpreter()
+        interpreter.execute("""
+        data = [5, 3, 8, 1]
+        total = jumlah(data)
+        rata = rataRata(data)
+        rentang = maksimum(data) - minimum(data)
+        fungsi kuadrat(x)
+            kembalikan x * x
+        akhir
+        fungsi genap(x)
+            kembalikan x % 2 == 0
+        akhir
+        genapKuadrat = saring(peta(data, "kuadrat"), "genap")
+        turun = urutkan(data, kosong, benar)
+        orang = [{"nama": "Budi", "umur": 30}, {"nama": "Ani", "umur": 20}]
+        nama = gabung(peta(urutkan(orang, "umur"), "nama"), ", ")
+        tengah = potong(data, 1, 3)
+        posisi = indeksDari(data, 8)
+        grid = isiArray(2, [0])
+        baris = grid[0]
+        baris[0] = 9
+        """)
+        get = interpreter.runtime.get_variable
+        assert get('total') == 17 and isinstance(get('total'), int)
+        assert get('rata') == 4.25
+        assert get('rentang') == 7
+        assert get('genapKuadrat') == [64]
+        assert get('turun') == [8, 5, 3, 1]
+        assert get('data') == [5, 3, 8, 1]
+        assert get('nama') == "Ani, Budi"
+        assert get('tengah') == [3, 8]
+        assert get('posisi') == 2
+        assert get('grid') == [[9], [0]]
+        
+        try:
+            interpreter.execute('x = minimum([])')
+            raise AssertionError("minimum([]) tidak gagal")
+        except HambaError:
+            pass
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_numeric_arrays():
+    """Test packed numeric arrays"""
+    print("Testing: Packed Numeric Arrays...")
+    try:
+        from hamba_numeric import NumericArray
+        
+        interpreter = HambaInterpreter()
+        interpreter.execute("""
+        harga = angkaArray([10, 20, 30])
+        dasar = angkaArray(3, 1)
+        hasil = harga * 2 + dasar
+        hasil[0] = 0
+        total = 0
+        untuk x dalam hasil
+            total = total + x
+        akhir
+        n = panjang(hasil)
+        kedua = hasil[1]
+        ringkas = jumlah(hasil) - maksimum(hasil)
+        ekor = potong(hasil, 1)
+        negatif = -harga / 10
+        """)
+        get = interpreter.runtime.get_variable
+        assert isinstance(get('hasil'), NumericArray)
+        assert get('hasil').tolist() == [0.0, 41.0, 61.0]
+        assert get('total') == 102.0
+        assert get('n') == 3
+        assert get('kedua') == 41.0
+        assert get('ringkas') == 41.0
+        assert get('ekor').tolist() == [41.0, 61.0]
+        assert get('negatif').tolist() == [-1.0, -2.0, -3.0]
+        assert get('harga').tolist() == [10.0, 20.0, 30.0]
+        
+        try:
+            interpreter.execute('x = angkaArray(2) + angkaArray(3)')
+            raise AssertionError("panjang berbeda diterima")
+        except HambaError:
+            pass
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_string_building():
+    """Test self-append and text builder builtins"""
+    print("Testing: String Building...")
+    try:
+        interpreter = HambaInterpreter()
+        interpreter.execute("""
+        laporan = ""
+        untuk i dari 1 sampai 3
+            laporan = laporan + "baris " + teks(i) + ";"
+        akhir
+        salinan = laporan
+        laporan = laporan + "!"
+        fungsi ulang(k)
+            s = "-"
+            untuk i dari 1 sampai k
+                s = s + "x"
+            akhir
+            kembalikan s
+        akhir
+        garis = ulang(4)
+        hitung = 1
+        hitung = hitung + 2
+        bagian = []
+        tambahTeks(bagian, "a")
+        tambahTeks(bagian, 2)
+        gabungan = gabungTeks(bagian, ", ")
+        """)
+        get = interpreter.runtime.get_variable
+        assert get('laporan') == "baris 1;baris 2;baris 3;!"
+        assert get('salinan') == "baris 1;baris 2;baris 3;"
+        assert get('garis') == "-xxxx"
+        assert get('hitung') == 3
+        assert get('gabungan') == "a, 2"
+        
+        try:
+            interpreter.execute('laporan = laporan + 1')
+            raise AssertionError("teks + angka diterima")
+        except HambaError:
+            pass
+        assert get('laporan') == "baris 1;baris 2;baris 3;!"
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_db_pool():
+    """Test pooled SQLite connections and parameterized queries"""
+    print("Testing: Database Pool...")
+    try:
+        import tempfile
+        from hamba_output import OutputSink
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'pool.db').replace('\\', '/')
+            interpreter = HambaInterpreter(HambaRuntime(OutputSink(quiet=True)))
+            runtime = interpreter.runtime
+            interpreter.register_builtin('statistikPool', lambda args: runtime.db_pool.stats())
+            interpreter.execute(f"""
+            sambungDB("a", "sqlite", "{path}")
+            sambungDB("b", "sqlite", "{path}")
+            buat = queryDB("a", "CREATE TABLE proyek (id INTEGER, nama TEXT)")
+            untuk i dari 1 sampai 5
+                n = queryDB("b", "INSERT INTO proyek VALUES (?, ?)", [i, "P'" + teks(i)])
+            akhir
+            besar = queryDB("a", "SELECT nama FROM proyek WHERE id > :batas ORDER BY id", {{"batas": 3}})
+            tutupDB("a")
+            statistik = statistikPool()
+            """)
+            assert runtime.get_variable('besar') == [("P'4",), ("P'5",)]
+            stats = runtime.get_variable('statistik')[f"sqlite:{path}"]
+            assert stats['users'] == 1
+            assert stats['hits'] == 4 and stats['misses'] == 3
+            # Names left open are released and idle connections closed at program end
+            assert runtime.db_connections == {} and runtime.db_pool.stats() == {}
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_db_batch():
+    """Test queryBatch inserts rows in one transaction"""
+    print("Testing: Database Batch Insert...")
+    try:
+        import tempfile
+        from hamba_output import OutputSink
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'batch.db').replace('\\', '/')
+            csv_path = os.path.join(tmp, 'proyek.csv').replace('\\', '/')
+            with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+                f.write("nama,anggaran\nWisma,300\nStadion,400\n")
+            
+            interpreter = HambaInterpreter(HambaRuntime(OutputSink(quiet=True)))
+            interpreter.execute(f"""
+            sambungDB("db", "sqlite", "{path}")
+            buat = queryDB("db", "CREATE TABLE proyek (nama TEXT, anggaran INTEGER)")
+            a = queryBatch("db", "INSERT INTO proyek VALUES (?, ?)", [["Hambalang", 100], ["Meikarta", 200]])
+            b = queryBatch("db", "INSERT INTO proyek VALUES (:nama, :anggaran)", "{csv_path}")
+            c = queryBatch("db", "INSERT INTO proyek VALUES (?, ?)", bacaCSV("{csv_path}"))
+            buat = queryDB("db", "CREATE TABLE salinan (nama TEXT, anggaran INTEGER)")
+            hasil = queryStream("db", "SELECT nama, anggaran FROM proyek", [], 2)
+            d = queryBatch("db", "INSERT INTO salinan VALUES (:nama, :anggaran)", hasil)
+            """)
+            get = interpreter.runtime.get_variable
+            assert (get('a'), get('b'), get('c'), get('d')) == (2, 2, 2, 6)
+            
+            try:
+                interpreter.execute(f'sambungDB("db", "sqlite", "{path}")\n'
+                                    'gagal = queryBatch("db", "INSERT INTO proyek VALUES (?, ?)", [["X", 1], ["Y"]])')
+                raise AssertionError("baris tidak lengkap diterima")
+            except HambaError:
+                pass
+            interpreter.execute(f'sambungDB("db", "sqlite", "{path}")\n'
+                                'total = queryDB("db", "SELECT SUM(anggaran), COUNT(*) FROM proyek")')
+            assert get('total') == [(1700, 6)]
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_db_stream():
+    """Test queryStream fetches rows lazily and reads them by column name"""
+    print("Testing: Database Streaming Query...")
+    try:
+        import tempfile
+        from hamba_output import OutputSink
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'stream.db').replace('\\', '/')
+            interpreter = HambaInterpreter(HambaRuntime(OutputSink(quiet=True)))
+            interpreter.execute(f"""
+            sambungDB("db", "sqlite", "{path}")
+            buat = queryDB("db", "CREATE TABLE proyek (nama TEXT, anggaran INTEGER)")
+            n = queryBatch("db", "INSERT INTO proyek VALUES (?, ?)", [["A", 1], ["B", 2], ["C", 3], ["D", 4], ["E", 5]])
+            hasil = queryStream("db", "SELECT nama, anggaran FROM proyek WHERE anggaran > ?", [1], 2)
+            nama = kolom(hasil)
+            total = 0
+            semua = ""
+            untuk baris dalam hasil
+                total = total + baris["anggaran"]
+                semua = semua + baris[0]
+            akhir
+            tutupDB("db")
+            """)
+            get = interpreter.runtime.get_variable
+            assert get('nama') == ['nama', 'anggaran']
+            assert (get('total'), get('semua')) == (14, "BCDE")
+            result = get('hasil')
+            assert result.fetched == 4 and result.cursor is None
+            
+            # A second pass is an error, not an empty loop
+            try:
+                interpreter.execute(f"""
+                sambungDB("db", "sqlite", "{path}")
+                hasil = queryStream("db", "SELECT nama FROM proyek")
+                untuk baris dalam hasil
+                akhir
+                untuk baris dalam hasil
+                akhir
+                """)
+                raise AssertionError("hasil dibaca dua kali")
+            except HambaError as e:
+                assert "hanya bisa dibaca sekali" in str(e)
+            
+            # Leaving the loop early still closes the cursor when the program ends
+            interpreter.execute(f"""
+            sambungDB("db", "sqlite", "{path}")
+            awal = queryStream("db", "SELECT nama FROM proyek", [], 1)
+            untuk baris dalam awal
+                hentikan
+            akhir
+            """)
+            early = get('awal')
+            assert early.fetched == 1 and early.cursor is None
+            assert not interpreter.runtime.result_sets
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_db_transactions():
+    """Test transaksi blocks and transaction statements commit once or roll back"""
+    print("Testing: Database Transactions...")
+    try:
+        import tempfile
+        from hamba_output import OutputSink
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'transaksi.db').replace('\\', '/')
+            interpreter = HambaInterpreter(HambaRuntime(OutputSink(quiet=True)))
+            interpreter.execute(f"""
+            sambungDB("db", "sqlite", "{path}", "cepat")
+            mode = queryDB("db", "PRAGMA journal_mode")
+            buat = queryDB("db", "CREATE TABLE proyek (nama TEXT UNIQUE)")
+            transaksi "db"
+                untuk i dari 1 sampai 3
+                    n = queryDB("db", "INSERT INTO proyek VALUES (?)", ["P" + teks(i)])
+                akhir
+            akhir
+            mulaiTransaksi("db")
+            n = queryDB("db", "INSERT INTO proyek VALUES ('batal')")
+            rollbackDB("db")
+            mulaiTransaksi("db")
+            n = queryDB("db", "INSERT INTO proyek VALUES ('jadi')")
+            commitDB("db")
+            """)
+            get = interpreter.runtime.get_variable
+            assert get('mode') == [('wal',)]
+            
+            connect = f'sambungDB("db", "sqlite", "{path}")\n'
+            try:
+                interpreter.execute(connect + """
+                transaksi "db"
+                    n = queryDB("db", "INSERT INTO proyek VALUES ('setengah')")
+                    n = queryDB("db", "INSERT INTO proyek VALUES ('P1')")
+                akhir
+                """)
+                raise AssertionError("duplikat diterima")
+            except HambaError as e:
+                assert "UNIQUE" in str(e)
+            # A transaction never committed is rolled back when the program ends
+            interpreter.execute(connect + 'mulaiTransaksi("db")\nn = queryDB("db", "INSERT INTO proyek VALUES (\'lupa\')")')
+            assert "Transaksi tanpa commit dibatalkan: db" in interpreter.runtime.output[-1]
+            import sqlite3
+            other = sqlite3.connect(path, timeout=0)
+            other.execute("INSERT INTO proyek VALUES ('luar')")
+            other.commit()
+            other.close()
+            interpreter.execute(connect + 'semua = queryDB("db", "SELECT nama FROM proyek ORDER BY nama")')
+            assert get('semua') == [('P1',), ('P2',), ('P3',), ('jadi',), ('luar',)]
+            
+            for code in ('untuk i dari 1 sampai 2\n transaksi "db"\n hentikan\n akhir\nakhir',
+                         'fungsi f()\n transaksi "db"\n kembalikan 1\n akhir\nakhir\nx = f()'):
+                try:
+                    interpreter.execute(code)
+                    raise AssertionError("lompatan keluar transaksi diterima")
+                except HambaError as e:
+                    assert 'transaksi' in str(e)
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_streaming_file_readers():
+    """Test bacaBaris and bacaPotongan read files lazily in `untuk ... dalam`"""
+    print("Testing: Streaming File Readers...")
+    try:
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'log.txt').replace('\\', '/')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("".join(f"baris {i}\n" for i in range(1000)) + "akhir tanpa newline")
+            
+            interpreter = HambaInterpreter()
+            interpreter.execute(f"""
+            jumlahBaris = 0
+            terakhir = ""
+            untuk baris dalam bacaBaris("{path}", 4096)
+                jumlahBaris = jumlahBaris + 1
+                terakhir = baris
+            akhir
+            potongan = []
+            untuk p dalam bacaPotongan("{path}", 5000)
+                tambahArray(potongan, panjang(p))
+            akhir
+            """)
+            get = interpreter.runtime.get_variable
+            assert (get('jumlahBaris'), get('terakhir')) == (1001, "akhir tanpa newline")
+            assert get('potongan') == [5000, 4909]
+            
+            try:
+                interpreter.execute(f'untuk baris dalam bacaBaris("{tmp}/tidak_ada.txt")\n lapor baris\nakhir')
+                raise AssertionError("file hilang diterima")
+            except HambaError as e:
+                assert "Gagal membaca file" in str(e)
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_mapped_file():
+    """Test petakanFile gives indexed, sliced and searched access through mmap"""
+    print("Testing: Memory-Mapped Files...")
+    try:
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tabel.csv').replace('\\', '/')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write("kode,nama\nA1,Hambalang\nB2,Meikarta\r\nC3,Wisma\n")
+            
+            interpreter = HambaInterpreter()
+            interpreter.execute(f"""
+            peta = petakanFile("{path}")
+            ukuran = panjang(peta)
+            pertama = peta[0]
+            nama = potong(peta, 13, 22)
+            posisi = indeksDari(peta, "Wisma")
+            nomor = cariBaris(peta, "Meikarta")
+            baris = barisKe(peta, nomor)
+            tidakAda = cariBaris(peta, "A1", 2)
+            semua = []
+            untuk b dalam peta
+                tambahArray(semua, b)
+            akhir
+            """)
+            get = interpreter.runtime.get_variable
+            assert (get('ukuran'), get('pertama'), get('nama')) == (45, ord('k'), "Hambalang")
+            assert (get('posisi'), get('nomor'), get('baris'), get('tidakAda')) == (39, 2, "B2,Meikarta", -1)
+            assert get('semua') == ["kode,nama", "A1,Hambalang", "B2,Meikarta", "C3,Wisma"]
+            # Maps are closed at program end, or early with tutupFile
+            assert get('peta').closed and not interpreter.runtime.mapped_files
+            try:
+                interpreter.execute(f'p = petakanFile("{path}")\ntutupFile(p)\nx = panjang(p)')
+                raise AssertionError("peta tertutup masih dibaca")
+            except HambaError as e:
+                assert "sudah ditutup" in str(e)
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_csv_json_builtins():
+    """Test bacaCSV/tulisCSV, bacaJSON/tulisJSON and bacaJSONL"""
+    print("Testing: CSV & JSON Builtins...")
+    try:
+        import tempfile
+        from hamba_output import OutputSink
+        with tempfile.TemporaryDirectory() as tmp:
+            base = tmp.replace('\\', '/')
+            with open(f"{base}/data.jsonl", 'w', encoding='utf-8') as f:
+                f.write('{"nama": "Hambalang", "anggaran": 2500}\n\n{"nama": "Wisma", "anggaran": 50}\n')
+            
+            interpreter = HambaInterpreter(HambaRuntime(OutputSink(quiet=True)))
+            interpreter.execute(f"""
+            proyek = [{{"nama": "Hambalang", "anggaran": 2500, "selesai": salah}}, {{"nama": "Wisma, Atlet", "anggaran": 50, "selesai": benar}}]
+            n = tulisCSV("{base}/proyek.csv", proyek)
+            m = tulisCSV("{base}/mentah.csv", [["a", 1], ["b", 2]])
+            total = 0
+            nama = []
+            untuk baris dalam bacaCSV("{base}/proyek.csv")
+                total = total + angka(baris["anggaran"])
+                tambahArray(nama, baris["nama"])
+            akhir
+            mentah = []
+            untuk baris dalam bacaCSV("{base}/mentah.csv", salah)
+                tambahArray(mentah, baris)
+            akhir
+            x = tulisJSON("{base}/proyek.json", {{"proyek": proyek, "angka": angkaArray([1, 2])}})
+            dibaca = bacaJSON("{base}/proyek.json")
+            jsonl = 0
+            untuk objek dalam bacaJSONL("{base}/data.jsonl")
+                jsonl = jsonl + objek["anggaran"]
+            akhir
+            """)
+            get = interpreter.runtime.get_variable
+            assert (get('n'), get('m'), get('total')) == (2, 2, 2550)
+            assert get('nama') == ["Hambalang", "Wisma, Atlet"]
+            assert get('mentah') == [["a", "1"], ["b", "2"]]
+            with open(f"{base}/proyek.csv", encoding='utf-8') as f:
+                assert f.readline().strip() == "nama,anggaran,selesai"
+            assert get('dibaca')['proyek'] == get('proyek') and get('dibaca')['angka'] == [1.0, 2.0]
+            assert get('jsonl') == 2550
+            
+            with open(f"{base}/rusak.jsonl", 'w', encoding='utf-8') as f:
+                f.write('{"a": 1}\n{rusak\n')
+            try:
+                interpreter.execute(f'untuk o dalam bacaJSONL("{base}/rusak.jsonl")\n lapor o\nakhir')
+                raise AssertionError("JSON rusak diterima")
+            except HambaError as e:
+                assert "baris 2" in str(e)
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_file_handles():
+    """Test bukaFile handles buffer writes and close at program end or on error"""
+    print("Testing: Persistent File Handles...")
+    try:
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'log.txt').replace('\\', '/')
+            interpreter = HambaInterpreter()
+            interpreter.execute(f"""
+            f = bukaFile("{path}", "tulis")
+            untuk i dari 1 sampai 1000
+                tulisBaris(f, "baris " + teks(i))
+            akhir
+            tutupFile(f)
+            g = bukaFile("{path}", "tambah")
+            tulis(g, "selesai")
+            """)
+            handle = interpreter.runtime.get_variable('g')
+            assert handle.closed and not interpreter.runtime.open_files
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().split("\n")
+            assert len(lines) == 1001 and lines[0] == "baris 1" and lines[-1] == "selesai"
+            
+            try:
+                interpreter.execute(f'h = bukaFile("{path}", "tambah")\ntulis(h, "!")\nx = 1 / 0')
+                raise AssertionError("pembagian nol diterima")
+            except HambaError:
+                pass
+            assert interpreter.runtime.get_variable('h').closed
+            with open(path, encoding='utf-8') as f:
+                assert f.read().endswith("selesai!")
+            
+            for code in ('tulis(g, "lagi")', f'x = bukaFile("{path}", "baca")', 'tutupFile("bukan file")'):
+                try:
+                    interpreter.execute(code)
+                    raise AssertionError(f"diterima: {code}")
+                except HambaError:
+                    pass
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
+def test_http_sessions():
+    """Test httpGet/httpPost reuse one kept-alive connection per host"""
+    print("Testing: Pooled HTTP Sessions...")
+    try:
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from hamba_http import HAS_REQUESTS
+        from hamba_output import OutputSink
+        if not HAS_REQUESTS:
+            print("⏭️  SKIP: requests tidak terinstall\n")
+            return True
+        
+        clients = set()
+        headers = []
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+            
+            def _reply(self, body: bytes):
+                clients.add(self.client_address)
+                headers.append(self.headers.get('X-Proyek'))
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_GET(self):
+                self._reply(b'{"status": "mangkrak"}')
+            
+            def do_POST(self):
+                self._reply(self.rfile.read(int(self.headers['Content-Length'])))
+            
+            def log_message(self, *args):
+                pass
+        
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            interpreter = HambaInterpreter(HambaRuntime(OutputSink(quiet=True)))
+            interpreter.execute(f"""
+            aturHTTP({{"timeout": 5, "header": {{"X-Proyek": "Hambalang"}}, "ukuranPool": 2}})
+            untuk i dari 1 sampai 20
+                resp = httpGet("{url}/status")
+            akhir
+            kirim = httpPost("{url}/lapor", {{"anggaran": 500}})
+            """)
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        get = interpreter.runtime.get_variable
+        assert get('resp')['json'] == {"status": "mangkrak"}
+        assert get('kirim')['json'] == {"anggaran": 500}
+        assert len(headers) == 21 and set(headers) == {"Hambalang"}
+        assert len(clients) == 1, f"{len(clients)} koneksi"
+        print("✅ PASS\n")
+        return True
+    except Exception as e:
+        print(f"❌ FAIL: {e}\n")
+        return False
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 50)
@@ -212,6 +1541,35 @@ def run_all_tests():
         test_conditionals,
         test_loops,
         test_satire_functions,
+        test_ast_parser,
+        test_nested_blocks_in_function,
+        test_expression_cache,
+        test_operator_precedence,
+        test_block_index,
+        test_elif_short_circuit,
+        test_lexer_positions,
+        test_shared_lexer_front_ends,
+        test_call_frames,
+        test_slot_resolution,
+        test_deep_recursion,
+        test_integer_arithmetic,
+        test_output_sink,
+        test_dispatch_tables,
+        test_execution_budget,
+        test_constant_folding,
+        test_memoization,
+        test_bulk_builtins,
+        test_numeric_arrays,
+        test_string_building,
+        test_db_pool,
+        test_db_batch,
+        test_db_stream,
+        test_db_transactions,
+        test_streaming_file_readers,
+        test_mapped_file,
+        test_csv_json_builtins,
+        test_file_handles,
+        test_http_sessions,
     ]
     
     results = []
@@ -7,12 +7,14 @@ import time
 import random
 from typing import Any, List, Dict
 from compiler.bytecode import *
+from interpreter.hamba_budget import Budget
 
 
 class HambaVM:
     """Stack-based VM with satirical bureaucratic execution"""
     
-    def __init__(self, bytecode: Bytecode, seed: int = None, step_limit: int = 100000, debug: bool = False):
+    def __init__(self, bytecode: Bytecode, seed: int = None, step_limit: int = 100000, debug: bool = False,
+                 budget: Budget = None):
         self.bytecode = bytecode
         self.code = bytecode.code
         self.constants = bytecode.constants
@@ -24,6 +26,8 @@ class HambaVM:
         self.pc = 0  # Program counter
         self.step_count = 0
         self.step_limit = step_limit
+        # One unit of fuel per instruction; an explicit budget replaces step_limit
+        self.budget = budget or Budget(fuel=step_limit)
         self.debug = debug
         
         # Satirical state
@@ -49,11 +53,11 @@ class HambaVM:
     def run(self, delay: float = 0.0, ctf_mode: bool = False) -> bool:
         """Execute bytecode"""
         try:
-            while self.pc < len(self.code) and self.step_count < self.step_limit:
+            self.budget.start()
+            while self.pc < len(self.code):
                 self.step_count += 1
                 
-                if self.step_count > self.step_limit:
-                    raise Exception(f"❌ Eksekusi melebihi batas {self.step_limit} langkah (proyek diaudit KPK)")
+                self.budget.charge()
                 
                 opcode = self.code[self.pc]
                 
@@ -79,6 +83,8 @@ class HambaVM:
         except Exception as e:
             print(f"❌ RUNTIME ERROR: {e}")
             return False
+        finally:
+            self.budget.stop()
     
     def _execute_instruction(self, opcode: int) -> bool:
         """Execute single instruction"""
@@ -269,11 +275,12 @@ class HambaVM:
 
 
 def run_bytecode_file(filepath: str, debug: bool = False, seed: int = None, 
-                      ctf_mode: bool = False, step_limit: int = 100000, delay: float = 0.0):
+                      ctf_mode: bool = False, step_limit: int = 100000, delay: float = 0.0,
+                      budget: Budget = None):
     """Load and execute .hbc bytecode file"""
     try:
         bytecode = Bytecode.load(filepath)
-        vm = HambaVM(bytecode, seed=seed, step_limit=step_limit, debug=debug)
+        vm = HambaVM(bytecode, seed=seed, step_limit=step_limit, debug=debug, budget=budget)
         
         print(f"🚀 HambaVM v3.0 - Menjalankan {filepath}")
         if ctf_mode:
@@ -6,6 +6,7 @@ import time
 import random
 from typing import Any, List, Dict
 from compiler.bytecode import *
+from interpreter.hamba_budget import Budget
 from vm.anti_debug import ExecutionShield
 from obfuscator.opcode_map import OpcodeMapper
 from obfuscator.self_modify import RuntimeMutator
@@ -15,7 +16,8 @@ class ObfuscatedVM:
     """VM with obfuscation, anti-debug, and self-modification"""
     
     def __init__(self, bytecode, seed: int = None, step_limit: int = 100000, 
-                 debug: bool = False, paranoia: int = 1, obfuscated: bool = False):
+                 debug: bool = False, paranoia: int = 1, obfuscated: bool = False,
+                 budget: Budget = None):
         self.bytecode = bytecode
         self.code = bytearray(bytecode.code)
         self.constants = bytecode.constants
@@ -26,6 +28,8 @@ class ObfuscatedVM:
         self.pc = 0
         self.step_count = 0
         self.step_limit = step_limit
+        # One unit of fuel per instruction; an explicit budget replaces step_limit
+        self.budget = budget or Budget(fuel=step_limit)
         self.debug = debug
         
         self.anggaran = 100
@@ -57,11 +61,11 @@ class ObfuscatedVM:
             from ctf.hell_mode import HellModeCTF
             hell_ctf = HellModeCTF(self.rng.randint(0, 999999)) if hell_mode else None
             
-            while self.pc < len(self.code) and self.step_count < self.step_limit:
+            self.budget.start()
+            while self.pc < len(self.code):
                 self.step_count += 1
                 
-                if self.step_count > self.step_limit:
-                    raise Exception(f"Execution limit reached: {self.step_limit}")
+                self.budget.charge()
                 
                 if not self.shield.should_execute_normally():
                     print("🚨 Abnormal execution environment detected")
@@ -108,6 +112,8 @@ class ObfuscatedVM:
         except Exception as e:
             print(f"❌ RUNTIME ERROR: {e}")
             return False
+        finally:
+            self.budget.stop()
     
     def _deobfuscate_opcode(self, opcode: int) -> int:
         """Deobfuscate opcode if obfuscation enabled"""